@@ -1,6 +1,7 @@
 import '../models/surah.dart';
 import '../models/juz.dart';
 import '../models/page.dart';
+import 'quran_page_tables.dart';
 
 class QuranData {
   // Total pages in Quran
@@ -40,30 +41,30 @@ class QuranData {
     Juz(number: 30, startPage: 582, endPage: 604, surahNumbers: [30]),
   ];
 
-  // Surah information (simplified - you can expand this)
-  static final List<Surah> surahList = [
-    Surah(number: 1, name: 'Al-Fatiha', arabicName: 'الفاتحة', ayahCount: 7, startPage: 1, endPage: 1),
-    Surah(number: 2, name: 'Al-Baqarah', arabicName: 'البقرة', ayahCount: 286, startPage: 2, endPage: 49),
-    Surah(number: 3, name: 'Ali Imran', arabicName: 'آل عمران', ayahCount: 200, startPage: 50, endPage: 76),
-    // Add more surahs as needed - this is a simplified version
-    // For a full implementation, you'd include all 114 surahs
-  ];
+  // Surah information, built from the generated tables
+  // (regenerate with scripts/generate_quran_data.py)
+  static final List<Surah> surahList = List.generate(
+    QuranPageTables.surahAyahCounts.length,
+    (i) => Surah(
+      number: i + 1,
+      name: QuranPageTables.surahNames[i],
+      arabicName: QuranPageTables.surahArabicNames[i],
+      ayahCount: QuranPageTables.surahAyahCounts[i],
+      startPage: QuranPageTables.surahStartPages[i],
+      endPage: QuranPageTables.surahEndPages[i],
+    ),
+  );
 
-  // Get juz for a page
+  // Get juz for a page (constant-time table lookup)
   static Juz? getJuzForPage(int pageNumber) {
-    return juzList.firstWhere(
-      (juz) => pageNumber >= juz.startPage && pageNumber <= juz.endPage,
-      orElse: () => juzList.first,
-    );
+    if (pageNumber < 1 || pageNumber > totalPages) return juzList.first;
+    return juzList[QuranPageTables.pageJuz[pageNumber] - 1];
   }
 
-  // Get surahs for a page
+  // Get surahs that appear on a page (constant-time table lookup)
   static List<int> getSurahsForPage(int pageNumber) {
-    final juz = getJuzForPage(pageNumber);
-    if (juz == null) return [];
-    
-    // Simplified logic - in a real app, you'd have precise page-to-surah mapping
-    return juz.surahNumbers;
+    if (pageNumber < 1 || pageNumber > totalPages) return [];
+    return QuranPageTables.pageSurahs[pageNumber];
   }
 
   // Create all pages for a Hatim
@@ -72,8 +73,8 @@ class QuranData {
     for (int i = 1; i <= totalPages; i++) {
       pages.add(Page(
         pageNumber: i,
-        juzNumber: getJuzForPage(i)?.number ?? 1,
-        surahNumbers: getSurahsForPage(i),
+        juzNumber: QuranPageTables.pageJuz[i],
+        surahNumbers: QuranPageTables.pageSurahs[i],
       ));
     }
     return pages;
@@ -0,0 +1,146 @@
+// GENERATED by scripts/generate_quran_data.py - do not edit by hand.
+// Lists indexed by page number have an unused entry at index 0.
+// Lists indexed by surah number start at surah 1 (index 0).
+
+class QuranPageTables {
+  // Juz number for each page (page -> juz)
+  static const List<int> pageJuz = [
+    0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2,
+    2, 2, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3,
+    3, 3, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4,
+    4, 4, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5,
+    5, 5, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6,
+    6, 6, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7,
+    7, 7, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9,
+    9, 9, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10,
+    10, 10, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11,
+    11, 11, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12,
+    12, 12, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13,
+    13, 13, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14,
+    14, 14, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15,
+    15, 15, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16,
+    16, 16, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17,
+    17, 17, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18,
+    18, 18, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19,
+    19, 19, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20,
+    20, 20, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21,
+    21, 21, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22,
+    22, 22, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23,
+    23, 23, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24,
+    24, 24, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25,
+    25, 25, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26,
+    26, 26, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27,
+    27, 27, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28,
+    28, 28, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29,
+    29, 29, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30,
+    30, 30, 30, 30, 30,
+  ];
+
+  // Surah numbers that appear on each page (page -> surahs)
+  static const List<List<int>> pageSurahs = [
+    [], [1], [2], [2], [2], [2], [2], [2], [2], [2], [2], [2], [2], [2], [2], [2], [2], [2], [2], [2],
+    [2], [2], [2], [2], [2], [2], [2], [2], [2], [2], [2], [2], [2], [2], [2], [2], [2], [2], [2], [2],
+    [2], [2], [2], [2], [2], [2], [2], [2], [2], [2], [3], [3], [3], [3], [3], [3], [3], [3], [3], [3],
+    [3], [3], [3], [3], [3], [3], [3], [3], [3], [3], [3], [3], [3], [3], [3], [3], [3], [4], [4], [4],
+    [4], [4], [4], [4], [4], [4], [4], [4], [4], [4], [4], [4], [4], [4], [4], [4], [4], [4], [4], [4],
+    [4], [4], [4], [4], [4], [4], [4, 5], [5], [5], [5], [5], [5], [5], [5], [5], [5], [5], [5], [5], [5],
+    [5], [5], [5], [5], [5], [5], [5], [5], [6], [6], [6], [6], [6], [6], [6], [6], [6], [6], [6], [6],
+    [6], [6], [6], [6], [6], [6], [6], [6], [6], [6], [6], [7], [7], [7], [7], [7], [7], [7], [7], [7],
+    [7], [7], [7], [7], [7], [7], [7], [7], [7], [7], [7], [7], [7], [7], [7], [7], [7], [8], [8], [8],
+    [8], [8], [8], [8], [8], [8], [8], [9], [9], [9], [9], [9], [9], [9], [9], [9], [9], [9], [9], [9],
+    [9], [9], [9], [9], [9], [9], [9], [9], [10], [10], [10], [10], [10], [10], [10], [10], [10], [10], [10], [10],
+    [10], [10, 11], [11], [11], [11], [11], [11], [11], [11], [11], [11], [11], [11], [11], [11], [11, 12], [12], [12], [12], [12],
+    [12], [12], [12], [12], [12], [12], [12], [12], [12], [13], [13], [13], [13], [13], [13], [13, 14], [14], [14], [14], [14],
+    [14], [14], [15], [15], [15], [15], [15], [15, 16], [16], [16], [16], [16], [16], [16], [16], [16], [16], [16], [16], [16],
+    [16], [16], [17], [17], [17], [17], [17], [17], [17], [17], [17], [17], [17], [17, 18], [18], [18], [18], [18], [18], [18],
+    [18], [18], [18], [18], [18], [19], [19], [19], [19], [19], [19], [19], [19, 20], [20], [20], [20], [20], [20], [20], [20],
+    [20], [20], [21], [21], [21], [21], [21], [21], [21], [21], [21], [21], [22], [22], [22], [22], [22], [22], [22], [22],
+    [22], [22], [23], [23], [23], [23], [23], [23], [23], [23], [24], [24], [24], [24], [24], [24], [24], [24], [24], [24, 25],
+    [25], [25], [25], [25], [25], [25], [25], [26], [26], [26], [26], [26], [26], [26], [26], [26], [26], [27], [27], [27],
+    [27], [27], [27], [27], [27], [27, 28], [28], [28], [28], [28], [28], [28], [28], [28], [28], [28], [28, 29], [29], [29], [29],
+    [29], [29], [29], [29], [29, 30], [30], [30], [30], [30], [30], [30], [31], [31], [31], [31], [32], [32], [32], [33], [33],
+    [33], [33], [33], [33], [33], [33], [33], [33], [34], [34], [34], [34], [34], [34], [34, 35], [35], [35], [35], [35], [35],
+    [35, 36], [36], [36], [36], [36], [36], [37], [37], [37], [37], [37], [37], [37], [38], [38], [38], [38], [38], [38, 39], [39],
+    [39], [39], [39], [39], [39], [39], [39], [39, 40], [40], [40], [40], [40], [40], [40], [40], [40], [40], [41], [41], [41],
+    [41], [41], [41], [42], [42], [42], [42], [42], [42], [42, 43], [43], [43], [43], [43], [43], [43], [44], [44], [44], [45],
+    [45], [45], [45, 46], [46], [46], [46], [46], [47], [47], [47], [47], [48], [48], [48], [48], [48, 49], [49], [49], [50], [50],
+    [50, 51], [51], [51], [51, 52], [52], [52], [53], [53], [53, 54], [54], [54], [54, 55], [55], [55], [55, 56], [56], [56], [56, 57], [57], [57],
+    [57], [57], [58], [58], [58], [58, 59], [59], [59], [59], [60], [60], [60, 61], [61], [62], [62, 63], [63], [64], [64], [65], [65],
+    [66], [66], [67], [67], [67, 68], [68], [68, 69], [69], [69, 70], [70], [70, 71], [71], [72], [72], [73], [73, 74], [74], [74, 75], [75, 76], [76],
+    [76, 77], [77], [78], [78, 79], [79], [80], [81], [82, 83], [83], [83, 84], [85], [86, 87], [87, 88], [89], [89, 90], [91, 92], [92, 93, 94], [95, 96], [97, 98], [98, 99, 100],
+    [100, 101, 102], [103, 104, 105], [106, 107, 108], [109, 110, 111], [112, 113, 114],
+  ];
+
+  static const List<int> surahAyahCounts = [
+    7, 286, 200, 176, 120, 165, 206, 75, 129, 109, 123, 111, 43, 52, 99, 128, 111, 110, 98, 135,
+    112, 78, 118, 64, 77, 227, 93, 88, 69, 60, 34, 30, 73, 54, 45, 83, 182, 88, 75, 85,
+    54, 53, 89, 59, 37, 35, 38, 29, 18, 45, 60, 49, 62, 55, 78, 96, 29, 22, 24, 13,
+    14, 11, 11, 18, 12, 12, 30, 52, 52, 44, 28, 28, 20, 56, 40, 31, 50, 40, 46, 42,
+    29, 19, 36, 25, 22, 17, 19, 26, 30, 20, 15, 21, 11, 8, 8, 19, 5, 8, 8, 11,
+    11, 8, 3, 9, 5, 4, 7, 3, 6, 3, 5, 4, 5, 6,
+  ];
+
+  static const List<int> surahStartPages = [
+    1, 2, 50, 77, 106, 128, 151, 177, 187, 208, 221, 235, 249, 255, 262, 267, 282, 293, 305, 312,
+    322, 332, 342, 350, 359, 367, 377, 385, 396, 404, 411, 415, 418, 428, 434, 440, 446, 453, 458, 467,
+    477, 483, 489, 496, 499, 502, 507, 511, 515, 518, 520, 523, 526, 528, 531, 534, 537, 542, 545, 549,
+    551, 553, 554, 556, 558, 560, 562, 564, 566, 568, 570, 572, 574, 575, 577, 578, 580, 582, 583, 585,
+    586, 587, 587, 589, 590, 591, 591, 592, 593, 594, 595, 595, 596, 596, 597, 597, 598, 598, 599, 599,
+    600, 600, 601, 601, 601, 602, 602, 602, 603, 603, 603, 604, 604, 604,
+  ];
+
+  static const List<int> surahEndPages = [
+    1, 49, 76, 106, 127, 150, 176, 186, 207, 221, 235, 248, 255, 261, 267, 281, 293, 304, 312, 321,
+    331, 341, 349, 359, 366, 376, 385, 396, 404, 410, 414, 417, 427, 434, 440, 445, 452, 458, 467, 476,
+    482, 489, 495, 498, 502, 506, 510, 515, 517, 520, 523, 525, 528, 531, 534, 537, 541, 545, 548, 551,
+    552, 554, 555, 557, 559, 561, 564, 566, 568, 570, 571, 573, 575, 577, 578, 580, 581, 583, 584, 585,
+    586, 587, 589, 589, 590, 591, 592, 592, 594, 594, 595, 596, 596, 596, 597, 597, 598, 599, 599, 600,
+    600, 600, 601, 601, 601, 602, 602, 602, 603, 603, 603, 604, 604, 604,
+  ];
+
+  static const List<String> surahNames = [
+    'Al-Fatiha', 'Al-Baqarah', 'Ali Imran', 'An-Nisa', 'Al-Ma\'idah', 'Al-An\'am',
+    'Al-A\'raf', 'Al-Anfal', 'At-Tawbah', 'Yunus', 'Hud', 'Yusuf',
+    'Ar-Ra\'d', 'Ibrahim', 'Al-Hijr', 'An-Nahl', 'Al-Isra', 'Al-Kahf',
+    'Maryam', 'Taha', 'Al-Anbya', 'Al-Hajj', 'Al-Mu\'minun', 'An-Nur',
+    'Al-Furqan', 'Ash-Shu\'ara', 'An-Naml', 'Al-Qasas', 'Al-\'Ankabut', 'Ar-Rum',
+    'Luqman', 'As-Sajdah', 'Al-Ahzab', 'Saba', 'Fatir', 'Ya-Sin',
+    'As-Saffat', 'Sad', 'Az-Zumar', 'Ghafir', 'Fussilat', 'Ash-Shuraa',
+    'Az-Zukhruf', 'Ad-Dukhan', 'Al-Jathiyah', 'Al-Ahqaf', 'Muhammad', 'Al-Fath',
+    'Al-Hujurat', 'Qaf', 'Adh-Dhariyat', 'At-Tur', 'An-Najm', 'Al-Qamar',
+    'Ar-Rahman', 'Al-Waqi\'ah', 'Al-Hadid', 'Al-Mujadila', 'Al-Hashr', 'Al-Mumtahanah',
+    'As-Saf', 'Al-Jumu\'ah', 'Al-Munafiqun', 'At-Taghabun', 'At-Talaq', 'At-Tahrim',
+    'Al-Mulk', 'Al-Qalam', 'Al-Haqqah', 'Al-Ma\'arij', 'Nuh', 'Al-Jinn',
+    'Al-Muzzammil', 'Al-Muddaththir', 'Al-Qiyamah', 'Al-Insan', 'Al-Mursalat', 'An-Naba',
+    'An-Nazi\'at', '\'Abasa', 'At-Takwir', 'Al-Infitar', 'Al-Mutaffifin', 'Al-Inshiqaq',
+    'Al-Buruj', 'At-Tariq', 'Al-A\'la', 'Al-Ghashiyah', 'Al-Fajr', 'Al-Balad',
+    'Ash-Shams', 'Al-Layl', 'Ad-Duhaa', 'Ash-Sharh', 'At-Tin', 'Al-\'Alaq',
+    'Al-Qadr', 'Al-Bayyinah', 'Az-Zalzalah', 'Al-\'Adiyat', 'Al-Qari\'ah', 'At-Takathur',
+    'Al-\'Asr', 'Al-Humazah', 'Al-Fil', 'Quraysh', 'Al-Ma\'un', 'Al-Kawthar',
+    'Al-Kafirun', 'An-Nasr', 'Al-Masad', 'Al-Ikhlas', 'Al-Falaq', 'An-Nas',
+  ];
+
+  static const List<String> surahArabicNames = [
+    'الفاتحة', 'البقرة', 'آل عمران', 'النساء', 'المائدة', 'الأنعام',
+    'الأعراف', 'الأنفال', 'التوبة', 'يونس', 'هود', 'يوسف',
+    'الرعد', 'إبراهيم', 'الحجر', 'النحل', 'الإسراء', 'الكهف',
+    'مريم', 'طه', 'الأنبياء', 'الحج', 'المؤمنون', 'النور',
+    'الفرقان', 'الشعراء', 'النمل', 'القصص', 'العنكبوت', 'الروم',
+    'لقمان', 'السجدة', 'الأحزاب', 'سبأ', 'فاطر', 'يس',
+    'الصافات', 'ص', 'الزمر', 'غافر', 'فصلت', 'الشورى',
+    'الزخرف', 'الدخان', 'الجاثية', 'الأحقاف', 'محمد', 'الفتح',
+    'الحجرات', 'ق', 'الذاريات', 'الطور', 'النجم', 'القمر',
+    'الرحمن', 'الواقعة', 'الحديد', 'المجادلة', 'الحشر', 'الممتحنة',
+    'الصف', 'الجمعة', 'المنافقون', 'التغابن', 'الطلاق', 'التحريم',
+    'الملك', 'القلم', 'الحاقة', 'المعارج', 'نوح', 'الجن',
+    'المزمل', 'المدثر', 'القيامة', 'الإنسان', 'المرسلات', 'النبأ',
+    'النازعات', 'عبس', 'التكوير', 'الانفطار', 'المطففين', 'الانشقاق',
+    'البروج', 'الطارق', 'الأعلى', 'الغاشية', 'الفجر', 'البلد',
+    'الشمس', 'الليل', 'الضحى', 'الشرح', 'التين', 'العلق',
+    'القدر', 'البينة', 'الزلزلة', 'العاديات', 'القارعة', 'التكاثر',
+    'العصر', 'الهمزة', 'الفيل', 'قريش', 'الماعون', 'الكوثر',
+    'الكافرون', 'النصر', 'المسد', 'الإخلاص', 'الفلق', 'الناس',
+  ];
+}
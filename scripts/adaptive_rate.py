@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Adaptive (AIMD) concurrency control per upstream host
+Each host gets a window of requests allowed in flight at once, like a TCP
+congestion window. Healthy responses widen it additively, by one per
+window's worth of responses (about one per round trip). A 429 or 503 halves
+it, and a Retry-After holds back every new request to that host until the
+server says to come back.
+Because the window bounds requests in flight rather than booking start times,
+throughput follows the server's latency and grows with --workers instead of
+being fixed by a requests-per-second figure chosen in advance.
+quran_http runs all upstream requests through these limiters, so the scripts
+no longer need fixed sleeps between requests.
+"""
+
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+INITIAL_WINDOW = 4.0  # requests in flight before any feedback
+MIN_WINDOW = 1.0
+DECREASE = 0.5  # window multiplier on 429/503
+CUT_INTERVAL = 1.0  # seconds; responses to the same burst report one congestion event
+THROTTLE_STATUSES = {429, 503}
+
+
+def parse_retry_after(value):
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class AdaptiveRateLimiter:
+    """Caps the requests in flight to one host at a window adapted to upstream feedback"""
+
+    def __init__(self, initial_window=INITIAL_WINDOW, min_window=MIN_WINDOW, max_window=None,
+                 decrease=DECREASE):
+        self.window = initial_window
+        self.min_window = min_window
+        self.max_window = max_window
+        self.decrease = decrease
+        self.in_flight = 0
+        self.throttled = 0
+        self._ready = threading.Condition()
+        self._paused_until = 0.0
+        self._last_cut = float("-inf")
+
+    def acquire(self):
+        """Block until the window has room (and no Retry-After pause is running)"""
+        with self._ready:
+            while True:
+                delay = self._paused_until - time.monotonic()
+                if delay > 0:
+                    self._ready.wait(delay)
+                elif self.in_flight >= int(self.window):
+                    self._ready.wait()
+                else:
+                    self.in_flight += 1
+                    return
+
+    def release(self, status=None, retry_after=None):
+        """
+        Free the caller's slot and feed back its response status (None when the
+        request failed without one) and Retry-After header
+        """
+        with self._ready:
+            self.in_flight -= 1
+            if status in THROTTLE_STATUSES:
+                self._throttle(parse_retry_after(retry_after))
+            elif status is not None and status < 500:
+                self._grow()
+            self._ready.notify_all()
+
+    def _grow(self):
+        self.window += 1.0 / self.window  # +1 per window's worth of responses
+        if self.max_window:
+            self.window = min(self.window, self.max_window)
+
+    def _throttle(self, retry_after):
+        now = time.monotonic()
+        self.throttled += 1
+        if retry_after:
+            self._paused_until = max(self._paused_until, now + retry_after)
+        # Requests already in flight will report the same congestion; cut once per interval
+        if now - self._last_cut < CUT_INTERVAL:
+            return
+        self._last_cut = now
+        self.window = max(self.min_window, self.window * self.decrease)
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Arabic text normalization and search-ready verse variants
+
+canonical_text() is applied to every page as it streams out of a download:
+it drops the BOM and other invisible format characters some sources prepend
+and trims whitespace, without touching letters or marks.
+
+quran_normalized.json holds, per verse in mushaf order (the same order as
+quran_corpus.json), precomputed variants of the canonical text:
+    no_tashkeel     harakat, shadda, sukun, superscript alef and the small
+                    Quranic annotation marks removed
+    alef_folded     alef wasla / hamza / madda forms folded to a bare alef
+    no_tatweel      tatweel (kashida) removed
+    search          all of the above, whitespace collapsed - the form search
+                    indexes and comparisons should use (see search_form())
+
+Variants are computed on a process pool, one chunk of verses per task.
+
+Usage:
+    python scripts/arabic_normalize.py                      # build from assets/quran/quran_text.json
+    python scripts/arabic_normalize.py --query "ٱلنَّاسِ"     # print the search form of a query
+"""
+
+import argparse
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from asset_manifest import write_if_changed
+
+NORMALIZED_VERSION = 1
+VARIANTS = ("no_tashkeel", "alef_folded", "no_tatweel", "search")
+CHUNK_SIZE = 512  # verses per pool task
+
+# Zero-width and BOM characters that carry no text
+_INVISIBLE = re.compile("[\u200b-\u200f\u202a-\u202e\u2060-\u2064\ufeff]")
+# Combining marks: Quranic annotation signs, harakat/tanwin/shadda/sukun,
+# superscript alef, small high/low letters and stop marks
+_TASHKEEL = re.compile("[\u0610-\u061a\u064b-\u065f\u0670\u06d6-\u06dc\u06df-\u06e8\u06ea-\u06ed\u08d3-\u08ff]+")
+# Verse-level symbols that are not part of any word (end of ayah, rub el hizb, sajdah)
+_SYMBOLS = re.compile("[\u06dd\u06de\u06e9]")
+_TATWEEL = "\u0640"
+# alef wasla, alef with madda, alef with hamza above / below
+_ALEF_FORMS = ("\u0671", "\u0622", "\u0623", "\u0625")
+_ALEF = "\u0627"
+_SPACES = re.compile(r"\s+")
+
+
+def canonical_text(text):
+    """The text as it should be stored: invisible characters dropped, ends trimmed"""
+    return _INVISIBLE.sub("", text).strip()
+
+
+def canonical_page(page_text, separator="\n\n"):
+    """canonical_text() applied to each verse of a page"""
+    return separator.join(canonical_text(verse) for verse in page_text.split(separator))
+
+
+def strip_tashkeel(text):
+    return _TASHKEEL.sub("", text)
+
+
+def fold_alef(text):
+    # str.replace per form is several times faster than translate() on non-ASCII text
+    for form in _ALEF_FORMS:
+        text = text.replace(form, _ALEF)
+    return text
+
+
+def remove_tatweel(text):
+    return text.replace(_TATWEEL, "")
+
+
+def search_form(text):
+    """The fully normalized form; use it for queries as well as for indexed text"""
+    return _search_from_stripped(strip_tashkeel(canonical_text(text)))
+
+
+def _search_from_stripped(stripped):
+    text = remove_tatweel(fold_alef(_SYMBOLS.sub(" ", stripped)))
+    return _SPACES.sub(" ", text).strip()
+
+
+def verse_variants(text):
+    """{variant: text} for one verse"""
+    text = canonical_text(text)
+    stripped = strip_tashkeel(text)
+    return {
+        "no_tashkeel": stripped,
+        "alef_folded": fold_alef(text),
+        "no_tatweel": remove_tatweel(text),
+        "search": _search_from_stripped(stripped),
+    }
+
+
+def _variants_chunk(texts):
+    return [verse_variants(text) for text in texts]
+
+
+def normalize_verses(texts, workers=None):
+    """
+    verse_variants() for every text, in order, spread over `workers` processes
+    (default: one per CPU; 1 runs in this process)
+    """
+    texts = list(texts)
+    workers = workers or os.cpu_count() or 1
+    chunks = [texts[start:start + CHUNK_SIZE] for start in range(0, len(texts), CHUNK_SIZE)]
+    if workers == 1 or len(chunks) <= 1:
+        return _variants_chunk(texts)
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+        return [variants for chunk in pool.map(_variants_chunk, chunks) for variants in chunk]
+
+
+def build_normalized(texts, workers=None):
+    """Columnar dict {variant: [text per verse]} for quran_normalized.json"""
+    variants = normalize_verses(texts, workers)
+    normalized = {"version": NORMALIZED_VERSION, "verse_count": len(variants)}
+    for name in VARIANTS:
+        normalized[name] = [verse[name] for verse in variants]
+    return normalized
+
+
+def write_normalized(normalized, path):
+    path = Path(path)
+    data = json.dumps(normalized, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    write_if_changed(path, data)
+    return len(data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build search-ready verse variants from quran_text.json")
+    parser.add_argument("--input", default="assets/quran/quran_text.json")
+    parser.add_argument("--output", default="assets/quran/quran_normalized.json")
+    parser.add_argument("--workers", type=int, help="processes (default: one per CPU)")
+    parser.add_argument("--query", help="only print the search form of this text")
+    args = parser.parse_args()
+
+    if args.query:
+        print(search_form(args.query))
+        return
+
+    from verse_corpus import verses_from_page_text
+
+    with open(args.input, encoding="utf-8") as f:
+        quran_text = json.load(f)
+    texts = [text for _, _, _, text in verses_from_page_text(quran_text)]
+
+    started = time.perf_counter()
+    normalized = build_normalized(texts, args.workers)
+    elapsed = (time.perf_counter() - started) * 1000
+    size = write_normalized(normalized, args.output)
+    print(f"[OK] {args.output}: {normalized['verse_count']} verses x {len(VARIANTS)} variants, "
+          f"{size / 1024:.1f} KB in {elapsed:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
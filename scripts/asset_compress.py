@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Minified and precompressed variants of quran_text.json for web delivery
+Writes quran_text.min.json plus .gz and .br siblings so the server can hand
+out the smallest encoding without compressing at request time
+
+Brotli output needs the optional `brotli` package (pip install brotli)
+
+Usage:
+    python scripts/asset_compress.py
+"""
+
+import argparse
+import gzip
+import json
+from pathlib import Path
+
+from asset_manifest import write_if_changed
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def minify(quran_text):
+    """Canonical compact encoding: sorted by page number, no whitespace"""
+    ordered = {key: quran_text[key] for key in sorted(quran_text, key=int)}
+    return json.dumps(ordered, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def write_compressed_variants(quran_text, output_dir, name="quran_text"):
+    """
+    Write <name>.min.json, <name>.min.json.gz and (if available) <name>.min.json.br.
+    Returns [(path, size)] with the minified file first.
+    """
+    output_dir = Path(output_dir)
+    data = minify(quran_text)
+
+    min_path = output_dir / f"{name}.min.json"
+    write_if_changed(min_path, data)
+    results = [(min_path, len(data))]
+
+    # mtime=0 keeps the .gz byte-identical across rebuilds of the same text
+    gz_data = gzip.compress(data, compresslevel=9, mtime=0)
+    gz_path = output_dir / f"{name}.min.json.gz"
+    write_if_changed(gz_path, gz_data)
+    results.append((gz_path, len(gz_data)))
+
+    br_path = output_dir / f"{name}.min.json.br"
+    if brotli is not None:
+        br_data = brotli.compress(data, mode=brotli.MODE_TEXT, quality=11)
+        write_if_changed(br_path, br_data)
+        results.append((br_path, len(br_data)))
+    elif br_path.exists():
+        br_path.unlink()  # don't leave a .br that no longer matches the text
+
+    return results
+
+
+def print_size_report(results, original_size=None):
+    """Size and ratio of each variant against the original (indented) JSON"""
+    baseline = original_size or results[0][1]
+    print(f"   {'variant':<28} {'size':>10} {'ratio':>7}")
+    if original_size:
+        print(f"   {'quran_text.json':<28} {original_size / 1024:>7.1f} KB {1:>7.1%}")
+    for path, size in results:
+        print(f"   {path.name:<28} {size / 1024:>7.1f} KB {size / baseline:>7.1%}")
+    if brotli is None:
+        print("   (install `brotli` to also emit .br)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write minified + gzip/brotli copies of quran_text.json")
+    parser.add_argument("--input", default="assets/quran/quran_text.json")
+    args = parser.parse_args()
+
+    input_path = Path(args.input)
+    with open(input_path, encoding="utf-8") as f:
+        quran_text = json.load(f)
+
+    results = write_compressed_variants(quran_text, input_path.parent)
+    print("[OK] Web variants written")
+    print_size_report(results, input_path.stat().st_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Content-hash manifest for assets/quran and change-only writes
+quran_manifest.json records a SHA-256 per page, for quran_text.json as a
+whole and for every derived file. Rebuilds compare against it, rewrite only
+files whose bytes changed (so mtimes and client caches survive a no-op run)
+and report exactly which pages differ.
+
+Usage:
+    python scripts/asset_manifest.py            # report pages that differ from the manifest
+    python scripts/asset_manifest.py --check    # same, exit 1 if anything differs (CI)
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+MANIFEST_NAME = "quran_manifest.json"
+MANIFEST_VERSION = 1
+
+
+def sha256_hex(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def encode_asset(quran_text):
+    """quran_text.json bytes: pages in numeric order, indented like the checked-in asset"""
+    ordered = {key: quran_text[key] for key in sorted(quran_text, key=int)}
+    return json.dumps(ordered, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def page_hashes(quran_text):
+    return {key: sha256_hex(quran_text[key].encode("utf-8")) for key in sorted(quran_text, key=int)}
+
+
+def write_if_changed(path, data):
+    """
+    Atomically write bytes to path unless it already holds exactly those bytes.
+    Returns True if the file was (re)written.
+    """
+    path = Path(path)
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+    return True
+
+
+def load_manifest(output_dir):
+    path = Path(output_dir) / MANIFEST_NAME
+    try:
+        with open(path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+    return manifest if manifest.get("version") == MANIFEST_VERSION else None
+
+
+def diff_pages(old_hashes, new_hashes):
+    """(changed, added, removed) page numbers, each sorted"""
+    changed = [key for key in new_hashes if key in old_hashes and old_hashes[key] != new_hashes[key]]
+    added = [key for key in new_hashes if key not in old_hashes]
+    removed = [key for key in old_hashes if key not in new_hashes]
+    return tuple(sorted(map(int, keys)) for keys in (changed, added, removed))
+
+
+def build_manifest(asset_data, hashes, output_dir, files, asset_name="quran_text.json", edition=None):
+    """
+    Manifest dict; `files` are derived output paths hashed relative to output_dir,
+    `edition` the text edition (quran_meta EDITION_*) the pages were fetched in
+    """
+    output_dir = Path(output_dir)
+    return {
+        "version": MANIFEST_VERSION,
+        "edition": edition,
+        "asset": {
+            "file": asset_name,
+            "sha256": sha256_hex(asset_data),
+            "bytes": len(asset_data),
+        },
+        "pages": hashes,
+        "files": {
+            Path(path).relative_to(output_dir).as_posix(): sha256_hex(Path(path).read_bytes())
+            for path in sorted(files)
+        },
+    }
+
+
+def write_manifest(manifest, output_dir):
+    data = json.dumps(manifest, ensure_ascii=False, indent=2).encode("utf-8")
+    return write_if_changed(Path(output_dir) / MANIFEST_NAME, data)
+
+
+def _format_pages(pages, limit=20):
+    shown = ", ".join(map(str, pages[:limit]))
+    return shown + (f", ... (+{len(pages) - limit})" if len(pages) > limit else "")
+
+
+def print_page_diff(changed, added, removed, had_manifest=True):
+    if not had_manifest:
+        print("   Manifest: none yet, all pages recorded")
+        return
+    if not (changed or added or removed):
+        print("   Pages: no changes since last build")
+        return
+    for label, pages in (("changed", changed), ("added", added), ("removed", removed)):
+        if pages:
+            print(f"   Pages {label} ({len(pages)}): {_format_pages(pages)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare quran_text.json against its content-hash manifest")
+    parser.add_argument("--input", default="assets/quran/quran_text.json")
+    parser.add_argument("--check", action="store_true",
+                        help="exit with status 1 if any page or the asset differs from the manifest")
+    args = parser.parse_args()
+
+    input_path = Path(args.input)
+    with open(input_path, encoding="utf-8") as f:
+        quran_text = json.load(f)
+
+    manifest = load_manifest(input_path.parent)
+    if manifest is None:
+        print(f"[ERROR] No {MANIFEST_NAME} next to {input_path}")
+        sys.exit(1)
+
+    changed, added, removed = diff_pages(manifest["pages"], page_hashes(quran_text))
+    asset_changed = sha256_hex(input_path.read_bytes()) != manifest["asset"]["sha256"]
+    print_page_diff(changed, added, removed)
+    if asset_changed and not (changed or added or removed):
+        print("   Asset: bytes differ from manifest (formatting only)")
+
+    if args.check and (asset_changed or changed or added or removed):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
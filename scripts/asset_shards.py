@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Sharded Quran text assets for the web build
+One file per juz (QuranData.juzList page ranges) or per page, plus a manifest,
+so the client only fetches the shard that contains the page being read
+
+Layout:
+    assets/quran/shards/manifest.json
+    assets/quran/shards/juz/01.json ... 30.json      {"1": "text", ..., "21": "text"}
+    assets/quran/shards/page/001.json ... 604.json   {"1": "text"}
+
+Usage:
+    python scripts/asset_shards.py --mode juz
+"""
+
+import argparse
+import json
+import shutil
+from pathlib import Path
+
+from asset_manifest import write_if_changed
+from quran_meta import JUZ_PAGE_RANGES, TOTAL_PAGES
+
+SHARD_MODES = ("juz", "page")
+MANIFEST_VERSION = 1
+
+
+def shard_ranges(mode):
+    """[(name, first_page, last_page)] for a shard mode"""
+    if mode == "juz":
+        return [(f"{juz:02d}", start, end) for juz, (start, end) in enumerate(JUZ_PAGE_RANGES, 1)]
+    if mode == "page":
+        return [(f"{page:03d}", page, page) for page in range(1, TOTAL_PAGES + 1)]
+    raise ValueError(f"unknown shard mode: {mode}")
+
+
+def write_shards(quran_text, output_dir, mode="juz"):
+    """
+    Write shards + manifest under output_dir/shards and return the manifest.
+    Shards are written minified; pages missing from quran_text are skipped.
+    Unchanged shard files are left untouched; shards of the other mode are removed.
+    """
+    shards_dir = Path(output_dir) / "shards"
+    mode_dir = shards_dir / mode
+    for other in SHARD_MODES:
+        if other != mode:
+            shutil.rmtree(shards_dir / other, ignore_errors=True)
+    mode_dir.mkdir(parents=True, exist_ok=True)
+
+    shards = []
+    for name, first_page, last_page in shard_ranges(mode):
+        pages = {str(page): quran_text[str(page)] for page in range(first_page, last_page + 1)
+                 if str(page) in quran_text}
+        if not pages:
+            continue
+        data = json.dumps(pages, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        write_if_changed(mode_dir / f"{name}.json", data)
+        shards.append({
+            "file": f"{mode}/{name}.json",
+            "first_page": first_page,
+            "last_page": last_page,
+            "pages": len(pages),
+            "bytes": len(data),
+        })
+
+    current = {shard["file"] for shard in shards}
+    for stale in mode_dir.glob("*.json"):
+        if f"{mode}/{stale.name}" not in current:
+            stale.unlink()
+
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "mode": mode,
+        "total_pages": TOTAL_PAGES,
+        "shards": shards,
+    }
+    write_if_changed(shards_dir / "manifest.json",
+                     json.dumps(manifest, ensure_ascii=False, indent=2).encode("utf-8"))
+    return manifest
+
+
+def current_shard_mode(output_dir):
+    """Mode of the shards already under output_dir/shards, or None if there are none"""
+    try:
+        with open(Path(output_dir) / "shards" / "manifest.json", encoding="utf-8") as f:
+            mode = json.load(f).get("mode")
+    except (OSError, ValueError, AttributeError):
+        return None
+    return mode if mode in SHARD_MODES else None
+
+
+def shard_for_page(manifest, page_number):
+    """Manifest entry of the shard holding a page (what a client would do)"""
+    for shard in manifest["shards"]:
+        if shard["first_page"] <= page_number <= shard["last_page"]:
+            return shard
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Split quran_text.json into per-juz or per-page shards")
+    parser.add_argument("--input", default="assets/quran/quran_text.json")
+    parser.add_argument("--mode", choices=SHARD_MODES, default="juz")
+    args = parser.parse_args()
+
+    with open(args.input, encoding="utf-8") as f:
+        quran_text = json.load(f)
+    manifest = write_shards(quran_text, Path(args.input).parent, args.mode)
+
+    sizes = [shard["bytes"] for shard in manifest["shards"]]
+    print(f"[OK] {len(sizes)} {args.mode} shards, "
+          f"largest {max(sizes) / 1024:.1f} KB, total {sum(sizes) / 1024:.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
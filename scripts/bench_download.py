@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+End-to-end download benchmark against the local mock upstream
+Runs each fetch strategy (fetch_planner endpoints: per-page, per-chapter,
+bulk JSON, bulk XML) at each concurrency level in a fresh child process and
+records wall time, request latency percentiles, requests, bytes and peak RSS.
+Results are written as JSON so runs can be compared over time.
+
+Usage:
+    python scripts/bench_download.py
+    python scripts/bench_download.py --strategies quran.com-page,tanzil-xml --workers 1,8,16 --latency 0.05
+    python scripts/bench_download.py --error-rate 0.02 --throttle-rate 0.05 --output bench.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from fetch_planner import ENDPOINTS, ENDPOINTS_BY_NAME
+from progress_journal import BUILD_DIR
+from quran_meta import TOTAL_PAGES
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+BENCH_DIR = BUILD_DIR / "bench"
+BENCH_VERSION = 1
+DEFAULT_WORKER_LEVELS = [1, 4, 8, 16]
+DEFAULT_LATENCY = 0.03  # seconds; roughly a real round trip to the public APIs
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list (None if empty)"""
+    if not sorted_values:
+        return None
+    rank = max(1, round(fraction * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def latency_summary(seconds):
+    values = sorted(value * 1000 for value in seconds)
+    summary = {name: percentile(values, fraction)
+               for name, fraction in (("p50", 0.50), ("p95", 0.95), ("p99", 0.99))}
+    summary["max"] = values[-1] if values else None
+    return {name: round(value, 2) if value is not None else None for name, value in summary.items()}
+
+
+def peak_rss_bytes():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024  # Linux reports KiB
+
+
+def run_strategy(name, workers, rate=None):
+    """Child-process side: fetch all pages with one strategy and measure it"""
+    import quran_http
+    from fetch_planner import execute_plan, plan_for
+
+    latencies = []
+    # Every request goes through the shared session, retries included
+    quran_http.get_session().hooks["response"].append(
+        lambda response, *args, **kwargs: latencies.append(response.elapsed.total_seconds()))
+
+    plan = plan_for(ENDPOINTS_BY_NAME[name], list(range(1, TOTAL_PAGES + 1)), workers)
+    error = None
+    started = time.perf_counter()
+    try:
+        pages_text = execute_plan(plan, workers=workers, rate=rate)
+    except Exception as e:
+        pages_text = {}
+        error = f"{type(e).__name__}: {e}"
+    wall = time.perf_counter() - started
+
+    return {
+        "strategy": name,
+        "workers": workers,
+        "wall_s": round(wall, 3),
+        "pages": len(pages_text),
+        "client_requests": len(latencies),
+        "latency_ms": latency_summary(latencies),
+        "peak_rss_bytes": peak_rss_bytes(),
+        "error": error,
+    }
+
+
+def _run_child(name, workers, rate, upstream_url):
+    env = dict(os.environ, QURAN_UPSTREAM=upstream_url, QURAN_HTTP_CACHE="0")
+    command = [sys.executable, str(Path(__file__).resolve()), "--child", name, "--workers", str(workers)]
+    if rate:
+        command += ["--rate", str(rate)]
+    completed = subprocess.run(command, env=env, capture_output=True, text=True, encoding="utf-8")
+    lines = completed.stdout.strip().splitlines()
+    try:
+        return json.loads(lines[-1])
+    except (IndexError, ValueError):
+        return {"strategy": name, "workers": workers,
+                "error": (completed.stderr.strip().splitlines() or ["no output"])[-1]}
+
+
+def run_matrix(strategies, worker_levels, rate=None, repeat=1, fault_options=None):
+    """Run every strategy x concurrency level against one mock upstream; returns result dicts"""
+    from mock_upstream import FaultInjector, MockUpstream
+
+    fault_options = fault_options or {}
+    results = []
+    with MockUpstream() as upstream:
+        upstream.synthetic.verses()  # load the corpus before the first timed run
+
+        for name in strategies:
+            # Whole-Quran strategies are a single request; concurrency doesn't apply
+            levels = [1] if ENDPOINTS_BY_NAME[name].granularity == "quran" else worker_levels
+            for workers in levels:
+                for run in range(1, repeat + 1):
+                    # Same seed per run, so every configuration sees the same fault sequence
+                    upstream.faults = FaultInjector(**fault_options)
+                    before = upstream.snapshot()
+                    result = _run_child(name, workers, rate, upstream.url)
+                    after = upstream.snapshot()
+
+                    server = {key: after[key] - before.get(key, 0) for key in after
+                              if after[key] != before.get(key, 0)}
+                    result["run"] = run
+                    result["requests"] = server.pop("requests", 0)
+                    result["bytes"] = server.pop("bytes", 0)
+                    result["server_status"] = {key[len("status_"):]: count for key, count in server.items()
+                                               if key.startswith("status_")}
+                    results.append(result)
+                    print_result(result)
+    return results
+
+
+def print_result(result):
+    if "wall_s" not in result:
+        print(f"  {result['strategy']:<20} {result['workers']:>3}  [ERROR] {result['error']}")
+        return
+    latency = result["latency_ms"]
+    rss = result["peak_rss_bytes"]
+    print(f"  {result['strategy']:<20} {result['workers']:>3} {result['wall_s']:>8.2f}s "
+          f"{result['pages']:>4}p {result['requests']:>5} req {result['bytes'] / 1024:>7.0f} KB "
+          f"p50 {latency['p50'] or 0:>7.1f} p95 {latency['p95'] or 0:>7.1f} p99 {latency['p99'] or 0:>7.1f} ms "
+          f"{(rss or 0) / 2**20:>6.1f} MB"
+          + (f"  [ERROR] {result['error']}" if result.get("error") else ""))
+
+
+def _int_list(text):
+    return [int(value) for value in text.split(",") if value]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Quran download strategies offline")
+    parser.add_argument("--strategies", default=",".join(endpoint.name for endpoint in ENDPOINTS),
+                        help="comma-separated fetch_planner strategies (default: all)")
+    parser.add_argument("--workers", default=",".join(map(str, DEFAULT_WORKER_LEVELS)),
+                        help="comma-separated concurrency levels")
+    parser.add_argument("--rate", type=float, help="client requests/s budget (default: unlimited)")
+    parser.add_argument("--repeat", type=int, default=1, help="runs per configuration")
+    parser.add_argument("--latency", type=float, default=DEFAULT_LATENCY, help="mock response delay (s)")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help=f"result file (default: {BENCH_DIR}/bench-<timestamp>.json)")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(run_strategy(args.child, int(args.workers), args.rate)))
+        return
+
+    strategies = [name for name in args.strategies.split(",") if name]
+    unknown = [name for name in strategies if name not in ENDPOINTS_BY_NAME]
+    if unknown:
+        parser.error(f"unknown strategies: {', '.join(unknown)}")
+
+    fault_options = {"latency": args.latency, "error_rate": args.error_rate,
+                     "throttle_rate": args.throttle_rate, "seed": args.seed}
+    started = datetime.now(timezone.utc)
+    print(f"[BENCH] {len(strategies)} strategies, workers {args.workers}, latency {args.latency * 1000:.0f} ms")
+    results = run_matrix(strategies, _int_list(args.workers), args.rate, args.repeat, fault_options)
+
+    report = {
+        "version": BENCH_VERSION,
+        "timestamp": started.isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": dict(fault_options, rate=args.rate, repeat=args.repeat),
+        "results": results,
+    }
+    output = Path(args.output) if args.output else BENCH_DIR / f"bench-{started:%Y%m%d-%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"[OK] Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+Per-request network metrics for the shared fetch path (quran_http)
+Records DNS / TCP connect / TLS / time-to-first-byte / total time, status
+codes, retries, response bytes and cache outcomes per upstream host, and
+exports a run summary as JSON and Prometheus text format.
+
+DNS, connect and TLS are only observed for requests that opened a new
+connection; reused keep-alive connections skip those phases.
+"""
+
+import json
+import socket
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError
+from urllib3.util.connection import allowed_gai_family
+
+from progress_journal import BUILD_DIR
+
+METRICS_DIR = BUILD_DIR / "metrics"
+PHASES = ("dns", "connect", "tls", "ttfb", "total")
+# Histogram bucket upper bounds in seconds (Prometheus `le`)
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Connection-setup phases of the request running on this thread
+_current = threading.local()
+
+
+def _observe_phase(phase, seconds):
+    phases = getattr(_current, "phases", None)
+    if phases is not None:
+        phases[phase] = phases.get(phase, 0.0) + seconds
+
+
+def _timed_new_conn(conn, new_conn):
+    """
+    Resolve the host ourselves so DNS and TCP connect can be timed separately.
+    Like urllib3's create_connection, every resolved address (of the allowed
+    families) is tried in turn until one connects.
+    """
+    if not hasattr(conn, "_dns_host"):
+        # urllib3-private; without it the resolved address can't be handed over,
+        # so the whole setup (DNS included) is reported as connect time
+        started = time.perf_counter()
+        sock = new_conn()
+        conn._socket_ready = time.perf_counter()
+        _observe_phase("connect", conn._socket_ready - started)
+        return sock
+
+    started = time.perf_counter()
+    try:
+        infos = socket.getaddrinfo(conn.host, conn.port, allowed_gai_family(), socket.SOCK_STREAM)
+    except OSError:
+        return new_conn()  # let urllib3 raise its usual NameResolutionError
+    addresses = list(dict.fromkeys(info[4][0] for info in infos))
+    resolved = time.perf_counter()
+    _observe_phase("dns", resolved - started)
+
+    # Only the socket goes to the IP; TLS still verifies and sends SNI for conn.host
+    original = conn._dns_host
+    try:
+        for index, address in enumerate(addresses):
+            conn._dns_host = address
+            try:
+                sock = new_conn()
+                break
+            except ConnectTimeoutError:  # also NewConnectionError (unreachable, refused)
+                if index == len(addresses) - 1:
+                    raise
+    finally:
+        conn._dns_host = original
+    conn._socket_ready = time.perf_counter()
+    _observe_phase("connect", conn._socket_ready - resolved)
+    return sock
+
+
+class TimedHTTPConnection(HTTPConnection):
+    def _new_conn(self):
+        return _timed_new_conn(self, super()._new_conn)
+
+
+class TimedHTTPSConnection(HTTPSConnection):
+    def _new_conn(self):
+        return _timed_new_conn(self, super()._new_conn)
+
+    def connect(self):
+        self._socket_ready = None
+        super().connect()
+        if self._socket_ready is not None:
+            _observe_phase("tls", time.perf_counter() - self._socket_ready)
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose new connections report DNS/connect/TLS time"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": TimedHTTPConnectionPool,
+            "https": TimedHTTPSConnectionPool,
+        }
+
+
+class RequestRecord:
+    """Outcome of one request; filled in by the caller inside FetchMetrics.track()"""
+
+    def __init__(self, host):
+        self.host = host
+        self.status = None
+        self.bytes = 0
+        self.cache = None  # "hit", "revalidated", "miss" or None (cache bypassed)
+        self.ttfb = None
+        self.phases = {}
+
+
+class FetchMetrics:
+    """Thread-safe per-host counters, histograms and raw samples for one run"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.requests = defaultdict(Counter)  # host -> status -> count
+            self.bytes = Counter()  # host -> response bytes
+            self.cache = Counter()  # outcome -> count
+            self.retries = Counter()  # FetchError kind -> count
+            self.samples = defaultdict(lambda: defaultdict(list))  # host -> phase -> [seconds]
+
+    @contextmanager
+    def track(self, url):
+        """Time one request: `with METRICS.track(url) as record: ...`"""
+        record = RequestRecord(urlsplit(url).netloc)
+        _current.phases = record.phases
+        started = time.perf_counter()
+        try:
+            yield record
+        except Exception as e:
+            record.status = record.status or type(e).__name__
+            raise
+        finally:
+            _current.phases = None
+            record.phases["total"] = time.perf_counter() - started
+            if record.ttfb is not None:
+                record.phases["ttfb"] = record.ttfb
+            self._add(record)
+
+    def _add(self, record):
+        with self._lock:
+            self.requests[record.host][str(record.status)] += 1
+            self.bytes[record.host] += record.bytes
+            if record.cache:
+                self.cache[record.cache] += 1
+            for phase, seconds in record.phases.items():
+                self.samples[record.host][phase].append(seconds)
+
+    def count_retry(self, kind):
+        with self._lock:
+            self.retries[kind] += 1
+
+    def summary(self):
+        """JSON-serialisable run summary"""
+        with self._lock:
+            hosts = {}
+            for host in sorted(self.requests):
+                hosts[host] = {
+                    "requests": sum(self.requests[host].values()),
+                    "status": dict(self.requests[host]),
+                    "bytes": self.bytes[host],
+                    "phases_ms": {phase: _phase_summary(self.samples[host][phase])
+                                  for phase in PHASES if self.samples[host].get(phase)},
+                }
+            return {"hosts": hosts, "cache": dict(self.cache), "retries": dict(self.retries)}
+
+    def to_prometheus(self):
+        """Prometheus text exposition of the run"""
+        lines = [
+            "# HELP quran_http_requests_total HTTP requests by upstream host and status",
+            "# TYPE quran_http_requests_total counter",
+        ]
+        with self._lock:
+            for host, statuses in sorted(self.requests.items()):
+                for status, count in sorted(statuses.items()):
+                    lines.append(f'quran_http_requests_total{{host="{host}",status="{status}"}} {count}')
+
+            lines += ["# HELP quran_http_response_bytes_total Decoded response body bytes",
+                      "# TYPE quran_http_response_bytes_total counter"]
+            for host, total in sorted(self.bytes.items()):
+                lines.append(f'quran_http_response_bytes_total{{host="{host}"}} {total}')
+
+            lines += ["# HELP quran_http_cache_total Requests by HTTP cache outcome",
+                      "# TYPE quran_http_cache_total counter"]
+            for outcome, count in sorted(self.cache.items()):
+                lines.append(f'quran_http_cache_total{{result="{outcome}"}} {count}')
+
+            lines += ["# HELP quran_http_retries_total Retries by failure kind",
+                      "# TYPE quran_http_retries_total counter"]
+            for kind, count in sorted(self.retries.items()):
+                lines.append(f'quran_http_retries_total{{kind="{kind}"}} {count}')
+
+            lines += ["# HELP quran_http_phase_seconds Request phase durations",
+                      "# TYPE quran_http_phase_seconds histogram"]
+            for host, phases in sorted(self.samples.items()):
+                for phase in PHASES:
+                    values = phases.get(phase)
+                    if not values:
+                        continue
+                    labels = f'host="{host}",phase="{phase}"'
+                    for bound in BUCKETS:
+                        count = sum(1 for value in values if value <= bound)
+                        lines.append(f'quran_http_phase_seconds_bucket{{{labels},le="{bound}"}} {count}')
+                    lines.append(f'quran_http_phase_seconds_bucket{{{labels},le="+Inf"}} {len(values)}')
+                    lines.append(f'quran_http_phase_seconds_sum{{{labels}}} {sum(values):.6f}')
+                    lines.append(f'quran_http_phase_seconds_count{{{labels}}} {len(values)}')
+        return "\n".join(lines) + "\n"
+
+    def export(self, directory=METRICS_DIR):
+        """Write metrics.json and metrics.prom; returns the directory"""
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / "metrics.json").write_text(json.dumps(self.summary(), indent=2), encoding="utf-8")
+        (directory / "metrics.prom").write_text(self.to_prometheus(), encoding="utf-8")
+        return directory
+
+    def print_summary(self):
+        summary = self.summary()
+        if not summary["hosts"]:
+            return
+        print(f"{'host':<24} {'req':>5} {'KB':>8} {'ttfb p50':>9} {'p95':>8} {'total p99':>10}  status")
+        for host, stats in summary["hosts"].items():
+            ttfb = stats["phases_ms"].get("ttfb", {})
+            total = stats["phases_ms"].get("total", {})
+            statuses = " ".join(f"{status}:{count}" for status, count in sorted(stats["status"].items()))
+            print(f"{host:<24} {stats['requests']:>5} {stats['bytes'] / 1024:>8.0f} "
+                  f"{ttfb.get('p50', 0):>9.1f} {ttfb.get('p95', 0):>8.1f} {total.get('p99', 0):>10.1f}  {statuses}")
+        if summary["cache"]:
+            print("cache: " + ", ".join(f"{k} {v}" for k, v in sorted(summary["cache"].items())))
+        if summary["retries"]:
+            print("retries: " + ", ".join(f"{k} {v}" for k, v in sorted(summary["retries"].items())))
+
+
+def _phase_summary(seconds):
+    values = sorted(seconds)
+
+    def at(fraction):
+        return values[min(len(values), max(1, round(fraction * len(values)))) - 1] * 1000
+
+    return {
+        "count": len(values),
+        "p50": round(at(0.50), 2),
+        "p95": round(at(0.95), 2),
+        "p99": round(at(0.99), 2),
+        "max": round(values[-1] * 1000, 2),
+        "sum": round(sum(values) * 1000, 2),
+    }
+
+
+# Process-wide metrics for the shared session
+METRICS = FetchMetrics()
+
+
+def report_run(directory=METRICS_DIR):
+    """End-of-run hook for the download scripts: print the summary and export both formats"""
+    if not METRICS.requests:
+        return
+    print("\n[NETWORK]")
+    METRICS.print_summary()
+    print(f"Metrics: {METRICS.export(directory)}/metrics.json, metrics.prom")
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Fetch planner: pick the download strategy with the fewest round-trips and bytes
+for the pages that are actually needed (full rebuild, a page range or a juz)
+Only strategies serving the asset's text edition are candidates; the
+cheapest goes first and the others of that edition are its fallbacks.
+
+Run as `python scripts/quran_cli.py fetch` (this script forwards its arguments):
+    python scripts/quran_cli.py fetch                    # plan + fetch all 604 pages
+    python scripts/quran_cli.py fetch --juz 30           # rebuild just juz 30
+    python scripts/quran_cli.py fetch --pages 1-5,604 --dry-run
+"""
+
+import math
+import sys
+from collections import namedtuple
+
+from parallel_download import DEFAULT_RATE, RateLimiter
+from quran_meta import (EDITION_ALQURAN_CLOUD, EDITION_QURAN_COM, EDITION_TANZIL, SURAH_AYAH_COUNTS, TOTAL_PAGES,
+                        TOTAL_VERSES, surah_page_range, surahs_for_pages)
+from stream_pipeline import Stage, run_stages
+
+# A round trip costs about as much wall time as this many payload bytes
+# (~50 ms RTT on a ~10 Mbit/s link)
+ROUND_TRIP_BYTES = 64 * 1024
+
+AVG_VERSES_PER_PAGE = TOTAL_VERSES / TOTAL_PAGES
+
+# granularity: "quran" (one document), "surah" or "page"
+# edition: the quran_meta EDITION_* text the endpoint serves
+# bytes_per_verse / overhead: rough uncompressed JSON/XML sizes per response
+Endpoint = namedtuple("Endpoint", "name granularity edition bytes_per_verse overhead description")
+
+ENDPOINTS = [
+    Endpoint("tanzil-xml", "quran", EDITION_TANZIL, 230, 300,
+             "Tanzil uthmani-min XML (whole Quran, one request)"),
+    Endpoint("quran.com-bulk", "quran", EDITION_QURAN_COM, 280, 200,
+             "Quran.com quran/verses/uthmani (whole Quran, one request)"),
+    Endpoint("quran.com-chapter", "surah", EDITION_QURAN_COM, 290, 200,
+             "Quran.com quran/verses/uthmani?chapter_number=N (one request per surah)"),
+    Endpoint("quran.com-page", "page", EDITION_QURAN_COM, 650, 300,
+             "Quran.com verses/by_page/N (one request per page)"),
+    Endpoint("alquran.cloud-page", "page", EDITION_ALQURAN_CLOUD, 750, 500,
+             "AlQuran.cloud page/N/quran-uthmani (one request per page)"),
+]
+ENDPOINTS_BY_NAME = {endpoint.name: endpoint for endpoint in ENDPOINTS}
+
+Plan = namedtuple("Plan", "endpoint pages units requests est_bytes cost")
+
+
+def plan_for(endpoint, pages, workers=1):
+    """Cost out one endpoint for the requested pages"""
+    if endpoint.granularity == "quran":
+        units = [None]
+        verses = TOTAL_VERSES
+        parallel = 1
+    elif endpoint.granularity == "surah":
+        units = surahs_for_pages(pages)
+        verses = sum(SURAH_AYAH_COUNTS[surah - 1] for surah in units)
+        parallel = workers
+    else:
+        units = list(pages)
+        verses = len(pages) * AVG_VERSES_PER_PAGE
+        parallel = workers
+
+    requests = len(units)
+    est_bytes = int(verses * endpoint.bytes_per_verse + requests * endpoint.overhead)
+    round_trips = math.ceil(requests / max(1, parallel))
+    cost = round_trips * ROUND_TRIP_BYTES + est_bytes
+    return Plan(endpoint, list(pages), units, requests, est_bytes, cost)
+
+
+def plan_fetch(pages, workers=1, endpoints=ENDPOINTS, edition=None):
+    """Candidate plans (only those of `edition`, if given), cheapest first"""
+    return sorted((plan_for(endpoint, pages, workers) for endpoint in endpoints
+                   if edition is None or endpoint.edition == edition),
+                  key=lambda plan: (plan.cost, plan.requests))
+
+
+class PageGrouper:
+    """
+    Pipeline stage that collects verses per page and releases a page once
+    every unit (surah or whole document) that can put text on it has arrived.
+    A page that depends on a failed unit is dropped rather than released
+    with verses missing.
+    """
+
+    def __init__(self, pages, units_for_page):
+        self.waiting = {page: set(units_for_page(page)) for page in pages}
+        self.verses = {page: [] for page in pages}
+        self.failed = set()
+
+    def add(self, item):
+        """item: (unit, [(page, position, text), ...]) or (unit, None) if the unit failed"""
+        unit, verses = item
+        for page, position, text in verses or ():
+            if page in self.verses and text:
+                self.verses[page].append(((unit or 0, position), text))
+
+        completed = []
+        for page, units in self.waiting.items():
+            if unit in units:
+                units.discard(unit)
+                if verses is None:
+                    self.failed.add(page)
+                if not units:
+                    completed.append(page)
+        for page in completed:
+            del self.waiting[page]
+            verses_on_page = self.verses.pop(page)
+            if page not in self.failed and verses_on_page:
+                yield page, '\n\n'.join(text for _, text in sorted(verses_on_page))
+
+
+def iter_plan_pages(plan, workers=1, rate=DEFAULT_RATE):
+    """
+    Yield (page, text) for the plan's pages as soon as each one is complete.
+    Requests, parsing and grouping run as separate stream_pipeline stages,
+    so finished pages can be written while later requests are in flight.
+    Per-page and per-surah requests run on `workers` threads under one
+    `rate`/s budget. Pages that could not be fetched are not yielded.
+    """
+    wanted = set(plan.pages)
+    name = plan.endpoint.name
+    limiter = RateLimiter(rate)
+
+    if plan.endpoint.granularity == "page":
+        from quran_sources import build_sources
+
+        source = build_sources(["quran.com" if name == "quran.com-page" else "alquran.cloud"])[0]
+
+        def fetch_page(page_number):
+            limiter.wait()
+            page_text = source.fetch_page(page_number)
+            return [(page_number, page_text)] if page_text else []
+
+        yield from run_stages(plan.pages, Stage(fetch_page, workers=workers))
+        return
+
+    if name == "tanzil-xml":
+        from tanzil_stream import stream_tanzil_pages
+
+        # The XML is parsed on the source thread as it downloads; pages arrive complete
+        def join_page(item):
+            page_num, verses = item
+            return [(page_num, '\n\n'.join(verses))] if page_num in wanted else []
+
+        yield from run_stages(stream_tanzil_pages(), Stage(join_page))
+        return
+
+    from retry_policy import FetchError, call_with_retries, get_json
+
+    url = "https://api.quran.com/api/v4/quran/verses/uthmani"
+
+    def fetch(surah):
+        limiter.wait()
+        params = {"chapter_number": surah} if surah else None
+        try:
+            return [(surah, call_with_retries(get_json, url, params=params, timeout=30,
+                                               validate=lambda d: bool(d.get('verses'))))]
+        except FetchError as e:
+            print(f"  [ERROR] {'surah ' + str(surah) if surah else 'Quran'}: {e}")
+            return [(surah, None)]
+
+    def parse(item):
+        unit, data = item
+        if data is None:
+            return [(unit, None)]
+        return [(unit, [(verse.get('page_number'), position, verse.get('text_uthmani', '').strip())
+                        for position, verse in enumerate(data['verses'])])]
+
+    if plan.endpoint.granularity == "surah":
+        ranges = {surah: surah_page_range(surah) for surah in plan.units}
+
+        def units_for_page(page):
+            return [surah for surah, (first, last) in ranges.items() if first <= page <= last]
+    else:
+        def units_for_page(page):
+            return plan.units
+
+    grouper = PageGrouper(plan.pages, units_for_page)
+    yield from run_stages(plan.units, Stage(fetch, workers=workers), Stage(parse), Stage(grouper.add))
+
+
+def execute_plan(plan, workers=1, rate=DEFAULT_RATE):
+    """Run a plan and return {str(page): text} for the pages that could be fetched"""
+    pages_text = dict(iter_plan_pages(plan, workers=workers, rate=rate))
+    return {str(page): pages_text[page] for page in sorted(pages_text)}
+
+
+def print_plans(plans):
+    print(f"{'strategy':<20} {'requests':>8} {'est. KB':>9} {'cost':>9}")
+    print("-" * 50)
+    for index, plan in enumerate(plans):
+        marker = "  <- chosen" if index == 0 else ""
+        print(f"{plan.endpoint.name:<20} {plan.requests:>8} {plan.est_bytes / 1024:>9.0f} "
+              f"{plan.cost / 1024:>9.0f}{marker}")
+
+
+if __name__ == "__main__":
+    from quran_cli import main
+
+    sys.exit(main(["fetch"] + sys.argv[1:]))
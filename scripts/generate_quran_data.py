@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Generate lib/utils/quran_page_tables.dart: precomputed page -> juz and
+page -> surahs tables (indexed by page number) plus the full surah table,
+so QuranData does constant-time lookups instead of scanning juzList
+
+Chapter data comes from the Quran.com chapters endpoint
+(quran_sources.fetch_chapters). With --offline the surah page ranges are
+derived from assets/quran/quran_text.json instead, and the surah names come
+from quran_meta (also the fallback for any name the endpoint leaves blank).
+
+Usage:
+    python scripts/generate_quran_data.py
+    python scripts/generate_quran_data.py --offline
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+from quran_meta import (SURAH_ARABIC_NAMES, SURAH_AYAH_COUNTS, SURAH_NAMES, TOTAL_PAGES, TOTAL_SURAHS,
+                        juz_for_page)
+
+DART_OUTPUT = Path("lib/utils/quran_page_tables.dart")
+VALUES_PER_LINE = 20
+NAMES_PER_LINE = 6
+
+
+def chapters_from_asset(asset_path):
+    """Chapter records (static names) with page ranges taken from the verse corpus"""
+    from verse_corpus import build_corpus, verses_from_page_text
+
+    with open(asset_path, encoding="utf-8") as f:
+        quran_text = json.load(f)
+    corpus = build_corpus(verses_from_page_text(quran_text))
+    return [
+        {
+            "id": surah,
+            "name_simple": SURAH_NAMES[surah - 1],
+            "name_arabic": SURAH_ARABIC_NAMES[surah - 1],
+            "verses_count": SURAH_AYAH_COUNTS[surah - 1],
+            "pages": corpus["surah_page_range"][surah - 1],
+        }
+        for surah in range(1, TOTAL_SURAHS + 1)
+    ]
+
+
+def build_tables(chapters):
+    """Page-indexed lookup tables from chapter records (index 0 is unused)"""
+    chapters = sorted(chapters, key=lambda chapter: chapter["id"])
+    if len(chapters) != TOTAL_SURAHS:
+        raise ValueError(f"expected {TOTAL_SURAHS} chapters, got {len(chapters)}")
+
+    page_surahs = [[] for _ in range(TOTAL_PAGES + 1)]
+    for chapter in chapters:
+        first, last = chapter["pages"]
+        for page in range(first, last + 1):
+            page_surahs[page].append(chapter["id"])
+
+    empty = [page for page in range(1, TOTAL_PAGES + 1) if not page_surahs[page]]
+    if empty:
+        raise ValueError(f"pages without a surah: {empty[:10]}")
+
+    return {
+        "page_juz": [0] + [juz_for_page(page) for page in range(1, TOTAL_PAGES + 1)],
+        "page_surahs": page_surahs,
+        "surah_names": [chapter.get("name_simple") or SURAH_NAMES[chapter["id"] - 1] for chapter in chapters],
+        "surah_arabic_names": [chapter.get("name_arabic") or SURAH_ARABIC_NAMES[chapter["id"] - 1]
+                               for chapter in chapters],
+        "surah_ayah_counts": [chapter["verses_count"] for chapter in chapters],
+        "surah_start_pages": [chapter["pages"][0] for chapter in chapters],
+        "surah_end_pages": [chapter["pages"][1] for chapter in chapters],
+    }
+
+
+def _dart_list(values, per_line=VALUES_PER_LINE):
+    """Dart list literal body, `per_line` values per line ("[]" if empty)"""
+    if not values:
+        return "[]"
+    lines = []
+    for start in range(0, len(values), per_line):
+        lines.append("    " + ", ".join(values[start:start + per_line]) + ",")
+    return "[\n" + "\n".join(lines) + "\n  ]"
+
+
+def _dart_string(value):
+    return "'" + value.replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+
+def render_dart(tables):
+    names = [_dart_string(name) for name in tables["surah_names"]]
+    arabic_names = [_dart_string(name) for name in tables["surah_arabic_names"]]
+    page_surahs = ["[" + ", ".join(map(str, surahs)) + "]" for surahs in tables["page_surahs"]]
+
+    def int_list(key):
+        return _dart_list([str(value) for value in tables[key]])
+
+    return f"""// GENERATED by scripts/generate_quran_data.py - do not edit by hand.
+// Lists indexed by page number have an unused entry at index 0.
+// Lists indexed by surah number start at surah 1 (index 0).
+
+class QuranPageTables {{
+  // Juz number for each page (page -> juz)
+  static const List<int> pageJuz = {int_list("page_juz")};
+
+  // Surah numbers that appear on each page (page -> surahs)
+  static const List<List<int>> pageSurahs = {_dart_list(page_surahs)};
+
+  static const List<int> surahAyahCounts = {int_list("surah_ayah_counts")};
+
+  static const List<int> surahStartPages = {int_list("surah_start_pages")};
+
+  static const List<int> surahEndPages = {int_list("surah_end_pages")};
+
+  static const List<String> surahNames = {_dart_list(names, NAMES_PER_LINE)};
+
+  static const List<String> surahArabicNames = {_dart_list(arabic_names, NAMES_PER_LINE)};
+}}
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the QuranData page lookup tables")
+    parser.add_argument("--offline", action="store_true",
+                        help="derive surah page ranges from the local asset instead of Quran.com")
+    parser.add_argument("--asset", default="assets/quran/quran_text.json")
+    parser.add_argument("--output", default=str(DART_OUTPUT))
+    args = parser.parse_args()
+
+    if args.offline:
+        chapters = chapters_from_asset(args.asset)
+    else:
+        from quran_sources import fetch_chapters
+
+        try:
+            chapters = fetch_chapters()
+        except OSError as e:  # requests errors are OSErrors
+            print(f"[ERROR] {e}")
+            chapters = None
+        if not chapters:
+            print("[ERROR] Could not fetch chapters; rerun with --offline")
+            return
+
+    tables = build_tables(chapters)
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(render_dart(tables), encoding="utf-8")
+    print(f"[OK] {output}: {TOTAL_PAGES} pages, {len(chapters)} surahs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Persistent on-disk HTTP response cache for the Quran download scripts
+Fresh entries are served locally; stale ones are revalidated with ETag/Last-Modified
+Freshness follows the response's Cache-Control (no-store, no-cache, max-age)
+and Expires headers; the fixed max_age only applies when neither is sent
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from progress_journal import BUILD_DIR
+
+CACHE_DIR = BUILD_DIR / "http_cache"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024  # evict least recently used entries above this
+DEFAULT_MAX_AGE = 24 * 60 * 60  # seconds an entry is served without revalidation (no caching headers)
+
+# Headers that describe the encoded transfer, not the (decoded) body we store
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+
+_MAX_AGE = re.compile(r"(?:^|,)\s*max-age\s*=\s*\"?(\d+)", re.IGNORECASE)
+
+
+def _cache_directives(headers):
+    return {part.strip().split("=", 1)[0].lower() for part in headers.get("Cache-Control", "").split(",")}
+
+
+def cacheable(headers):
+    """False when the response forbids storing it (Cache-Control: no-store)"""
+    return "no-store" not in _cache_directives(headers)
+
+
+def freshness_lifetime(headers, default):
+    """
+    Seconds a response may be served without revalidation: 0 for no-cache,
+    max-age (minus Age) if given, else Expires - Date, else `default`
+    """
+    if "no-cache" in _cache_directives(headers):
+        return 0
+    age = headers.get("Age", "")
+    age = int(age) if age.isdigit() else 0
+    match = _MAX_AGE.search(headers.get("Cache-Control", ""))
+    if match:
+        return max(0, int(match.group(1)) - age)
+    if "Expires" in headers:
+        try:
+            expires = parsedate_to_datetime(headers["Expires"]).timestamp()
+            date = parsedate_to_datetime(headers["Date"]).timestamp() if "Date" in headers else time.time()
+        except (TypeError, ValueError):
+            return 0  # an invalid Expires means already expired
+        return max(0, expires - date - age)
+    return default
+
+
+def cache_key(url, params=None):
+    """Stable key for a URL + query parameters (parameter order does not matter)"""
+    items = sorted((str(k), str(v)) for k, v in (params or {}).items())
+    raw = url + "?" + json.dumps(items, ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class HttpCache:
+    """
+    Each entry is two files: <key>.body (decoded response bytes) and
+    <key>.json (url, headers, validators, stored_at). Body mtime tracks the
+    last access for LRU eviction.
+    """
+
+    def __init__(self, directory=CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES, max_age=DEFAULT_MAX_AGE):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._total_bytes = None
+
+    def _paths(self, key):
+        return self.directory / f"{key}.body", self.directory / f"{key}.json"
+
+    def lookup(self, url, params=None):
+        """Return (meta, body) for a cached URL, or (None, None)"""
+        body_path, meta_path = self._paths(cache_key(url, params))
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            body = body_path.read_bytes()
+        except (OSError, json.JSONDecodeError):
+            return None, None
+        try:
+            os.utime(body_path)  # mark as recently used
+        except OSError:
+            pass
+        return meta, body
+
+    def lookup_file(self, url, params=None):
+        """Like lookup(), but return the body's path instead of reading it"""
+        body_path, meta_path = self._paths(cache_key(url, params))
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            os.utime(body_path)
+        except (OSError, json.JSONDecodeError):
+            return None, None
+        return meta, body_path
+
+    def is_fresh(self, meta):
+        return time.time() - meta.get("stored_at", 0) < meta.get("fresh_for", self.max_age)
+
+    def conditional_headers(self, meta):
+        """Validators to send so the server can answer 304 Not Modified"""
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def store(self, url, params, response):
+        """Save a 200 response (body already decoded by requests) unless it is no-store"""
+        if not cacheable(response.headers):
+            self.discard(url, params)
+            return
+        key = cache_key(url, params)
+        body_path, meta_path = self._paths(key)
+        meta = _entry_meta(url, params, response, self.max_age)
+        body = response.content
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            old_size = body_path.stat().st_size if body_path.exists() else 0
+            _atomic_write(body_path, body)
+            _atomic_write(meta_path, json.dumps(meta, ensure_ascii=False).encode("utf-8"))
+            self._ensure_total()
+            self._total_bytes += len(body) - old_size
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def store_stream(self, url, params, response, chunks):
+        """
+        Pass `chunks` through while teeing them into a new cache entry.
+        The entry is only committed once the stream has been fully consumed.
+        """
+        if not cacheable(response.headers):
+            self.discard(url, params)
+            yield from chunks
+            return
+        key = cache_key(url, params)
+        body_path, meta_path = self._paths(key)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = body_path.with_name(f"{body_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+        size = 0
+        completed = False
+        try:
+            with open(tmp_path, "wb") as f:
+                for chunk in chunks:
+                    f.write(chunk)
+                    size += len(chunk)
+                    yield chunk
+            completed = True
+        finally:
+            if not completed:
+                tmp_path.unlink(missing_ok=True)
+
+        meta = _entry_meta(url, params, response, self.max_age)
+        with self._lock:
+            old_size = body_path.stat().st_size if body_path.exists() else 0
+            os.replace(tmp_path, body_path)
+            _atomic_write(meta_path, json.dumps(meta, ensure_ascii=False).encode("utf-8"))
+            self._ensure_total()
+            self._total_bytes += size - old_size
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def touch(self, url, params=None, response=None):
+        """
+        Restart the freshness window after a successful 304 revalidation,
+        taking a new lifetime from the 304's caching headers if it sent any
+        """
+        _, meta_path = self._paths(cache_key(url, params))
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            meta["stored_at"] = time.time()
+            if response is not None and ("Cache-Control" in response.headers or "Expires" in response.headers):
+                meta["fresh_for"] = freshness_lifetime(response.headers, self.max_age)
+            _atomic_write(meta_path, json.dumps(meta, ensure_ascii=False).encode("utf-8"))
+        except (OSError, json.JSONDecodeError):
+            pass
+
+    def discard(self, url, params=None):
+        """Forget one entry (e.g. a body that turned out to be unusable)"""
+        body_path, meta_path = self._paths(cache_key(url, params))
+        with self._lock:
+            if body_path.exists():
+                size = body_path.stat().st_size
+                body_path.unlink(missing_ok=True)
+                if self._total_bytes is not None:
+                    self._total_bytes -= size
+            meta_path.unlink(missing_ok=True)
+
+    def clear(self):
+        with self._lock:
+            for path in self.directory.glob("*.body"):
+                path.unlink(missing_ok=True)
+            for path in self.directory.glob("*.json"):
+                path.unlink(missing_ok=True)
+            self._total_bytes = 0
+
+    def _ensure_total(self):
+        if self._total_bytes is None:
+            self._total_bytes = sum(p.stat().st_size for p in self.directory.glob("*.body"))
+
+    def _evict(self):
+        """Drop least recently used entries until the cache is at 90% of its budget"""
+        target = int(self.max_bytes * 0.9)
+        entries = []
+        for body_path in self.directory.glob("*.body"):
+            stat = body_path.stat()
+            entries.append((stat.st_mtime, stat.st_size, body_path))
+        entries.sort()
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, body_path in entries:
+            if total <= target:
+                break
+            body_path.unlink(missing_ok=True)
+            body_path.with_suffix(".json").unlink(missing_ok=True)
+            total -= size
+        self._total_bytes = total
+
+
+def _entry_meta(url, params, response, default_max_age):
+    headers = {k: v for k, v in response.headers.items() if k.lower() not in _DROPPED_HEADERS}
+    return {
+        "url": url,
+        "params": params or {},
+        "status": response.status_code,
+        "headers": headers,
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "stored_at": time.time(),
+        "fresh_for": freshness_lifetime(response.headers, default_max_age),
+    }
+
+
+def to_response(meta, body):
+    """Rebuild a requests.Response from a cache entry"""
+    response = requests.Response()
+    response.status_code = meta.get("status", 200)
+    response.headers = CaseInsensitiveDict(meta.get("headers", {}))
+    response._content = body
+    response.url = meta.get("url")
+    response.encoding = get_encoding_from_headers(response.headers)
+    response.from_cache = True
+    return response
+
+
+def _atomic_write(path, data):
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
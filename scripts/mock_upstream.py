@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for api.quran.com, api.alquran.cloud and tanzil.net
+Serves recorded responses (or ones synthesized from assets/quran/quran_text.json)
+for the endpoints the downloaders use, with injectable latency, 5xx errors
+and 429 throttling, so downloads can be run and measured with no network.
+
+Requests are addressed as <base>/<upstream host>/<path>; quran_http does that
+rewrite when QURAN_UPSTREAM is set:
+
+    python scripts/mock_upstream.py --latency 0.05 --error-rate 0.02 --throttle-rate 0.05
+    QURAN_UPSTREAM=http://127.0.0.1:8750 QURAN_HTTP_CACHE=0 python scripts/quran_cli.py fetch --strategy quran.com-page --workers 8
+
+Synthesized text differs per upstream the way the real ones do (see
+SyntheticUpstream), so cross-source differences show up offline too.
+
+Fixtures live in .quran_build/fixtures (<key>.json + <key>.body, keyed like the
+HTTP cache). Run with --record once on a networked machine to capture real
+responses; anything not recorded is synthesized from the local asset.
+GET /__stats returns request counters as JSON.
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qsl, urlsplit
+from xml.sax.saxutils import quoteattr
+
+from http_cache import cache_key
+from progress_journal import BUILD_DIR
+from quran_meta import SURAH_AYAH_COUNTS, TOTAL_PAGES, TOTAL_SURAHS, juz_for_page
+
+FIXTURE_DIR = BUILD_DIR / "fixtures"
+DEFAULT_PORT = 8750
+DEFAULT_ASSET = Path("assets/quran/quran_text.json")
+RETRY_AFTER = 1  # seconds advertised on injected 429s
+CHUNK_SIZE = 64 * 1024
+
+
+class FixtureStore:
+    """Recorded upstream responses keyed by (path, query parameters)"""
+
+    def __init__(self, directory=FIXTURE_DIR):
+        self.directory = Path(directory)
+
+    def _paths(self, path, params):
+        key = cache_key(path, params)
+        return self.directory / f"{key}.json", self.directory / f"{key}.body"
+
+    def load(self, path, params):
+        """(status, content_type, body) or None"""
+        meta_path, body_path = self._paths(path, params)
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            return meta["status"], meta["content_type"], body_path.read_bytes()
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def save(self, path, params, status, content_type, body):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        meta_path, body_path = self._paths(path, params)
+        body_path.write_bytes(body)
+        with open(meta_path, "w", encoding="utf-8") as f:
+            json.dump({"path": path, "params": params, "status": status,
+                       "content_type": content_type}, f, ensure_ascii=False)
+
+
+# Verse-1 prefix AlQuran.cloud's quran-uthmani carries and the other upstreams don't
+BISMILLAH = "\u0628\u0650\u0633\u0652\u0645\u0650 \u0671\u0644\u0644\u0651\u064e\u0647\u0650 " \
+            "\u0671\u0644\u0631\u0651\u064e\u062d\u0652\u0645\u064e\u0670\u0646\u0650 " \
+            "\u0671\u0644\u0631\u0651\u064e\u062d\u0650\u064a\u0645\u0650"
+# Pause marks (small high sad-lam-alef ... small high three dots) uthmani-min leaves out
+_PAUSE_MARKS = re.compile("[\u06d6-\u06dc] ?")
+
+
+class SyntheticUpstream:
+    """
+    Responses in each upstream's shape, built from the local verse corpus.
+    The asset is taken to be AlQuran.cloud's edition; the other upstreams get
+    the differences the real ones have:
+        quran.com   the bismillah is not part of verse 1 (except in Al-Fatiha)
+        tanzil      uthmani-min: the bismillah is an attribute of verse 1 and
+                    pause marks are left out
+    """
+
+    EDITIONS = ("alquran.cloud", "quran.com", "tanzil")
+
+    def __init__(self, asset=DEFAULT_ASSET):
+        self.asset = Path(asset)
+        self._verses = None
+        self._editions = {}
+        self._lock = threading.Lock()
+        self.routes = [
+            (re.compile(r"^/api\.quran\.com/api/v4/verses/by_page/(\d+)$"), self.quran_com_page),
+            (re.compile(r"^/api\.quran\.com/api/v4/chapters$"), self.quran_com_chapters),
+            (re.compile(r"^/api\.quran\.com/api/v4/quran/verses/uthmani$"), self.quran_com_uthmani),
+            (re.compile(r"^/api\.alquran\.cloud/v1/page/(\d+)/quran-uthmani$"), self.alquran_page),
+            (re.compile(r"^/tanzil\.net/pub/download/get_xml\.php$"), self.tanzil_xml),
+        ]
+
+    def verses(self, edition="alquran.cloud"):
+        """[(number, surah, ayah, page, text)] of an upstream's edition in mushaf order, built once"""
+        with self._lock:
+            if self._verses is None:
+                from verse_corpus import verses_from_page_text
+
+                with open(self.asset, encoding="utf-8") as f:
+                    quran_text = json.load(f)
+                self._verses = [(number, *verse) for number, verse
+                                in enumerate(verses_from_page_text(quran_text), 1)]
+            if edition not in self._editions:
+                self._editions[edition] = [(number, surah, ayah, page, self._edition_text(edition, text))
+                                           for number, surah, ayah, page, text in self._verses]
+            return self._editions[edition]
+
+    @staticmethod
+    def _edition_text(edition, text):
+        if edition == "alquran.cloud":
+            return text
+        if text.startswith(BISMILLAH + " "):
+            text = text[len(BISMILLAH) + 1:]
+        if edition == "tanzil":
+            text = _PAUSE_MARKS.sub("", text).strip()
+        return text
+
+    def respond(self, path, params):
+        """(status, content_type, body) for a known endpoint, or None"""
+        for pattern, handler in self.routes:
+            match = pattern.match(path)
+            if match:
+                return handler(params, *map(int, match.groups()))
+        return None
+
+    @staticmethod
+    def _json(payload, status=200):
+        return status, "application/json", json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+    @staticmethod
+    def _quran_com_verse(number, surah, ayah, page, text):
+        return {
+            "id": number,
+            "verse_number": ayah,
+            "verse_key": f"{surah}:{ayah}",
+            "page_number": page,
+            "juz_number": juz_for_page(page),
+            "text_uthmani": text,
+        }
+
+    def quran_com_page(self, params, page):
+        if not 1 <= page <= TOTAL_PAGES:
+            return self._json({"status": 404, "error": "Page not found"}, 404)
+        verses = [self._quran_com_verse(*verse) for verse in self.verses("quran.com") if verse[3] == page]
+        return self._json({
+            "verses": verses,
+            "pagination": {"per_page": len(verses), "current_page": 1, "next_page": None,
+                           "total_pages": 1, "total_records": len(verses)},
+        })
+
+    def quran_com_chapters(self, params):
+        pages = {}
+        for _, surah, _, page, _ in self.verses():
+            first, _ = pages.get(surah, (page, page))
+            pages[surah] = (first, page)
+        return self._json({"chapters": [
+            {"id": surah, "name_simple": f"Surah {surah}", "name_arabic": "",
+             "verses_count": SURAH_AYAH_COUNTS[surah - 1], "pages": list(pages[surah])}
+            for surah in range(1, TOTAL_SURAHS + 1)
+        ]})
+
+    def quran_com_uthmani(self, params):
+        chapter = params.get("chapter_number")
+        return self._json({"verses": [
+            self._quran_com_verse(*verse) for verse in self.verses("quran.com")
+            if chapter is None or str(verse[1]) == chapter
+        ]})
+
+    def alquran_page(self, params, page):
+        if not 1 <= page <= TOTAL_PAGES:
+            return self._json({"code": 404, "status": "Not Found", "data": "Page not found"}, 404)
+        ayahs = [
+            {"number": number, "text": text, "numberInSurah": ayah, "page": page,
+             "juz": juz_for_page(page), "surah": {"number": surah}}
+            for number, surah, ayah, verse_page, text in self.verses() if verse_page == page
+        ]
+        return self._json({"code": 200, "status": "OK", "data": {"number": page, "ayahs": ayahs}})
+
+    def tanzil_xml(self, params):
+        lines = ['<?xml version="1.0" encoding="utf-8"?>', "<quran>"]
+        current_surah = None
+        bismillah = f" bismillah={quoteattr(BISMILLAH)}"
+        for _, surah, ayah, page, text in self.verses("tanzil"):
+            if surah != current_surah:
+                if current_surah is not None:
+                    lines.append("</sura>")
+                lines.append(f'<sura index="{surah}">')
+                current_surah = surah
+            extra = bismillah if ayah == 1 and surah not in (1, 9) else ""
+            lines.append(f'<aya index="{ayah}" page="{page}" text={quoteattr(text)}{extra}/>')
+        lines.extend(["</sura>", "</quran>"])
+        return 200, "application/xml", "\n".join(lines).encode("utf-8")
+
+
+class FaultInjector:
+    """Seeded latency, 5xx and 429 decisions, plus an optional server-side rate limit"""
+
+    def __init__(self, latency=0.0, jitter=0.5, error_rate=0.0, throttle_rate=0.0,
+                 max_rps=None, seed=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.max_rps = max_rps
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._tokens = max_rps or 0
+        self._refilled = time.monotonic()
+
+    def delay(self):
+        with self._lock:
+            spread = self._random.uniform(1 - self.jitter, 1 + self.jitter)
+        return max(0.0, self.latency * spread)
+
+    def _over_limit(self):
+        """Token bucket of max_rps requests per second (caller holds the lock)"""
+        now = time.monotonic()
+        self._tokens = min(self.max_rps, self._tokens + (now - self._refilled) * self.max_rps)
+        self._refilled = now
+        if self._tokens < 1:
+            return True
+        self._tokens -= 1
+        return False
+
+    def fault(self):
+        """429, 503 or None for the next request"""
+        with self._lock:
+            if self.max_rps and self._over_limit():
+                return 429
+            roll = self._random.random()
+        if roll < self.throttle_rate:
+            return 429
+        if roll < self.throttle_rate + self.error_rate:
+            return 503
+        return None
+
+
+class MockUpstream:
+    """
+    Threaded local server; use as a context manager or start()/stop().
+    Lookup order per request: injected fault, recorded fixture, live upstream
+    (record mode only, saved as a new fixture), synthesized response, 404.
+    """
+
+    def __init__(self, port=0, host="127.0.0.1", fixtures=FIXTURE_DIR, asset=DEFAULT_ASSET,
+                 record=False, faults=None):
+        self.fixtures = FixtureStore(fixtures)
+        self.synthetic = SyntheticUpstream(asset)
+        self.record = record
+        self.faults = faults or FaultInjector()
+        self.stats = Counter()
+        self._stats_lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self.url
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def serve_forever(self):
+        """Serve in the calling thread until interrupted"""
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def count(self, key, amount=1):
+        with self._stats_lock:
+            self.stats[key] += amount
+
+    def snapshot(self):
+        with self._stats_lock:
+            return dict(self.stats)
+
+    def resolve(self, path, params):
+        """(status, content_type, body, origin) for a request that passed fault injection"""
+        recorded = self.fixtures.load(path, params)
+        if recorded is not None:
+            return (*recorded, "fixture")
+        if self.record:
+            live = _fetch_live(path, params)
+            if live is not None:
+                self.fixtures.save(path, params, *live)
+                return (*live, "recorded")
+        synthesized = self.synthetic.respond(path, params)
+        if synthesized is not None:
+            return (*synthesized, "synthetic")
+        return 404, "application/json", b'{"error": "no fixture for this endpoint"}', "missing"
+
+
+def _fetch_live(path, params):
+    """Fetch <host>/<path> from the real upstream for record mode"""
+    import requests
+
+    try:
+        response = requests.get("https://" + path.lstrip("/"), params=params, timeout=60)
+    except requests.RequestException:
+        return None
+    content_type = response.headers.get("Content-Type", "application/octet-stream")
+    return response.status_code, content_type, response.content
+
+
+def _make_handler(upstream):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive, like the real hosts
+        disable_nagle_algorithm = True  # headers and body go out in separate writes
+
+        def do_GET(self):
+            parts = urlsplit(self.path)
+            if parts.path == "/__stats":
+                self._send(200, "application/json", json.dumps(upstream.snapshot()).encode("utf-8"))
+                return
+
+            upstream.count("requests")
+            time.sleep(upstream.faults.delay())
+
+            fault = upstream.faults.fault()
+            if fault == 429:
+                upstream.count("status_429")
+                self._send(429, "application/json", b'{"error": "rate limited"}',
+                           {"Retry-After": str(RETRY_AFTER)})
+                return
+            if fault is not None:
+                upstream.count(f"status_{fault}")
+                self._send(fault, "application/json", b'{"error": "injected failure"}')
+                return
+
+            params = dict(parse_qsl(parts.query, keep_blank_values=True))
+            try:
+                status, content_type, body, origin = upstream.resolve(parts.path, params)
+            except Exception as e:  # answer like a broken upstream instead of dropping the connection
+                status, content_type, origin = 500, "application/json", "error"
+                body = json.dumps({"error": f"{type(e).__name__}: {e}"}).encode("utf-8")
+            upstream.count(f"status_{status}")
+            upstream.count(f"origin_{origin}")
+            upstream.count("bytes", len(body))
+            self._send(status, content_type, body)
+
+        def _send(self, status, content_type, body, headers=None):
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            # Chunked writes so large bodies (Tanzil XML) stream like the real thing
+            for start in range(0, len(body), CHUNK_SIZE):
+                self.wfile.write(body[start:start + CHUNK_SIZE])
+
+        def log_message(self, format, *args):
+            pass  # request lines would drown the downloader's own output
+
+    return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve recorded/synthesized Quran API responses locally")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--fixtures", default=str(FIXTURE_DIR))
+    parser.add_argument("--asset", default=str(DEFAULT_ASSET),
+                        help="asset used to synthesize responses that were never recorded")
+    parser.add_argument("--record", action="store_true",
+                        help="fetch fixture misses from the real upstream and save them")
+    parser.add_argument("--latency", type=float, default=0.0, help="mean response delay in seconds")
+    parser.add_argument("--jitter", type=float, default=0.5, help="latency spread, +/- fraction of the mean")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered 503")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="fraction of requests answered 429")
+    parser.add_argument("--max-rps", type=float, help="answer 429 above this many requests per second")
+    parser.add_argument("--seed", type=int, help="seed for reproducible fault injection")
+    args = parser.parse_args()
+
+    faults = FaultInjector(args.latency, args.jitter, args.error_rate, args.throttle_rate,
+                           args.max_rps, args.seed)
+    upstream = MockUpstream(args.port, args.host, args.fixtures, args.asset, args.record, faults)
+    print(f"[OK] Mock upstream on {upstream.url}")
+    print(f"     export QURAN_UPSTREAM={upstream.url} QURAN_HTTP_CACHE=0")
+    try:
+        upstream.serve_forever()
+    except KeyboardInterrupt:
+        print("\n" + json.dumps(upstream.snapshot()))
+
+
+if __name__ == "__main__":
+    main()
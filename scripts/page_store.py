@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Indexed binary page store: read one page without parsing the whole Quran
+
+Layout (all integers little-endian):
+    header   magic b"QPGS", u16 version, u16 page_count
+    table    page_count x (u32 offset, u32 length), entry i = page i + 1
+    blob     UTF-8 page texts back to back; offsets are relative to the blob
+
+A missing page has length 0. Reading page N is two seeks: 8 bytes from the
+table, then `length` bytes from the blob.
+
+Usage:
+    python scripts/page_store.py                       # json asset -> .bin
+    python scripts/page_store.py --page 604            # print one page from the .bin
+"""
+
+import argparse
+import json
+import struct
+import sys
+from pathlib import Path
+
+from asset_manifest import write_if_changed
+from quran_meta import TOTAL_PAGES
+
+MAGIC = b"QPGS"
+VERSION = 1
+HEADER = struct.Struct("<4sHH")
+ENTRY = struct.Struct("<II")
+
+DEFAULT_JSON = Path("assets/quran/quran_text.json")
+DEFAULT_STORE = Path("assets/quran/quran_text.bin")
+
+
+def encode_page_store(quran_text, page_count=TOTAL_PAGES):
+    """Build the page store bytes from {str(page): text}"""
+    table = bytearray()
+    blob = bytearray()
+    for page in range(1, page_count + 1):
+        data = quran_text.get(str(page), "").encode("utf-8")
+        table += ENTRY.pack(len(blob), len(data))
+        blob += data
+    return HEADER.pack(MAGIC, VERSION, page_count) + bytes(table) + bytes(blob)
+
+
+def write_page_store(quran_text, path=DEFAULT_STORE, page_count=TOTAL_PAGES):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = encode_page_store(quran_text, page_count)
+    write_if_changed(path, data)
+    return len(data)
+
+
+class PageStoreReader:
+    """Random access to single pages of a page store file"""
+
+    def __init__(self, path=DEFAULT_STORE):
+        self._file = open(path, "rb")
+        magic, version, self.page_count = HEADER.unpack(self._file.read(HEADER.size))
+        if magic != MAGIC or version != VERSION:
+            self._file.close()
+            raise ValueError(f"{path} is not a version {VERSION} page store")
+        self._blob_start = HEADER.size + self.page_count * ENTRY.size
+
+    def read_page(self, page_number):
+        """Text of one page, or None if the page is absent"""
+        if not 1 <= page_number <= self.page_count:
+            return None
+        self._file.seek(HEADER.size + (page_number - 1) * ENTRY.size)
+        offset, length = ENTRY.unpack(self._file.read(ENTRY.size))
+        if not length:
+            return None
+        self._file.seek(self._blob_start + offset)
+        return self._file.read(length).decode("utf-8")
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def read_page(path, page_number):
+    with PageStoreReader(path) as reader:
+        return reader.read_page(page_number)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or read the indexed binary page store")
+    parser.add_argument("--input", default=str(DEFAULT_JSON), help="quran_text.json to convert")
+    parser.add_argument("--output", default=str(DEFAULT_STORE), help="page store file")
+    parser.add_argument("--page", type=int, help="print one page from --output instead of building")
+    args = parser.parse_args()
+
+    if args.page:
+        sys.stdout.reconfigure(encoding="utf-8")
+        text = read_page(args.output, args.page)
+        print(text if text is not None else f"[ERROR] Page {args.page} not in {args.output}")
+        return
+
+    with open(args.input, encoding="utf-8") as f:
+        quran_text = json.load(f)
+    size = write_page_store(quran_text, args.output)
+    print(f"[OK] {args.output}: {len(quran_text)} pages, {size / 1024:.2f} KB")
+
+
+if __name__ == "__main__":
+    main()
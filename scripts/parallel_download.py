@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Concurrent page downloader with a shared rate budget
+Used by the per-page strategies to pipeline the 604 requests
+"""
+
+import threading
+import time
+
+from stream_pipeline import Stage, run_stages
+
+DEFAULT_WORKERS = 8
+# No fixed requests-per-second cap: quran_http paces every host with an adaptive
+# (AIMD) window instead. A number here caps the total on top of that.
+DEFAULT_RATE = None
+
+
+class RateLimiter:
+    """Spaces request start times so all threads together stay under `rate`/s"""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate and rate > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_slot = time.monotonic()
+
+    def wait(self):
+        """Block until the caller is allowed to start its next request"""
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+def download_pages_concurrently(fetch_page, page_numbers, workers=DEFAULT_WORKERS,
+                                rate=DEFAULT_RATE, on_result=None):
+    """
+    Call `fetch_page(page_number)` for every page on `workers` threads.
+
+    `fetch_page` returns the page text or None on failure. `on_result`, if
+    given, is called as `on_result(page_number, text)` as each page finishes
+    (in completion order, from the calling thread).
+
+    Returns (quran_text, failed_pages) with quran_text keyed by str(page).
+    """
+    limiter = RateLimiter(rate)
+
+    def limited_fetch(page_number):
+        limiter.wait()
+        try:
+            return [(page_number, fetch_page(page_number))]
+        except Exception:
+            return [(page_number, None)]
+
+    quran_text = {}
+    failed_pages = []
+
+    # Pages are handed to the workers through a bounded queue; results stream
+    # back to this thread as each page finishes
+    for page_number, page_text in run_stages(page_numbers, Stage(limited_fetch, workers=workers)):
+        if page_text:
+            quran_text[str(page_number)] = page_text
+        else:
+            failed_pages.append(page_number)
+
+        if on_result:
+            on_result(page_number, page_text)
+
+    # Keep output order stable regardless of completion order
+    quran_text = {key: quran_text[key] for key in sorted(quran_text, key=int)}
+    failed_pages.sort()
+    return quran_text, failed_pages
+
+
+def print_page_result(total_pages=604):
+    """Build an `on_result` callback that prints per-page progress lines"""
+    done = [0]
+    lock = threading.Lock()
+
+    def on_result(page_number, page_text):
+        with lock:
+            done[0] += 1
+            status = f"OK ({len(page_text)} chars)" if page_text else "FAILED"
+            print(f"Page {page_number:3d}/{total_pages}... {status}", flush=True)
+            if done[0] % 50 == 0:
+                print(f"\n[Progress] {done[0]}/{total_pages} pages completed\n", flush=True)
+
+    return on_result
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Append-only journal of downloaded pages
+Lets an interrupted download resume with only the missing pages
+"""
+
+import json
+import os
+from pathlib import Path
+
+# Scratch directory for build state (journals, caches); not shipped as an asset
+BUILD_DIR = Path(".quran_build")
+
+
+class PageJournal:
+    """
+    One JSON line per completed page: {"page": 12, "text": "..."}
+
+    Lines are flushed as soon as they are written, so a crash or Ctrl-C
+    loses at most the page that was being written. A torn last line is
+    ignored on load.
+    """
+
+    def __init__(self, name, directory=BUILD_DIR):
+        self.path = Path(directory) / f"{name}.journal.jsonl"
+        self._file = None
+
+    def load(self):
+        """Return {str(page): text} for every page recorded so far"""
+        pages = {}
+        if not self.path.exists():
+            return pages
+
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # partial line from an interrupted write
+                if entry.get("text"):
+                    pages[str(entry["page"])] = entry["text"]
+        return pages
+
+    def start(self, resume=False):
+        """Open the journal for appending; without `resume` old entries are discarded"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        torn_tail = False
+        if resume and self.path.exists() and self.path.stat().st_size:
+            with open(self.path, "rb") as f:
+                f.seek(-1, os.SEEK_END)
+                torn_tail = f.read(1) != b"\n"
+        self._file = open(self.path, "a" if resume else "w", encoding="utf-8")
+        if torn_tail:
+            # Terminate the partial line so the next entry starts cleanly
+            self._file.write("\n")
+        return self
+
+    def record(self, page_number, text):
+        """Append one completed page and push it to disk"""
+        if self._file is None:
+            self.start(resume=True)
+        self._file.write(json.dumps({"page": int(page_number), "text": text}, ensure_ascii=False) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def clear(self):
+        """Delete the journal once its pages have been saved to the final asset"""
+        self.close()
+        if self.path.exists():
+            self.path.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def missing_pages(done, total_pages=604):
+    """Page numbers (1..total_pages) not present in the `done` mapping"""
+    return [page for page in range(1, total_pages + 1) if str(page) not in done]
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+quran_text.json and the derived assets written next to it by every download script
+"""
+
+from pathlib import Path
+
+from arabic_normalize import build_normalized, write_normalized
+from asset_compress import print_size_report, write_compressed_variants
+from asset_manifest import (build_manifest, diff_pages, encode_asset, load_manifest,
+                            page_hashes, print_page_diff, write_if_changed, write_manifest)
+from asset_shards import current_shard_mode, write_shards
+from page_store import write_page_store
+from quran_sqlite import SQLITE_NAME, write_database
+from quran_validate import load_reference
+from trigram_index import build_trigram_index, write_trigram_index
+from verse_corpus import build_corpus, verses_from_page_text, write_corpus
+from word_index import build_word_index, write_word_index
+
+
+def write_derived_assets(quran_text, output_dir, shards=None):
+    """
+    Write the secondary formats for a freshly saved quran_text.json:
+    - quran_text.bin: indexed page store for single-page loading
+    - quran_text.min.json(.gz/.br): minified and precompressed web copies
+    - quran_corpus.json: verse-level columns + page/surah indexes
+    - quran_normalized.json: search-ready variants of every verse
+    - quran_word_index.json: inverted index of the normalized words
+    - quran_trigram_index.json: character trigram index for fuzzy search
+    - quran.sqlite: verses/pages tables with B-tree and FTS5 indexes
+      (all five skipped with a warning if the pages don't split into all 6236 verses)
+    - shards/ (when `shards` is "juz" or "page"): split files + manifest;
+      shards already on disk are rewritten in their mode when `shards` is None
+    Returns the paths of the files written (or already up to date).
+    """
+    written = [output_dir / "quran_text.bin"]
+    write_page_store(quran_text, written[0])
+
+    results = write_compressed_variants(quran_text, output_dir)
+    written.extend(path for path, _ in results)
+    json_file = output_dir / "quran_text.json"
+    print_size_report(results, json_file.stat().st_size if json_file.exists() else None)
+
+    try:
+        verses = list(verses_from_page_text(quran_text))
+        corpus = build_corpus(verses)
+        write_corpus(corpus, output_dir / "quran_corpus.json")
+        written.append(output_dir / "quran_corpus.json")
+        normalized = build_normalized(text for _, _, _, text in verses)
+        write_normalized(normalized, output_dir / "quran_normalized.json")
+        written.append(output_dir / "quran_normalized.json")
+        write_word_index(build_word_index(normalized["search"], [page for _, _, page, _ in verses]),
+                         output_dir / "quran_word_index.json")
+        written.append(output_dir / "quran_word_index.json")
+        write_trigram_index(build_trigram_index(normalized["search"]), output_dir / "quran_trigram_index.json")
+        written.append(output_dir / "quran_trigram_index.json")
+        write_database(corpus, normalized, quran_text, output_dir / SQLITE_NAME)
+        written.append(output_dir / SQLITE_NAME)
+    except ValueError as e:
+        print(f"   [WARNING] Verse corpus skipped: {e}")
+
+    # Existing shards are regenerated so they never lag behind quran_text.json
+    shards = shards or current_shard_mode(output_dir)
+    if shards:
+        manifest = write_shards(quran_text, output_dir, shards)
+        print(f"   Shards: {len(manifest['shards'])} {shards} files in {output_dir / 'shards'}")
+        written.append(output_dir / "shards" / "manifest.json")
+        written.extend(output_dir / "shards" / shard["file"] for shard in manifest["shards"])
+
+    return written
+
+
+def asset_edition(output_file):
+    """
+    Text edition the asset at output_file was fetched in: the one recorded in
+    its manifest or, for an asset without one (a fresh checkout), the edition
+    of the pinned reference. None if unknown or there is no asset yet.
+    """
+    output_file = Path(output_file)
+    manifest = load_manifest(output_file.parent)
+    if manifest is not None and "edition" in manifest:
+        return manifest["edition"]
+    reference = load_reference()
+    return reference["edition"] if reference and output_file.exists() else None
+
+
+def save_quran_assets(quran_text, output_file, shards=None, edition=None):
+    """
+    Write quran_text.json, its derived assets and quran_manifest.json,
+    leaving files whose content is unchanged untouched. `edition` is recorded
+    in the manifest (default: keep the asset's current one).
+    Returns (changed, added, removed) page numbers relative to the previous manifest.
+    """
+    output_file = Path(output_file)
+    output_dir = output_file.parent
+    output_dir.mkdir(parents=True, exist_ok=True)
+    if edition is None:
+        edition = asset_edition(output_file)
+
+    previous = load_manifest(output_dir)
+    hashes = page_hashes(quran_text)
+    diff = diff_pages(previous["pages"] if previous else {}, hashes)
+
+    asset_data = encode_asset(quran_text)
+    asset_written = write_if_changed(output_file, asset_data)
+    print(f"   {output_file.name}: {'written' if asset_written else 'unchanged'}")
+    print_page_diff(*diff, had_manifest=previous is not None)
+
+    files = write_derived_assets(quran_text, output_dir, shards=shards)
+    write_manifest(build_manifest(asset_data, hashes, output_dir, files, output_file.name, edition), output_dir)
+    return diff
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+One command line for the Quran text tooling
+Every subcommand imports what it needs when it runs: `verify`, `build-assets`
+and `stats` never load requests or the rest of the network stack, so they
+start in a few tens of milliseconds.
+
+Usage:
+    python scripts/quran_cli.py fetch                          # cheapest strategy, all 604 pages
+    python scripts/quran_cli.py fetch --strategy quran.com-page --workers 8 --resume --hedge
+    python scripts/quran_cli.py fetch --juz 30 --dry-run       # plan a partial rebuild
+    python scripts/quran_cli.py verify [--json]                # validate the asset + manifest
+    python scripts/quran_cli.py build-assets --shards juz
+    python scripts/quran_cli.py bench --workers 1,8,16         # options of bench_download.py
+    python scripts/quran_cli.py stats
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from asset_shards import SHARD_MODES
+from fetch_planner import ENDPOINTS, ENDPOINTS_BY_NAME
+from parallel_download import DEFAULT_RATE, DEFAULT_WORKERS
+from progress_journal import BUILD_DIR
+from quran_meta import TOTAL_PAGES, pages_for_juz, parse_page_spec
+
+DEFAULT_ASSET = "assets/quran/quran_text.json"
+# fetch_metrics.METRICS_DIR; not imported from there because that pulls in requests
+METRICS_FILE = BUILD_DIR / "metrics" / "metrics.json"
+
+
+def _utf8_stdout():
+    """Windows consoles default to a legacy code page; only fetch prints source text"""
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(encoding="utf-8")
+
+
+def _load_asset(path):
+    """quran_text.json as a dict, or None (with an error printed) if it can't be read"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"[ERROR] Cannot read {path}: {e}")
+        return None
+
+
+def _selected_pages(args):
+    if args.juz:
+        return sorted({page for juz in args.juz.split(",") for page in pages_for_juz(int(juz))})
+    if args.pages:
+        return parse_page_spec(args.pages)
+    return list(range(1, TOTAL_PAGES + 1))
+
+
+def cmd_fetch(args):
+    from fetch_metrics import report_run
+    from fetch_planner import plan_fetch, print_plans
+    from quran_assets import asset_edition
+    from quran_sources import DEFAULT_HEDGE_DELAY
+    import quran_pipeline
+
+    _utf8_stdout()
+    pages = _selected_pages(args)
+
+    # Only strategies serving the asset's edition (or the forced strategy's) are candidates
+    edition = ENDPOINTS_BY_NAME[args.strategy].edition if args.strategy else asset_edition(args.output)
+
+    print("=" * 70)
+    print(f"FETCH PLAN - {len(pages)} pages ({pages[0]}-{pages[-1]}), edition {edition or 'any'}")
+    print("=" * 70)
+
+    endpoints = ENDPOINTS
+    if args.hedge and not args.strategy:
+        # Only the per-page strategies can hedge a slow page
+        endpoints = [endpoint for endpoint in ENDPOINTS if endpoint.name in quran_pipeline.PAGE_STRATEGIES]
+    plans = plan_fetch(pages, workers=args.workers, endpoints=endpoints, edition=edition)
+    if not plans:
+        print(f"[ERROR] No {'per-page ' if args.hedge else ''}strategy serves edition {edition}")
+        return 1
+    if args.strategy:
+        plans.sort(key=lambda plan: plan.endpoint.name != args.strategy)
+    print_plans(plans)
+
+    edition = plans[0].endpoint.edition
+    try:
+        # Refuse before fetching anything: the pages couldn't be saved anyway
+        quran_pipeline.check_overlay(edition, pages, args.output)
+    except quran_pipeline.EditionMismatch as e:
+        print(f"\n[ERROR] {e}")
+        return 1
+    if args.dry_run:
+        return 0
+
+    print(f"\n[FETCH] {plans[0].endpoint.description}")
+    if len(plans) > 1:
+        print(f"Fallbacks (same edition): {', '.join(plan.endpoint.name for plan in plans[1:])}")
+    if args.workers > 1:
+        pacing = f"max {args.rate:g} requests/s" if args.rate else "adaptive pacing"
+        print(f"Mode: concurrent ({args.workers} workers, {pacing})")
+    print()
+
+    try:
+        pages_text, missing, strategies = quran_pipeline.fetch_with_fallback(
+            [plan.endpoint.name for plan in plans], pages, workers=args.workers, rate=args.rate,
+            resume=args.resume, hedge=args.hedge, hedge_delay=args.hedge_delay or DEFAULT_HEDGE_DELAY)
+
+        print(f"\n[RESULT] Fetched {len(pages_text)}/{len(pages)} pages")
+        if missing:
+            print(f"[WARNING] Missing pages: {missing[:10]}{'...' if len(missing) > 10 else ''}")
+
+        # Pages that weren't requested (or failed) keep their current text
+        try:
+            quran_text = quran_pipeline.overlay_pages(pages_text, args.output, edition=edition)
+        except quran_pipeline.EditionMismatch as e:
+            print(f"\n[ERROR] Not saving: {e}")
+            print("[INFO] The fetched pages stay journaled; rerun with --resume to refetch only missing ones.")
+            return 1
+        if args.no_save:
+            return 0 if quran_pipeline.validate(quran_text, edition) and not missing else 1
+        if not quran_pipeline.save_and_verify(quran_text, args.output, shards=args.shards, edition=edition):
+            print("[INFO] The fetched pages stay journaled; rerun with --resume to refetch only missing ones.")
+            return 1
+        if not missing:
+            for strategy in strategies:
+                quran_pipeline.clear_journal(strategy)
+        return 1 if missing else 0
+    except KeyboardInterrupt:
+        print("\n\n[CANCELLED] Download cancelled by user.")
+        print("[INFO] Rerun with --resume to continue where this run stopped.")
+        return 130
+    finally:
+        report_run()
+
+
+def cmd_verify(args):
+    from asset_manifest import MANIFEST_NAME, diff_pages, load_manifest, page_hashes, sha256_hex
+    from quran_validate import load_reference, print_report, validate_quran_text
+
+    path = Path(args.input)
+    quran_text = _load_asset(path)
+    if quran_text is None:
+        return 1
+    # The manifest is optional (it appears after the first save); a stale one is a failure
+    manifest = load_manifest(path.parent)
+    edition = manifest.get("edition") if manifest is not None else None
+    report = validate_quran_text(quran_text, None if args.no_reference else load_reference(), edition)
+    if manifest is not None:
+        changed, added, removed = diff_pages(manifest["pages"], page_hashes(quran_text))
+        report["manifest"] = {
+            "changed": changed,
+            "added": added,
+            "removed": removed,
+            "asset_changed": sha256_hex(path.read_bytes()) != manifest["asset"]["sha256"],
+        }
+        report["ok"] = report["ok"] and not (changed or added or removed or report["manifest"]["asset_changed"])
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+        if manifest is None:
+            print(f"   Manifest: no {MANIFEST_NAME} yet")
+        else:
+            stale = {label: pages for label, pages in report["manifest"].items() if pages}
+            print(f"   Manifest: {'stale ' + str(stale) if stale else 'up to date'}")
+    return 0 if report["ok"] else 1
+
+
+def cmd_build_assets(args):
+    from quran_assets import asset_edition, save_quran_assets
+    from quran_validate import load_reference, print_report, validate_quran_text
+
+    path = Path(args.input)
+    quran_text = _load_asset(path)
+    if quran_text is None:
+        return 1
+
+    print("[VALIDATION]")
+    report = validate_quran_text(quran_text, load_reference(), asset_edition(path))
+    print_report(report)
+    if not report["ok"]:
+        print("[ERROR] Not building: validation failed")
+        return 1
+
+    print("\n[ASSETS]")
+    # Unchanged files (and their mtimes) are left as they are
+    save_quran_assets(quran_text, path, shards=args.shards)
+    return 0
+
+
+def cmd_bench(args, bench_args):
+    from bench_download import main as bench_main
+
+    bench_main(bench_args)
+    return 0
+
+
+def cmd_stats(args):
+    from asset_manifest import load_manifest
+    from bench_download import BENCH_DIR
+    from quran_validate import VERSE_SEPARATOR
+
+    path = Path(args.input)
+    print("[ASSET]")
+    quran_text = _load_asset(path) if path.exists() else None
+    if quran_text is None:
+        print(f"   {path}: missing")
+    else:
+        verses = sum(text.count(VERSE_SEPARATOR) + 1 for text in quran_text.values())
+        print(f"   {path}: {len(quran_text)} pages, {verses} verses, {path.stat().st_size / 1024:.0f} KB")
+
+    manifest = load_manifest(path.parent)
+    if manifest is not None:
+        for name in manifest["files"]:
+            derived = path.parent / name
+            if derived.exists() and "/" not in name:
+                print(f"   {name}: {derived.stat().st_size / 1024:.0f} KB")
+        shards = [name for name in manifest["files"] if name.startswith("shards/")]
+        if shards:
+            print(f"   shards/: {len(shards)} files")
+
+    print("\n[BUILD STATE]")
+    subdirs = sorted(entry for entry in BUILD_DIR.iterdir() if entry.is_dir()) if BUILD_DIR.exists() else []
+    journals = sorted(BUILD_DIR.glob("*.journal.jsonl"))
+    if not (subdirs or journals):
+        print(f"   {BUILD_DIR}: empty")
+    for subdir in subdirs:
+        files = [file for file in subdir.rglob("*") if file.is_file()]
+        print(f"   {subdir.name}/: {len(files)} files, {sum(f.stat().st_size for f in files) / 1024:.0f} KB")
+    for journal in journals:
+        with open(journal, encoding="utf-8") as f:
+            print(f"   {journal.name}: {sum(1 for _ in f)} pages journaled (resumable)")
+
+    if METRICS_FILE.exists():
+        print("\n[LAST FETCH]")
+        with open(METRICS_FILE, encoding="utf-8") as f:
+            metrics = json.load(f)
+        for host, stats in metrics["hosts"].items():
+            statuses = " ".join(f"{status}:{count}" for status, count in sorted(stats["status"].items()))
+            print(f"   {host}: {stats['requests']} requests, {stats['bytes'] / 1024:.0f} KB  {statuses}")
+
+    runs = sorted(BENCH_DIR.glob("bench-*.json")) if BENCH_DIR.exists() else []
+    if runs:
+        print(f"\n[LAST BENCH] {runs[-1].name}")
+        with open(runs[-1], encoding="utf-8") as f:
+            results = json.load(f)["results"]
+        for result in results:
+            if "wall_s" in result:
+                print(f"   {result['strategy']:<20} {result['workers']:>3} workers {result['wall_s']:>8.2f}s")
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Download, verify and build the Quran text assets")
+    commands = parser.add_subparsers(dest="command", required=True, metavar="command")
+
+    fetch = commands.add_parser("fetch", help="download pages, validate and save the asset")
+    scope = fetch.add_mutually_exclusive_group()
+    scope.add_argument("--pages", help="page numbers/ranges, e.g. 1-20,604 (default: all)")
+    scope.add_argument("--juz", help="juz numbers, e.g. 30 or 1,2")
+    fetch.add_argument("--strategy", choices=sorted(ENDPOINTS_BY_NAME),
+                       help="force a strategy and its edition "
+                            "(default: the cheapest one serving the asset's edition)")
+    fetch.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                       help=f"concurrent requests (default {DEFAULT_WORKERS}, 1 = sequential)")
+    fetch.add_argument("--rate", type=float, default=DEFAULT_RATE,
+                       help="max requests per second across all workers "
+                            "(default: no cap, adaptive_rate paces each host)")
+    fetch.add_argument("--resume", action="store_true",
+                       help="reuse pages journaled by an interrupted run and fetch only the missing ones")
+    fetch.add_argument("--hedge", action="store_true",
+                       help="race slow pages against a second request to the same source (per-page strategies)")
+    fetch.add_argument("--hedge-delay", type=float,
+                       help="seconds before a slow page is requested again "
+                            "(default: quran_sources.DEFAULT_HEDGE_DELAY)")
+    fetch.add_argument("--output", default=DEFAULT_ASSET, help="asset to merge pages into")
+    fetch.add_argument("--shards", choices=SHARD_MODES, help="also write per-juz or per-page shards")
+    fetch.add_argument("--dry-run", action="store_true", help="only print the plans")
+    fetch.add_argument("--no-save", action="store_true", help="fetch and validate, but leave the asset alone")
+
+    verify = commands.add_parser("verify", help="validate the asset and check it against its manifest")
+    verify.add_argument("--input", default=DEFAULT_ASSET)
+    verify.add_argument("--json", action="store_true", help="print the report as JSON")
+    verify.add_argument("--no-reference", action="store_true", help="skip the per-page checksum check")
+
+    build = commands.add_parser("build-assets", help="rebuild the derived assets from quran_text.json")
+    build.add_argument("--input", default=DEFAULT_ASSET)
+    build.add_argument("--shards", choices=SHARD_MODES, help="also write per-juz or per-page shards")
+
+    commands.add_parser("bench", help="benchmark the download strategies (bench_download.py options)",
+                        add_help=False)
+
+    stats = commands.add_parser("stats", help="asset sizes, build state and the last fetch/bench")
+    stats.add_argument("--input", default=DEFAULT_ASSET)
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args, extra = parser.parse_known_args(argv)
+    if args.command == "bench":
+        return cmd_bench(args, extra)
+    if extra:
+        parser.error(f"unrecognized arguments: {' '.join(extra)}")
+
+    handlers = {
+        "fetch": cmd_fetch,
+        "verify": cmd_verify,
+        "build-assets": cmd_build_assets,
+        "stats": cmd_stats,
+    }
+    return handlers[args.command](args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP client for the Quran download scripts
+One pooled keep-alive session instead of a new TCP+TLS handshake per request
+GET responses go through the on-disk cache in http_cache.py
+Every request is timed into fetch_metrics.METRICS and bounded per host by adaptive_rate
+"""
+
+import os
+import threading
+from urllib.parse import urlsplit
+
+import requests
+
+from adaptive_rate import AdaptiveRateLimiter
+from fetch_metrics import METRICS, TimedHTTPAdapter
+from http_cache import HttpCache, to_response
+
+# Connections kept open per upstream host (should cover the worker count)
+HOST_POOL_SIZES = {
+    "https://api.quran.com/": 16,
+    "https://api.alquran.cloud/": 16,
+    "https://tanzil.net/": 2,
+}
+DEFAULT_POOL_SIZE = 4
+
+USER_AGENT = "hatim-quran-downloader/1.0"
+
+try:
+    import brotli  # noqa: F401  (urllib3 decodes br when available)
+    ACCEPT_ENCODING = "br, gzip, deflate"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+
+# Set QURAN_HTTP_CACHE=0 to always go to the network
+CACHE_ENABLED = os.environ.get("QURAN_HTTP_CACHE", "1") != "0"
+
+# Set QURAN_UPSTREAM=http://127.0.0.1:8750 to send every upstream request to a
+# local stand-in (mock_upstream.py): https://api.quran.com/x -> <base>/api.quran.com/x
+UPSTREAM = os.environ.get("QURAN_UPSTREAM", "").rstrip("/")
+
+# Set QURAN_ADAPTIVE_RATE=0 to send requests unbounded (only --rate / --workers limit them)
+ADAPTIVE_RATE = os.environ.get("QURAN_ADAPTIVE_RATE", "1") != "0"
+
+_session = None
+_session_lock = threading.Lock()
+_cache = HttpCache()
+_limiters = {}
+
+
+def _build_session():
+    session = requests.Session()
+    session.headers.update({
+        "User-Agent": USER_AGENT,
+        "Accept-Encoding": ACCEPT_ENCODING,
+        "Connection": "keep-alive",
+    })
+
+    default_adapter = TimedHTTPAdapter(pool_connections=len(HOST_POOL_SIZES) + 1,
+                                       pool_maxsize=DEFAULT_POOL_SIZE)
+    session.mount("https://", default_adapter)
+    session.mount("http://", default_adapter)
+
+    # Longer prefixes win in requests, so each host gets its own pool size
+    for prefix, pool_size in HOST_POOL_SIZES.items():
+        session.mount(prefix, TimedHTTPAdapter(pool_connections=1, pool_maxsize=pool_size))
+    if UPSTREAM:
+        session.mount(UPSTREAM + "/", TimedHTTPAdapter(pool_connections=1,
+                                                       pool_maxsize=max(HOST_POOL_SIZES.values())))
+
+    return session
+
+
+def set_upstream(base_url):
+    """Redirect upstream hosts to base_url (None restores the real hosts)"""
+    global UPSTREAM
+    close()
+    UPSTREAM = (base_url or "").rstrip("/")
+
+
+def route(url):
+    """The URL actually requested for an upstream URL (see QURAN_UPSTREAM)"""
+    if UPSTREAM and url.startswith(tuple(HOST_POOL_SIZES)):
+        return f"{UPSTREAM}/{url.split('://', 1)[1]}"
+    return url
+
+
+def limiter_for(url):
+    """The adaptive limiter of an upstream URL's host (None when pacing is off)"""
+    if not ADAPTIVE_RATE:
+        return None
+    host = urlsplit(url).netloc
+    with _session_lock:
+        if host not in _limiters:
+            _limiters[host] = AdaptiveRateLimiter()
+        return _limiters[host]
+
+
+def rate_summary():
+    """{host: (current window of requests in flight, throttled responses)} for the run so far"""
+    with _session_lock:
+        return {host: (limiter.window, limiter.throttled) for host, limiter in _limiters.items()}
+
+
+def _send(url, limiter, **kwargs):
+    """session.get() within the host's limiter window, which learns from the response"""
+    if limiter is None:
+        return get_session().get(url, **kwargs)
+    limiter.acquire()
+    status = retry_after = None
+    try:
+        response = get_session().get(url, **kwargs)
+        status, retry_after = response.status_code, response.headers.get("Retry-After")
+        return response
+    finally:
+        # Streamed bodies are read after this; the slot covers the request up to its headers
+        limiter.release(status, retry_after)
+
+
+def get_session():
+    """Return the process-wide pooled session, creating it on first use"""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+def get(url, params=None, timeout=10, cache=CACHE_ENABLED, **kwargs):
+    """
+    Drop-in replacement for requests.get() that reuses pooled connections.
+
+    With `cache`, a fresh cached copy is returned without touching the
+    network; a stale one is revalidated and reused on 304 Not Modified.
+    Responses served from disk have `response.from_cache = True`.
+    """
+    with METRICS.track(url) as record:
+        limiter = limiter_for(url)
+        url = route(url)
+        if not cache:
+            response = _send(url, limiter, params=params, timeout=timeout, **kwargs)
+            _record_response(record, response, kwargs.get("stream", False))
+            response.from_cache = False
+            return response
+
+        meta, body = _cache.lookup(url, params)
+        if meta is not None and _cache.is_fresh(meta):
+            record.status, record.cache, record.bytes = "cached", "hit", len(body)
+            return to_response(meta, body)
+
+        headers = dict(kwargs.pop("headers", None) or {})
+        if meta is not None:
+            headers.update(_cache.conditional_headers(meta))
+
+        response = _send(url, limiter, params=params, timeout=timeout, headers=headers, **kwargs)
+        _record_response(record, response, kwargs.get("stream", False))
+
+        if response.status_code == 304 and meta is not None:
+            _cache.touch(url, params, response)
+            record.cache, record.bytes = "revalidated", len(body)
+            return to_response(meta, body)
+        record.cache = "miss"
+        if response.status_code == 200:
+            _cache.store(url, params, response)
+        response.from_cache = False
+        return response
+
+
+def _record_response(record, response, stream=False):
+    record.status = response.status_code
+    record.ttfb = response.elapsed.total_seconds()  # request sent -> headers parsed
+    if not stream:
+        record.bytes = len(response.content)
+
+
+def iter_content(url, params=None, timeout=30, chunk_size=64 * 1024, cache=CACHE_ENABLED):
+    """
+    Yield the response body in chunks without buffering it in memory.
+    Cached bodies are replayed from disk; a fresh download is written to the
+    cache as it streams. Raises requests.HTTPError for non-200 responses.
+    """
+    with METRICS.track(url) as record:
+        limiter = limiter_for(url)
+        url = route(url)
+        meta = None
+        if cache:
+            meta, body_path = _cache.lookup_file(url, params)
+            if meta is not None and _cache.is_fresh(meta):
+                record.status, record.cache = "cached", "hit"
+                yield from _counted(record, _replay(body_path, chunk_size))
+                return
+
+        headers = _cache.conditional_headers(meta) if meta is not None else {}
+        response = _send(url, limiter, params=params, timeout=timeout, headers=headers, stream=True)
+        record.status = response.status_code
+        record.ttfb = response.elapsed.total_seconds()
+        with response:
+            if response.status_code == 304 and meta is not None:
+                _cache.touch(url, params, response)
+                record.cache = "revalidated"
+                yield from _counted(record, _replay(body_path, chunk_size))
+                return
+            if response.status_code != 200:
+                raise requests.HTTPError(f"HTTP {response.status_code}", response=response)
+
+            record.cache = "miss" if cache else None
+            chunks = response.iter_content(chunk_size=chunk_size)
+            if cache:
+                chunks = _cache.store_stream(url, params, response, chunks)
+            yield from _counted(record, chunks)
+
+
+def _counted(record, chunks):
+    for chunk in chunks:
+        record.bytes += len(chunk)
+        yield chunk
+
+
+def _replay(body_path, chunk_size):
+    with open(body_path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+def discard_cached(url, params=None):
+    _cache.discard(route(url), params)
+
+
+def clear_cache():
+    _cache.clear()
+
+
+def close():
+    """Close all pooled connections (optional; the process exit does this too)"""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
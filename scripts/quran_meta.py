@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Static Quran structure shared by the build scripts (Madinah Mushaf, 604 pages)
+Juz page ranges mirror QuranData.juzList in lib/utils/quran_data.dart
+"""
+
+TOTAL_PAGES = 604
+TOTAL_SURAHS = 114
+TOTAL_VERSES = 6236
+
+# Text editions: every source and fetch strategy of one edition serves
+# byte-identical pages, so only those may be mixed within one asset
+EDITION_QURAN_COM = "quran.com/text_uthmani"  # bismillah not part of verse 1
+EDITION_ALQURAN_CLOUD = "alquran.cloud/quran-uthmani"  # bismillah merged into verse 1
+EDITION_TANZIL = "tanzil/uthmani-min"
+
+# Ayah count per surah (index 0 = surah 1)
+SURAH_AYAH_COUNTS = [
+    7, 286, 200, 176, 120, 165, 206, 75, 129, 109, 123, 111, 43, 52, 99, 128,
+    111, 110, 98, 135, 112, 78, 118, 64, 77, 227, 93, 88, 69, 60, 34, 30, 73,
+    54, 45, 83, 182, 88, 75, 85, 54, 53, 89, 59, 37, 35, 38, 29, 18, 45, 60,
+    49, 62, 55, 78, 96, 29, 22, 24, 13, 14, 11, 11, 18, 12, 12, 30, 52, 52,
+    44, 28, 28, 20, 56, 40, 31, 50, 40, 46, 42, 29, 19, 36, 25, 22, 17, 19,
+    26, 30, 20, 15, 21, 11, 8, 8, 19, 5, 8, 8, 11, 11, 8, 3, 9, 5, 4, 7, 3,
+    6, 3, 5, 4, 5, 6,
+]
+
+# Page on which each surah starts (index 0 = surah 1)
+SURAH_START_PAGES = [
+    1, 2, 50, 77, 106, 128, 151, 177, 187, 208, 221, 235, 249, 255, 262, 267,
+    282, 293, 305, 312, 322, 332, 342, 350, 359, 367, 377, 385, 396, 404, 411,
+    415, 418, 428, 434, 440, 446, 453, 458, 467, 477, 483, 489, 496, 499, 502,
+    507, 511, 515, 518, 520, 523, 526, 528, 531, 534, 537, 542, 545, 549, 551,
+    553, 554, 556, 558, 560, 562, 564, 566, 568, 570, 572, 574, 575, 577, 578,
+    580, 582, 583, 585, 586, 587, 587, 589, 590, 591, 591, 592, 593, 594, 595,
+    595, 596, 596, 597, 597, 598, 598, 599, 599, 600, 600, 601, 601, 601, 602,
+    602, 602, 603, 603, 603, 604, 604, 604,
+]
+
+# Transliterated surah names (index 0 = surah 1), for offline builds
+SURAH_NAMES = [
+    "Al-Fatiha", "Al-Baqarah", "Ali Imran", "An-Nisa", "Al-Ma'idah",
+    "Al-An'am", "Al-A'raf", "Al-Anfal", "At-Tawbah", "Yunus", "Hud", "Yusuf",
+    "Ar-Ra'd", "Ibrahim", "Al-Hijr", "An-Nahl", "Al-Isra", "Al-Kahf", "Maryam",
+    "Taha", "Al-Anbya", "Al-Hajj", "Al-Mu'minun", "An-Nur", "Al-Furqan",
+    "Ash-Shu'ara", "An-Naml", "Al-Qasas", "Al-'Ankabut", "Ar-Rum", "Luqman",
+    "As-Sajdah", "Al-Ahzab", "Saba", "Fatir", "Ya-Sin", "As-Saffat", "Sad",
+    "Az-Zumar", "Ghafir", "Fussilat", "Ash-Shuraa", "Az-Zukhruf", "Ad-Dukhan",
+    "Al-Jathiyah", "Al-Ahqaf", "Muhammad", "Al-Fath", "Al-Hujurat", "Qaf",
+    "Adh-Dhariyat", "At-Tur", "An-Najm", "Al-Qamar", "Ar-Rahman", "Al-Waqi'ah",
+    "Al-Hadid", "Al-Mujadila", "Al-Hashr", "Al-Mumtahanah", "As-Saf",
+    "Al-Jumu'ah", "Al-Munafiqun", "At-Taghabun", "At-Talaq", "At-Tahrim",
+    "Al-Mulk", "Al-Qalam", "Al-Haqqah", "Al-Ma'arij", "Nuh", "Al-Jinn",
+    "Al-Muzzammil", "Al-Muddaththir", "Al-Qiyamah", "Al-Insan", "Al-Mursalat",
+    "An-Naba", "An-Nazi'at", "'Abasa", "At-Takwir", "Al-Infitar",
+    "Al-Mutaffifin", "Al-Inshiqaq", "Al-Buruj", "At-Tariq", "Al-A'la",
+    "Al-Ghashiyah", "Al-Fajr", "Al-Balad", "Ash-Shams", "Al-Layl", "Ad-Duhaa",
+    "Ash-Sharh", "At-Tin", "Al-'Alaq", "Al-Qadr", "Al-Bayyinah", "Az-Zalzalah",
+    "Al-'Adiyat", "Al-Qari'ah", "At-Takathur", "Al-'Asr", "Al-Humazah",
+    "Al-Fil", "Quraysh", "Al-Ma'un", "Al-Kawthar", "Al-Kafirun", "An-Nasr",
+    "Al-Masad", "Al-Ikhlas", "Al-Falaq", "An-Nas",
+]
+
+# Arabic surah names (index 0 = surah 1)
+SURAH_ARABIC_NAMES = [
+    "الفاتحة", "البقرة", "آل عمران", "النساء", "المائدة", "الأنعام", "الأعراف",
+    "الأنفال", "التوبة", "يونس", "هود", "يوسف", "الرعد", "إبراهيم", "الحجر",
+    "النحل", "الإسراء", "الكهف", "مريم", "طه", "الأنبياء", "الحج", "المؤمنون",
+    "النور", "الفرقان", "الشعراء", "النمل", "القصص", "العنكبوت", "الروم",
+    "لقمان", "السجدة", "الأحزاب", "سبأ", "فاطر", "يس", "الصافات", "ص", "الزمر",
+    "غافر", "فصلت", "الشورى", "الزخرف", "الدخان", "الجاثية", "الأحقاف", "محمد",
+    "الفتح", "الحجرات", "ق", "الذاريات", "الطور", "النجم", "القمر", "الرحمن",
+    "الواقعة", "الحديد", "المجادلة", "الحشر", "الممتحنة", "الصف", "الجمعة",
+    "المنافقون", "التغابن", "الطلاق", "التحريم", "الملك", "القلم", "الحاقة",
+    "المعارج", "نوح", "الجن", "المزمل", "المدثر", "القيامة", "الإنسان",
+    "المرسلات", "النبأ", "النازعات", "عبس", "التكوير", "الانفطار", "المطففين",
+    "الانشقاق", "البروج", "الطارق", "الأعلى", "الغاشية", "الفجر", "البلد",
+    "الشمس", "الليل", "الضحى", "الشرح", "التين", "العلق", "القدر", "البينة",
+    "الزلزلة", "العاديات", "القارعة", "التكاثر", "العصر", "الهمزة", "الفيل",
+    "قريش", "الماعون", "الكوثر", "الكافرون", "النصر", "المسد", "الإخلاص",
+    "الفلق", "الناس",
+]
+
+# (start_page, end_page) per juz (index 0 = juz 1)
+JUZ_PAGE_RANGES = [(1, 21)] + [(20 * n + 2, 20 * n + 21) for n in range(1, 29)] + [(582, 604)]
+
+
+def juz_for_page(page_number):
+    """Juz number containing the page"""
+    if page_number <= 21:
+        return 1
+    return min(30, (page_number - 2) // 20 + 1)
+
+
+def pages_for_juz(juz_number):
+    start, end = JUZ_PAGE_RANGES[juz_number - 1]
+    return list(range(start, end + 1))
+
+
+def surah_page_range(surah_number):
+    """
+    (first_page, last_page) a surah can occupy. The last page is the page the
+    next surah starts on, since surahs usually share their boundary page.
+    """
+    start = SURAH_START_PAGES[surah_number - 1]
+    end = SURAH_START_PAGES[surah_number] if surah_number < TOTAL_SURAHS else TOTAL_PAGES
+    return start, max(start, end)
+
+
+def surahs_for_pages(pages):
+    """Surah numbers whose text may appear on any of the given pages"""
+    pages = set(pages)
+    result = []
+    for surah in range(1, TOTAL_SURAHS + 1):
+        start, end = surah_page_range(surah)
+        if any(start <= page <= end for page in pages):
+            result.append(surah)
+    return result
+
+
+def parse_page_spec(spec):
+    """'1-20,50,600-604' -> sorted list of page numbers"""
+    pages = set()
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            start, end = part.split("-", 1)
+            pages.update(range(int(start), int(end) + 1))
+        else:
+            pages.add(int(part))
+    invalid = [page for page in pages if not 1 <= page <= TOTAL_PAGES]
+    if invalid:
+        raise ValueError(f"pages out of range 1-{TOTAL_PAGES}: {sorted(invalid)[:5]}")
+    return sorted(pages)
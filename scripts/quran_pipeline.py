@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+The download pipeline behind `quran_cli.py fetch`
+Stream the wanted pages out of one fetch_planner strategy, journaling each
+page as it completes, fall back to the next strategy of the same edition for
+pages still missing, then overlay them on the current asset, validate the
+whole corpus and save it with its derived assets.
+"""
+
+import json
+from pathlib import Path
+
+from arabic_normalize import canonical_page
+from fetch_planner import ENDPOINTS_BY_NAME, iter_plan_pages, plan_for
+from parallel_download import DEFAULT_RATE, download_pages_concurrently, print_page_result
+from progress_journal import PageJournal
+from quran_assets import asset_edition, save_quran_assets
+from quran_meta import TOTAL_PAGES
+from quran_sources import DEFAULT_HEDGE_DELAY, HedgedFetcher, build_sources
+from quran_validate import load_reference, print_report, validate_quran_text
+from retry_policy import retry_failed_pages
+
+DEFAULT_OUTPUT = Path("assets/quran/quran_text.json")
+
+# Resume journal of each strategy (pages are journaled as soon as they complete)
+JOURNALS = {
+    "quran.com-page": "quran_com_pages",
+    "alquran.cloud-page": "alquran_cloud_pages",
+    "quran.com-chapter": "quran_com_chapter_pages",
+    "quran.com-bulk": "quran_com_bulk_pages",
+    "tanzil-xml": "tanzil_xml_pages",
+}
+# Per-page strategies and their primary quran_sources name
+PAGE_STRATEGIES = {
+    "quran.com-page": "quran.com",
+    "alquran.cloud-page": "alquran.cloud",
+}
+
+
+def fetch(strategy, pages, workers=1, rate=DEFAULT_RATE, resume=False, hedge=False,
+          hedge_delay=DEFAULT_HEDGE_DELAY):
+    """
+    Fetch `pages` with a fetch_planner strategy; returns ({str(page): text}, missing_pages)
+    Pages stream out of the strategy as they complete and are journaled right
+    away; with resume=True pages journaled by an earlier run are not fetched.
+    Per-page strategies give failed pages a final sequential sweep, and can
+    re-request slow pages from the same source (`hedge`).
+    """
+    journal = PageJournal(JOURNALS[strategy])
+    wanted = {str(page) for page in pages}
+    quran_text = {}
+    if resume:
+        quran_text = {key: text for key, text in journal.load().items() if key in wanted}
+    pages_to_fetch = [page for page in pages if str(page) not in quran_text]
+    if resume:
+        print(f"[RESUME] {len(quran_text)} pages already journaled, {len(pages_to_fetch)} to fetch\n")
+
+    report = print_page_result(TOTAL_PAGES)
+
+    def record_page(page_num, page_text):
+        if page_text:
+            # Normalize stage: drop BOMs and stray whitespace before anything is stored
+            page_text = canonical_page(page_text)
+            quran_text[str(page_num)] = page_text
+            journal.record(page_num, page_text)
+        report(page_num, page_text)
+
+    fetcher = None
+    journal.start(resume=resume)
+    try:
+        if strategy not in PAGE_STRATEGIES:
+            if pages_to_fetch:
+                plan = plan_for(ENDPOINTS_BY_NAME[strategy], pages_to_fetch, workers)
+                for page_num, page_text in iter_plan_pages(plan, workers=workers, rate=rate):
+                    record_page(page_num, page_text)
+            return _sorted(quran_text), [page for page in pages if str(page) not in quran_text]
+
+        source = build_sources([PAGE_STRATEGIES[strategy]])[0]
+        if hedge:
+            fetcher = HedgedFetcher(source, hedge_delay=hedge_delay, max_workers=workers)
+            fetch_page = fetcher.fetch_page
+        else:
+            fetch_page = source.fetch_page
+
+        _, failed_pages = download_pages_concurrently(fetch_page, pages_to_fetch, workers=workers, rate=rate,
+                                                      on_result=record_page)
+        # Targeted re-fetch of only the pages that failed above
+        if failed_pages:
+            recovered, failed_pages = retry_failed_pages(fetch_page, failed_pages, on_result=record_page)
+            print(f"[RETRY] Recovered {len(recovered)} pages")
+        return _sorted(quran_text), failed_pages
+    finally:
+        journal.close()
+        if fetcher:
+            print("\n[HEDGE]")
+            for line in fetcher.summary():
+                print(f"  {line}")
+            fetcher.close()
+
+
+def fetch_with_fallback(strategies, pages, **options):
+    """
+    fetch() with the first strategy, then with each next one for only the
+    pages still missing; the strategies should all serve the same edition.
+    Returns ({str(page): text}, missing_pages, strategies_used).
+    """
+    quran_text, missing, used = {}, list(pages), []
+    for strategy in strategies:
+        if used:
+            print(f"\n[FALLBACK] {len(missing)} pages missing; trying {strategy}")
+        fetched, missing = fetch(strategy, missing, **options)
+        quran_text.update(fetched)
+        used.append(strategy)
+        if not missing:
+            break
+    return _sorted(quran_text), missing, used
+
+
+def _sorted(quran_text):
+    return {key: quran_text[key] for key in sorted(quran_text, key=int)}
+
+
+def clear_journal(strategy):
+    """Drop a strategy's resume journal once its pages have been saved"""
+    PageJournal(JOURNALS[strategy]).clear()
+
+
+class EditionMismatch(ValueError):
+    """Fetched pages would be merged into an asset of another text edition"""
+
+
+def check_overlay(edition, pages, output_file=DEFAULT_OUTPUT):
+    """
+    Raise EditionMismatch if laying `pages` of `edition` over the asset would
+    keep some of its pages in another (or an unknown) edition. Replacing
+    every page of the asset switches its edition and is allowed.
+    """
+    output_file = Path(output_file)
+    if not output_file.exists():
+        return
+    current = asset_edition(output_file)
+    if current == edition:
+        return
+    with open(output_file, encoding="utf-8") as f:
+        kept = set(json.load(f)) - {str(page) for page in pages}
+    if kept:
+        hint = f"use a strategy serving {current}, or " if current else ""
+        raise EditionMismatch(
+            f"{output_file} is in edition {current or '(unknown)'}; merging {edition} pages into it would "
+            f"leave {len(kept)} pages in the old edition ({hint}fetch all {TOTAL_PAGES} pages to switch editions)")
+
+
+def overlay_pages(pages_text, output_file=DEFAULT_OUTPUT, edition=None):
+    """
+    The current asset (if any) with freshly fetched pages of `edition` laid
+    over it; raises EditionMismatch rather than mix editions (check_overlay)
+    """
+    output_file = Path(output_file)
+    check_overlay(edition, pages_text, output_file)
+    quran_text = {}
+    if output_file.exists():
+        with open(output_file, encoding="utf-8") as f:
+            quran_text = json.load(f)
+    quran_text.update(pages_text)
+    return _sorted(quran_text)
+
+
+def validate(quran_text, edition=None):
+    """Validate the whole corpus of text `edition` and print the report; returns True if it passed"""
+    print("\n[VALIDATION]")
+    report = validate_quran_text(quran_text, load_reference(), edition)
+    print_report(report)
+    return report["ok"]
+
+
+def save_and_verify(quran_text, output_file=DEFAULT_OUTPUT, shards=None, edition=None):
+    """
+    Validate, then save quran_text.json and its derived assets, recording
+    `edition` in the manifest; returns True if saved
+    """
+    if not quran_text:
+        print("\n[ERROR] No data to save")
+        return False
+
+    # Validate the whole corpus before anything is written
+    if not validate(quran_text, edition):
+        print("[ERROR] Not saving: validation failed")
+        return False
+
+    # Unchanged files (and their mtimes) are left as they are
+    output_file = Path(output_file)
+    save_quran_assets(quran_text, output_file, shards=shards, edition=edition)
+
+    print("\n" + "=" * 70)
+    print("[SUCCESS] Quran saved successfully!")
+    print("=" * 70)
+    print(f"File: {output_file}")
+    print(f"Pages: {len(quran_text)}/{TOTAL_PAGES}")
+    print(f"Size: {output_file.stat().st_size / 1024:.2f} KB")
+    return True
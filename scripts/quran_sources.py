@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Unified page sources (Quran.com, AlQuran.cloud, Tanzil) and same-source hedging
+If a source is slow to answer a page, the same page is requested again from
+that source and whichever answer arrives first wins. Hedges never switch
+source: each upstream serves its own `edition`, so one asset never mixes the
+orthography or bismillah handling of different upstreams.
+"""
+
+import threading
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+
+import quran_http
+from quran_meta import EDITION_ALQURAN_CLOUD, EDITION_QURAN_COM
+from retry_policy import FetchError, call_with_retries, get_json
+from tanzil_stream import TANZIL_XML_URL, stream_tanzil_pages
+
+DEFAULT_HEDGE_DELAY = 1.5  # seconds to wait on a source before hedging
+EWMA_WEIGHT = 0.2
+TANZIL_BACKOFF = 5.0  # seconds before a failed Tanzil XML download is retried
+TANZIL_MAX_BACKOFF = 120.0
+
+CHAPTERS_URL = "https://api.quran.com/api/v4/chapters"
+
+
+def fetch_chapters():
+    """
+    Chapter metadata from Quran.com (id, name_simple, name_arabic,
+    verses_count, pages=[first, last], ...). Returns None on failure.
+    """
+    response = quran_http.get(CHAPTERS_URL, timeout=10)
+    if response.status_code != 200:
+        print(f"[ERROR] Failed to fetch chapters: {response.status_code}")
+        return None
+    return response.json().get('chapters', [])
+
+
+class QuranSource:
+    """
+    A page-addressable Quran text source; fetch_page() returns verse texts or None.
+    Sources with the same `edition` serve byte-identical text.
+    """
+
+    name = "source"
+    edition = None
+
+    def fetch_verses(self, page_number):
+        raise NotImplementedError
+
+    def fetch_page(self, page_number):
+        """Page text in the asset format (verses joined with a blank line)"""
+        verses = self.fetch_verses(page_number)
+        return '\n\n'.join(verses) if verses else None
+
+
+class QuranComSource(QuranSource):
+    """Quran.com v4 `verses/by_page` endpoint"""
+
+    name = "quran.com"
+    edition = EDITION_QURAN_COM
+
+    def fetch_verses(self, page_number):
+        url = f"https://api.quran.com/api/v4/verses/by_page/{page_number}"
+        params = {"words": "false", "translations": ""}
+        try:
+            data = call_with_retries(get_json, url, params=params, timeout=10,
+                                     validate=lambda d: bool(d.get('verses')))
+        except FetchError:
+            return None
+        texts = (verse.get('text_uthmani', '').strip() for verse in data['verses'])
+        return [text for text in texts if text]
+
+
+class AlQuranCloudSource(QuranSource):
+    """AlQuran.cloud `page/{n}/quran-uthmani` endpoint"""
+
+    name = "alquran.cloud"
+    edition = EDITION_ALQURAN_CLOUD
+
+    def fetch_verses(self, page_number):
+        url = f"https://api.alquran.cloud/v1/page/{page_number}/quran-uthmani"
+
+        def is_valid(data):
+            return data.get('code') == 200 and bool((data.get('data') or {}).get('ayahs'))
+
+        try:
+            data = call_with_retries(get_json, url, timeout=10, validate=is_valid)
+        except FetchError:
+            return None
+        texts = (ayah.get('text', '').strip() for ayah in data['data']['ayahs'])
+        return [text for text in texts if text]
+
+
+class TanzilSource(QuranSource):
+    """
+    Tanzil XML, which only exists as one whole document: the first page
+    request downloads and indexes it, later pages are served from memory.
+    A failed download is retried by a later page request once its backoff
+    (doubling per consecutive failure) has passed.
+    """
+
+    name = "tanzil"
+
+    def __init__(self, url=TANZIL_XML_URL):
+        self.url = url
+        self.edition = "tanzil/" + (parse_qs(urlsplit(url).query).get("quranType") or ["default"])[0]
+        self._pages = None
+        self._failures = 0
+        self._retry_at = 0.0
+        self._lock = threading.Lock()
+
+    def _download(self):
+        pages = {}
+        try:
+            for page_num, verses in stream_tanzil_pages(self.url):
+                pages.setdefault(page_num, []).extend(verses)
+        except requests.HTTPError as e:
+            status = e.response.status_code if e.response is not None else None
+            raise FetchError("server" if status and status >= 500 else "client", str(e), status)
+        except requests.Timeout as e:
+            raise FetchError("timeout", str(e))
+        except requests.RequestException as e:
+            raise FetchError("connection", str(e))
+        return pages
+
+    def _load(self):
+        """The page index, or None while the document is unavailable"""
+        with self._lock:
+            if self._pages is None and time.monotonic() >= self._retry_at:
+                try:
+                    self._pages = self._download()
+                except (FetchError, ET.ParseError) as e:
+                    # Don't re-download the whole document for every page: back off first
+                    self._failures += 1
+                    delay = min(TANZIL_MAX_BACKOFF, TANZIL_BACKOFF * 2 ** (self._failures - 1))
+                    self._retry_at = time.monotonic() + delay
+                    print(f"[WARNING] Tanzil XML unavailable ({e}); retrying in {delay:g}s")
+            return self._pages
+
+    def fetch_verses(self, page_number):
+        pages = self._load()
+        return pages.get(int(page_number)) if pages is not None else None
+
+
+SOURCES = {
+    "quran.com": QuranComSource,
+    "alquran.cloud": AlQuranCloudSource,
+    "tanzil": TanzilSource,
+}
+
+
+def build_sources(names):
+    """Instantiate sources by name, in priority order"""
+    return [SOURCES[name]() for name in names]
+
+
+class SourceHealth:
+    """Latency EWMA and consecutive-failure count for one source"""
+
+    def __init__(self):
+        self.latency = None
+        self.failures = 0
+
+    def record(self, elapsed, ok):
+        if ok:
+            self.failures = 0
+            self.latency = elapsed if self.latency is None else (
+                EWMA_WEIGHT * elapsed + (1 - EWMA_WEIGHT) * self.latency)
+        else:
+            self.failures += 1
+
+
+class HedgedFetcher:
+    """
+    fetch_page(page) asks `source` for the page; if it has not answered within
+    `hedge_delay` (or fails), the same page is requested again from the same
+    source, up to `copies` requests in all. The first non-empty answer wins;
+    slower duplicates are ignored.
+
+    Hedges never go to another source: the upstreams serve different editions,
+    and a backup answer has to be byte-identical to the one it races.
+    """
+
+    def __init__(self, source, hedge_delay=DEFAULT_HEDGE_DELAY, max_workers=16, copies=2):
+        self.source = source
+        self.hedge_delay = hedge_delay
+        self.copies = max(1, copies)
+        self.health = SourceHealth()
+        self.pages = 0
+        self.hedges = 0
+        self.hedge_wins = 0  # pages answered first by a re-request
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers * self.copies)
+
+    def _timed_fetch(self, page_number):
+        start = time.monotonic()
+        try:
+            text = self.source.fetch_page(page_number)
+        except Exception:
+            text = None
+        with self._lock:
+            self.health.record(time.monotonic() - start, bool(text))
+        return text
+
+    def fetch_page(self, page_number):
+        pending = {}
+        attempts = 0
+
+        def launch():
+            nonlocal attempts
+            pending[self._executor.submit(self._timed_fetch, page_number)] = attempts
+            attempts += 1
+
+        launch()
+        while pending:
+            timeout = self.hedge_delay if attempts < self.copies else None
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+
+            if not done:
+                # Slow answer: race it with the same request
+                with self._lock:
+                    self.hedges += 1
+                launch()
+                continue
+
+            for future in done:
+                attempt = pending.pop(future)
+                text = future.result()
+                if text:
+                    with self._lock:
+                        self.pages += 1
+                        self.hedge_wins += attempt > 0
+                    return text
+
+            # Everything that finished failed; ask again without waiting
+            if not pending and attempts < self.copies:
+                launch()
+
+        return None
+
+    def summary(self):
+        """Pages fetched, latency EWMA and how often a hedge was needed"""
+        latency = f"{self.health.latency * 1000:.0f} ms" if self.health.latency is not None else "n/a"
+        return [f"{self.source.name}: {self.pages} pages, avg {latency}",
+                f"hedged requests: {self.hedges} ({self.hedge_wins} answered first)"]
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
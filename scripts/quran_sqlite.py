@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+SQLite export of the verse corpus
+
+quran.sqlite gives server-side tools and the mobile targets indexed random
+access and full-text search from one file, without decoding the JSON map:
+    verses      id (mushaf order, from 1), surah, ayah, page, juz, text,
+                search (arabic_normalize.search_form of the text)
+                indexed on (page), (surah, ayah) and (juz)
+    pages       page, juz, first_verse, verse_count, text (as in quran_text.json)
+    verses_fts  FTS5 table over verses.search (external content, rowid = id);
+                left out with a warning if this SQLite build lacks FTS5
+
+The database is bulk-loaded in a single transaction, ANALYZEd and vacuumed in
+a scratch file, then written over the old one only if its bytes changed.
+PRAGMA user_version holds SQLITE_SCHEMA_VERSION.
+
+Usage:
+    python scripts/quran_sqlite.py                              # build from assets/quran/quran_text.json
+    python scripts/quran_sqlite.py --query "الحمد لله"           # FTS5 match, best first
+    python scripts/quran_sqlite.py --verse 2:255
+"""
+
+import argparse
+import json
+import sqlite3
+import tempfile
+from pathlib import Path
+
+from asset_manifest import write_if_changed
+from verse_corpus import VerseCorpus
+
+SQLITE_SCHEMA_VERSION = 1
+SQLITE_NAME = "quran.sqlite"
+
+SCHEMA = """
+CREATE TABLE verses (
+    id INTEGER PRIMARY KEY,
+    surah INTEGER NOT NULL,
+    ayah INTEGER NOT NULL,
+    page INTEGER NOT NULL,
+    juz INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    search TEXT NOT NULL
+);
+CREATE TABLE pages (
+    page INTEGER PRIMARY KEY,
+    juz INTEGER NOT NULL,
+    first_verse INTEGER NOT NULL REFERENCES verses (id),
+    verse_count INTEGER NOT NULL,
+    text TEXT NOT NULL
+);
+"""
+# Created after the bulk load: building an index once is cheaper than updating it per row
+INDEXES = """
+CREATE INDEX verses_page ON verses (page);
+CREATE UNIQUE INDEX verses_surah_ayah ON verses (surah, ayah);
+CREATE INDEX verses_juz ON verses (juz);
+"""
+# The normalized text is already folded, so the tokenizer only has to split on spaces
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE verses_fts USING fts5 (
+    search, content = 'verses', content_rowid = 'id', tokenize = 'unicode61 remove_diacritics 0'
+);
+INSERT INTO verses_fts (verses_fts) VALUES ('rebuild');
+"""
+
+
+def build_database(corpus, normalized, quran_text, path):
+    """
+    Write the database for a corpus dict (verse_corpus.build_corpus), its
+    normalized variants (arabic_normalize.build_normalized) and the page map
+    to `path`. Returns True if FTS5 was available.
+    """
+    verses = VerseCorpus(corpus)
+    count = corpus["verse_count"]
+    starts = corpus["page_verse_start"]
+    verse_rows = ((index + 1, corpus["surah"][index], corpus["ayah"][index], corpus["page"][index],
+                   corpus["juz"][index], verses.text(index), normalized["search"][index])
+                  for index in range(count))
+    page_rows = ((page, corpus["juz"][starts[page - 1]], starts[page - 1] + 1, starts[page] - starts[page - 1],
+                  quran_text[str(page)])
+                 for page in range(1, len(starts)))
+
+    conn = sqlite3.connect(path, isolation_level=None)
+    try:
+        # A scratch file rebuilt from scratch needs no rollback journal or fsyncs
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.execute(f"PRAGMA user_version = {SQLITE_SCHEMA_VERSION}")
+        conn.execute("BEGIN")
+        _execute_all(conn, SCHEMA)
+        conn.executemany("INSERT INTO verses VALUES (?, ?, ?, ?, ?, ?, ?)", verse_rows)
+        conn.executemany("INSERT INTO pages VALUES (?, ?, ?, ?, ?)", page_rows)
+        _execute_all(conn, INDEXES)
+        has_fts = fts5_available()
+        if has_fts:
+            _execute_all(conn, FTS_SCHEMA)
+        else:
+            print(f"   [WARNING] {SQLITE_NAME} built without full-text search: SQLite lacks FTS5")
+        conn.execute("COMMIT")
+        conn.execute("ANALYZE")
+        conn.execute("VACUUM")
+    finally:
+        conn.close()
+    return has_fts
+
+
+def _execute_all(conn, script):
+    # Statement by statement: executescript() would commit the open transaction first
+    for statement in script.split(";"):
+        if statement.strip():
+            conn.execute(statement)
+
+
+def fts5_available():
+    """Whether this SQLite build has FTS5 (probed in memory: the export runs without a rollback journal)"""
+    conn = sqlite3.connect(":memory:")
+    try:
+        conn.execute("CREATE VIRTUAL TABLE probe USING fts5 (text)")
+        return True
+    except sqlite3.OperationalError:
+        return False
+    finally:
+        conn.close()
+
+
+def write_database(corpus, normalized, quran_text, path):
+    """build_database() into a scratch file, then write_if_changed(); returns the size in bytes"""
+    path = Path(path)
+    with tempfile.TemporaryDirectory() as scratch:
+        scratch_file = Path(scratch) / SQLITE_NAME
+        build_database(corpus, normalized, quran_text, scratch_file)
+        data = scratch_file.read_bytes()
+    write_if_changed(path, data)
+    return len(data)
+
+
+def search(conn, query, limit=20):
+    """[(surah, ayah, page, text)] of the verses matching every query word, best (bm25) first"""
+    from arabic_normalize import search_form
+
+    words = search_form(query).split()
+    if not words:
+        return []
+    # Quote each word so FTS5 treats it as a plain token, not query syntax
+    match = " ".join('"' + word.replace('"', '""') + '"' for word in words)
+    return conn.execute(
+        "SELECT v.surah, v.ayah, v.page, v.text FROM verses_fts JOIN verses v ON v.id = verses_fts.rowid "
+        "WHERE verses_fts MATCH ? ORDER BY bm25(verses_fts) LIMIT ?", (match, limit)).fetchall()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build quran.sqlite from quran_text.json")
+    parser.add_argument("--input", default="assets/quran/quran_text.json")
+    parser.add_argument("--output", default=f"assets/quran/{SQLITE_NAME}")
+    parser.add_argument("--query", help="full-text search the database at --output instead of building it")
+    parser.add_argument("--verse", help="print one verse (surah:ayah) from the database at --output")
+    args = parser.parse_args()
+
+    if args.query or args.verse:
+        conn = sqlite3.connect(f"file:{args.output}?mode=ro", uri=True)
+        try:
+            if args.verse:
+                surah, ayah = (int(part) for part in args.verse.split(":"))
+                rows = conn.execute("SELECT surah, ayah, page, text FROM verses WHERE surah = ? AND ayah = ?",
+                                    (surah, ayah)).fetchall()
+            else:
+                rows = search(conn, args.query)
+                print(f"{len(rows)} verses")
+        finally:
+            conn.close()
+        for surah, ayah, page, text in rows:
+            print(f"  {surah}:{ayah} (page {page})  {text}")
+        return
+
+    from arabic_normalize import build_normalized
+    from verse_corpus import build_corpus, verses_from_page_text
+
+    with open(args.input, encoding="utf-8") as f:
+        quran_text = json.load(f)
+    verses = list(verses_from_page_text(quran_text))
+    corpus = build_corpus(verses)
+    normalized = build_normalized(text for _, _, _, text in verses)
+    size = write_database(corpus, normalized, quran_text, args.output)
+    print(f"[OK] {args.output}: {corpus['verse_count']} verses, {len(quran_text)} pages, {size / 1024:.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
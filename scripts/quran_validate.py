@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Full-corpus validation for quran_text.json, run before every save
+One pass over the 604 pages checks that:
+- every page 1-604 is present and non-empty (and nothing else is)
+- the pages split into exactly 6236 verses
+- verses fall in mushaf order: each surah starts on its known page, so a
+  dropped or duplicated ayah anywhere shows up at the next surah boundary
+Each page's SHA-256 is also compared with the pinned reference
+(quran_reference.json), which records the edition it was pinned from. A page
+that differs fails validation too, unless the text is known to be of another
+edition than the reference (then the difference is expected and only reported
+as a warning): within one edition, drift means corrupted or mixed text.
+
+Usage:
+    python scripts/quran_validate.py                     # human-readable summary
+    python scripts/quran_validate.py --json              # machine-readable report
+    python scripts/quran_validate.py --write-reference   # pin the current asset as reference
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from asset_manifest import page_hashes, sha256_hex
+from quran_meta import SURAH_AYAH_COUNTS, SURAH_START_PAGES, TOTAL_PAGES, TOTAL_VERSES
+
+REFERENCE_FILE = Path(__file__).with_name("quran_reference.json")
+VERSE_SEPARATOR = '\n\n'
+MAX_ERRORS = 50
+
+
+def load_reference(path=REFERENCE_FILE):
+    """
+    Pinned reference {"edition": edition or None, "pages": {page: sha256}},
+    or None if there is none
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            reference = json.load(f)
+    except FileNotFoundError:
+        return None
+    return {"edition": reference.get("edition"), "pages": reference["pages"]}
+
+
+def write_reference(quran_text, path=REFERENCE_FILE, edition=None):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"edition": edition, "pages": page_hashes(quran_text)}, f, indent=2)
+        f.write("\n")
+
+
+def validate_quran_text(quran_text, reference=None, edition=None):
+    """
+    Validate a page map ({"1": text, ..., "604": text}) of text `edition` and
+    return a report dict; report["ok"] is True only if every check passed.
+    Pages differing from the reference are listed under
+    report["checksums"]["mismatched"]; they are an error unless `edition` and
+    the reference's edition are both known and differ.
+    """
+    started = time.perf_counter()
+    errors = []
+
+    def error(check, message, page=None):
+        if len(errors) < MAX_ERRORS:
+            errors.append({"check": check, "page": page, "message": message})
+
+    expected_keys = {str(page) for page in range(1, TOTAL_PAGES + 1)}
+    unexpected = sorted(key for key in quran_text if key not in expected_keys)
+    for key in unexpected:
+        error("pages", f"unexpected key {key!r}")
+
+    # Global index of each surah's first verse; surah s starts at surah_start[s - 1]
+    surah_start = [0]
+    for count in SURAH_AYAH_COUNTS:
+        surah_start.append(surah_start[-1] + count)
+
+    missing, mismatched = [], []
+    verse_count = 0
+    next_surah = 1  # next surah whose first verse we are waiting for
+
+    for page in range(1, TOTAL_PAGES + 1):
+        text = quran_text.get(str(page))
+        if not isinstance(text, str) or not text.strip():
+            missing.append(page)
+            error("pages", "page is missing or empty", page)
+            continue
+
+        if reference is not None and sha256_hex(text.encode("utf-8")) != reference["pages"].get(str(page)):
+            mismatched.append(page)
+
+        verses = text.split(VERSE_SEPARATOR)
+        if any(not verse.strip() for verse in verses):
+            error("verses", "empty verse (stray blank lines)", page)
+
+        page_end = verse_count + len(verses)
+        # Every surah whose first verse lands on this page must be expected here
+        while next_surah <= len(SURAH_AYAH_COUNTS) and surah_start[next_surah - 1] < page_end:
+            expected_page = SURAH_START_PAGES[next_surah - 1]
+            if expected_page != page:
+                error("order", f"surah {next_surah} starts on page {page}, expected page {expected_page}"
+                               f" (ayah count off before this point)", page)
+            next_surah += 1
+        verse_count = page_end
+
+    if verse_count != TOTAL_VERSES:
+        error("verses", f"found {verse_count} verses, expected {TOTAL_VERSES}")
+
+    reference_edition = reference["edition"] if reference is not None else None
+    drift_expected = edition is not None and reference_edition is not None and edition != reference_edition
+    if mismatched and not drift_expected:
+        error("checksums", f"{len(mismatched)} pages differ from the reference of the same edition: "
+                           f"{_format_pages(mismatched)} (re-pin with --write-reference if intended)")
+
+    return {
+        "ok": not errors,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+        "pages": {
+            "expected": TOTAL_PAGES,
+            "present": TOTAL_PAGES - len(missing),
+            "missing": missing,
+            "unexpected": unexpected,
+        },
+        "verses": {"expected": TOTAL_VERSES, "found": verse_count},
+        "checksums": {
+            "reference": reference is not None,
+            "reference_edition": reference_edition,
+            "edition": edition,
+            "drift_expected": drift_expected,
+            "mismatched": mismatched,
+        },
+        "errors": errors,
+    }
+
+
+def _format_pages(pages, limit=20):
+    return ", ".join(map(str, pages[:limit])) + (", ..." if len(pages) > limit else "")
+
+
+def print_report(report):
+    pages, verses = report["pages"], report["verses"]
+    status = "[OK]" if report["ok"] else "[FAILED]"
+    print(f"{status} Validation in {report['elapsed_ms']:.1f} ms: "
+          f"{pages['present']}/{pages['expected']} pages, "
+          f"{verses['found']}/{verses['expected']} verses")
+    if not report["checksums"]["reference"]:
+        print("   (no reference checksums; run quran_validate.py --write-reference)")
+    checksums = report["checksums"]
+    if checksums["mismatched"] and checksums["drift_expected"]:
+        print(f"   [WARNING] {len(checksums['mismatched'])} pages differ from the reference "
+              f"({checksums['edition']} text, reference pinned from {checksums['reference_edition']}): "
+              f"{_format_pages(checksums['mismatched'])}")
+    for item in report["errors"]:
+        where = f"page {item['page']}: " if item["page"] else ""
+        print(f"   [{item['check']}] {where}{item['message']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate quran_text.json against the Quran structure")
+    parser.add_argument("--input", default="assets/quran/quran_text.json")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    parser.add_argument("--no-reference", action="store_true", help="skip the per-page checksum check")
+    parser.add_argument("--write-reference", action="store_true",
+                        help=f"pin the input's page checksums as {REFERENCE_FILE.name} (after validating it)")
+    args = parser.parse_args()
+
+    with open(args.input, encoding="utf-8") as f:
+        quran_text = json.load(f)
+
+    from quran_assets import asset_edition
+
+    edition = asset_edition(args.input)
+    reference = None if args.no_reference or args.write_reference else load_reference()
+    report = validate_quran_text(quran_text, reference, edition)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+    if args.write_reference and report["ok"]:
+        write_reference(quran_text, edition=edition)
+        print(f"[OK] Reference written to {REFERENCE_FILE}")
+
+    sys.exit(0 if report["ok"] else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Retry engine for the Quran download scripts
+Classifies failures, retries with exponential backoff + jitter, and re-sweeps failed pages
+"""
+
+import random
+import time
+
+import requests
+
+import quran_http
+from adaptive_rate import parse_retry_after
+from fetch_metrics import METRICS
+
+DEFAULT_ATTEMPTS = 4
+BASE_DELAY = 0.5  # seconds; doubled on every attempt
+MAX_DELAY = 8.0
+
+# Failure kinds and whether another attempt can help
+RETRYABLE_KINDS = {
+    "timeout": True,
+    "connection": True,
+    "server": True,        # 5xx
+    "rate_limited": True,  # 429
+    "malformed": True,     # truncated / invalid JSON or missing payload
+    "client": False,       # other 4xx
+}
+
+
+class FetchError(Exception):
+    """A classified request failure"""
+
+    def __init__(self, kind, message, status=None, retry_after=None):
+        super().__init__(message)
+        self.kind = kind
+        self.status = status
+        self.retry_after = retry_after
+
+    @property
+    def retryable(self):
+        return RETRYABLE_KINDS.get(self.kind, False)
+
+    def __str__(self):
+        return f"{self.kind}: {super().__str__()}"
+
+
+def get_json(url, params=None, timeout=10, validate=None):
+    """
+    GET a JSON document, raising FetchError for anything but a usable 200.
+
+    `validate(data)` may return False to flag a well-formed but empty or
+    unexpected payload, which is treated as malformed (and retried).
+    """
+    try:
+        response = quran_http.get(url, params=params, timeout=timeout)
+    except requests.Timeout as e:
+        raise FetchError("timeout", str(e))
+    except requests.RequestException as e:
+        raise FetchError("connection", str(e))
+
+    status = response.status_code
+    if status == 429:
+        raise FetchError("rate_limited", "HTTP 429", status,
+                         parse_retry_after(response.headers.get("Retry-After")))
+    if status >= 500:
+        raise FetchError("server", f"HTTP {status}", status,
+                         parse_retry_after(response.headers.get("Retry-After")))
+    if status != 200:
+        raise FetchError("client", f"HTTP {status}", status)
+
+    try:
+        data = response.json()
+        # Validators expect an object; a list or scalar body would fail inside them
+        if not isinstance(data, dict):
+            raise ValueError(f"expected a JSON object, got {type(data).__name__}")
+        if validate is not None and not validate(data):
+            raise ValueError("unexpected payload")
+    except (ValueError, AttributeError, TypeError) as e:
+        # Never let a bad body keep being served from the cache
+        quran_http.discard_cached(url, params)
+        raise FetchError("malformed", str(e), status)
+
+    return data
+
+
+def backoff_delay(attempt, base_delay=BASE_DELAY, max_delay=MAX_DELAY):
+    """Full-jitter exponential backoff for the given (0-based) attempt"""
+    return random.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
+
+
+def call_with_retries(func, *args, attempts=DEFAULT_ATTEMPTS, base_delay=BASE_DELAY,
+                      max_delay=MAX_DELAY, **kwargs):
+    """
+    Call `func(*args, **kwargs)`, retrying retryable FetchErrors.
+    Retry-After from the server takes precedence over the computed backoff.
+    """
+    for attempt in range(attempts):
+        try:
+            return func(*args, **kwargs)
+        except FetchError as e:
+            if not e.retryable or attempt == attempts - 1:
+                raise
+            METRICS.count_retry(e.kind)
+            delay = e.retry_after if e.retry_after is not None else backoff_delay(attempt, base_delay, max_delay)
+            time.sleep(min(delay, max_delay * 4))
+
+
+def retry_failed_pages(fetch_page, failed_pages, rounds=2, pause=2.0, on_result=None):
+    """
+    Final sweep over only the pages that failed in the main pass.
+
+    Pages are retried one at a time (failures are usually load related),
+    with `pause` seconds between rounds, doubling each round.
+    Returns (recovered, still_failed) with recovered keyed by str(page).
+    """
+    recovered = {}
+    remaining = sorted(failed_pages)
+
+    for round_num in range(rounds):
+        if not remaining:
+            break
+        time.sleep(pause * (2 ** round_num))
+        print(f"\n[RETRY] Round {round_num + 1}/{rounds}: {len(remaining)} failed pages")
+
+        still_failed = []
+        for page_number in remaining:
+            page_text = fetch_page(page_number)
+            if page_text:
+                recovered[str(page_number)] = page_text
+            else:
+                still_failed.append(page_number)
+            if on_result:
+                on_result(page_number, page_text)
+        remaining = still_failed
+
+    return recovered, remaining
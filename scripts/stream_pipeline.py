@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Staged streaming pipeline: each stage runs on its own thread(s) and hands its
+output to the next through a bounded queue. A slow stage makes the ones
+before it block (backpressure) instead of letting work pile up in memory, and
+parsing/grouping overlaps with requests still in flight, so the wall time
+approaches that of the slowest stage rather than the sum of all of them.
+
+    stages = [Stage(fetch, workers=8), Stage(parse), Stage(grouper.add, finish=grouper.finish)]
+    for page, text in run_stages(surah_numbers, *stages):
+        journal.record(page, text)  # written as each page completes
+"""
+
+import queue
+import threading
+
+DEFAULT_BUFFER = 16  # items held between two stages
+POLL_INTERVAL = 0.1  # seconds between checks for a failed stage
+
+_DONE = object()
+
+
+class Stage:
+    """
+    One step of a pipeline. `func(item)` returns an iterable of output items
+    (none, one or many); `finish()`, if given, returns whatever is left once
+    the input is exhausted. With workers > 1 items are processed concurrently
+    and may come out in a different order.
+    """
+
+    def __init__(self, func, workers=1, finish=None):
+        self.func = func
+        self.workers = max(1, workers)
+        self.finish = finish
+
+
+def run_stages(source, *stages, buffer=DEFAULT_BUFFER):
+    """
+    Generator over the last stage's output. `source` is iterated on its own
+    thread; an exception in any stage stops the pipeline and is re-raised here.
+    Closing the generator early (break, Ctrl-C) stops every stage.
+    """
+    stop = threading.Event()
+    errors = []
+    queues = [queue.Queue(maxsize=buffer) for _ in range(len(stages) + 1)]
+
+    def put(target, item):
+        while not stop.is_set():
+            try:
+                target.put(item, timeout=POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def fail(error):
+        errors.append(error)
+        stop.set()
+
+    def feed():
+        try:
+            for item in source:
+                if not put(queues[0], item):
+                    return
+        except Exception as e:
+            fail(e)
+            return
+        put(queues[0], _DONE)
+
+    def work(stage, inbox, outbox, running, lock):
+        try:
+            while not stop.is_set():
+                try:
+                    item = inbox.get(timeout=POLL_INTERVAL)
+                except queue.Empty:
+                    continue
+                if item is _DONE:
+                    put(inbox, _DONE)  # the stage's other workers need to see it too
+                    break
+                for output in stage.func(item):
+                    if not put(outbox, output):
+                        return
+            else:
+                return
+
+            with lock:
+                running[0] -= 1
+                last = running[0] == 0
+            if last:
+                for output in (stage.finish() if stage.finish else ()):
+                    if not put(outbox, output):
+                        return
+                put(outbox, _DONE)
+        except Exception as e:
+            fail(e)
+
+    threads = [threading.Thread(target=feed, daemon=True)]
+    for index, stage in enumerate(stages):
+        running, lock = [stage.workers], threading.Lock()
+        threads.extend(threading.Thread(target=work, args=(stage, queues[index], queues[index + 1], running, lock),
+                                        daemon=True)
+                       for _ in range(stage.workers))
+    for thread in threads:
+        thread.start()
+
+    try:
+        while True:
+            try:
+                item = queues[-1].get(timeout=POLL_INTERVAL)
+            except queue.Empty:
+                if stop.is_set():
+                    break
+                continue
+            if item is _DONE:
+                break
+            yield item
+        if errors:
+            raise errors[0]
+    finally:
+        stop.set()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Streaming Tanzil XML ingestion
+Parses the XML incrementally as it downloads and yields verses grouped by page,
+clearing each element once consumed so memory stays flat
+"""
+
+import xml.etree.ElementTree as ET
+
+import quran_http
+
+TANZIL_XML_URL = "https://tanzil.net/pub/download/get_xml.php?tanzilVersion=v1.0.2&quranType=uthmani-min"
+
+
+def iter_tanzil_verses(chunks):
+    """
+    Yield (sura, aya, page, text) for every <aya> in a stream of XML byte chunks.
+    `page` is None when the document carries no page attribute.
+    """
+    parser = ET.XMLPullParser(events=("start", "end"))
+    sura_number = None
+
+    for chunk in chunks:
+        parser.feed(chunk)
+        for event, elem in parser.read_events():
+            if elem.tag == "sura":
+                if event == "start":
+                    sura_number = int(elem.get("index", 0)) or None
+                else:
+                    elem.clear()  # drop the already-yielded ayas
+            elif elem.tag == "aya" and event == "end":
+                text = elem.get("text", "").strip()
+                page = elem.get("page")
+                if text:
+                    yield sura_number, int(elem.get("index", 0)), int(page) if page else None, text
+                elem.clear()
+
+    parser.close()
+
+
+def iter_tanzil_pages(chunks):
+    """
+    Yield (page_number, [verse texts]) as soon as each page is complete.
+    Verses arrive in mushaf order, so a page is done when the next one starts.
+    """
+    current_page = None
+    verses = []
+
+    for _, _, page, text in iter_tanzil_verses(chunks):
+        if page is None:
+            continue
+        if page != current_page:
+            if verses:
+                yield current_page, verses
+            current_page = page
+            verses = []
+        verses.append(text)
+
+    if verses:
+        yield current_page, verses
+
+
+def stream_tanzil_pages(url=TANZIL_XML_URL, timeout=30):
+    """Download the Tanzil XML and yield (page_number, [verse texts]) while it arrives"""
+    return iter_tanzil_pages(quran_http.iter_content(url, timeout=timeout))
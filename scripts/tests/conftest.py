@@ -0,0 +1,144 @@
+"""
+Shared fixtures for the build script tests
+The scripts are flat modules run from the repo root, so their directory goes
+on sys.path here; the fixtures read the checked-in asset, never the network.
+
+Run with:
+    python -m pytest scripts/tests
+"""
+
+import json
+import math
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+ASSET_FILE = SCRIPTS_DIR.parent / "assets" / "quran" / "quran_text.json"
+
+
+@pytest.fixture(scope="session")
+def quran_text():
+    """The checked-in page map; tests that modify it must copy it first"""
+    with open(ASSET_FILE, encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.fixture(scope="session")
+def verses(quran_text):
+    """[(surah, ayah, page, text)] in mushaf order"""
+    from verse_corpus import verses_from_page_text
+
+    return list(verses_from_page_text(quran_text))
+
+
+@pytest.fixture(scope="session")
+def normalized(verses):
+    from arabic_normalize import build_normalized
+
+    return build_normalized(text for _, _, _, text in verses)
+
+
+
+@pytest.fixture(scope="session")
+def phrases(normalized):
+    """200 random runs of 1-3 consecutive words from the search forms, seeded"""
+    rng = random.Random(604)
+    queries = []
+    for _ in range(200):
+        words = rng.choice(normalized["search"]).split()
+        start = rng.randrange(len(words))
+        queries.append(" ".join(words[start:start + rng.randint(1, 3)]))
+    return queries
+
+
+@pytest.fixture(scope="session")
+def verse_words(normalized):
+    return [set(text.split()) for text in normalized["search"]]
+
+
+@pytest.fixture(scope="session")
+def word_matches(verses, verse_words):
+    """Brute-force oracle: [(page, verse)] of the verses containing every query word"""
+    from arabic_normalize import search_form
+
+    def matches(query):
+        words = search_form(query).split()
+        if not words:
+            return []
+        return [(verses[verse][2], verse) for verse, present in enumerate(verse_words)
+                if all(word in present for word in words)]
+
+    return matches
+
+
+
+@pytest.fixture(scope="session")
+def typo_phrases(phrases):
+    """`phrases` as partial words and typos: a few letters cut, sometimes two swapped"""
+    rng = random.Random(604)
+    queries = []
+    for query in phrases:
+        query = query[rng.randint(0, min(3, len(query) - 1)):]
+        if len(query) > 3 and rng.random() < 0.5:
+            i = rng.randrange(len(query) - 1)
+            query = query[:i] + query[i + 1] + query[i] + query[i + 2:]
+        queries.append(query)
+    return queries
+
+
+@pytest.fixture(scope="session")
+def verse_trigrams(normalized):
+    from trigram_index import text_trigrams
+
+    return [text_trigrams(text) for text in normalized["search"]]
+
+
+@pytest.fixture(scope="session")
+def trigram_matches(verse_trigrams):
+    """Brute-force oracle: every verse scored directly, ranked as trigram_index specifies"""
+    from arabic_normalize import search_form
+    from trigram_index import text_trigrams
+
+    def matches(query, min_score, limit):
+        query_trigrams = text_trigrams(search_form(query))
+        if not query_trigrams:
+            return []
+        needed = max(1, math.ceil(min_score * len(query_trigrams) - 1e-9))
+        ranked = sorted((-len(query_trigrams & trigrams), len(trigrams), verse)
+                        for verse, trigrams in enumerate(verse_trigrams)
+                        if len(query_trigrams & trigrams) >= needed)
+        return [(verse, -shared / len(query_trigrams)) for shared, _, verse in ranked[:limit]]
+
+    return matches
+
+
+@pytest.fixture
+def upstream(tmp_path, monkeypatch):
+    """
+    Factory starting an in-process mock_upstream server (optionally with a
+    FaultInjector) that every upstream URL is routed to, with an empty cache
+    """
+    import mock_upstream
+    import quran_http
+
+    monkeypatch.setattr(mock_upstream, "RETRY_AFTER", 0.05)
+    monkeypatch.setattr(quran_http, "_cache", quran_http.HttpCache(tmp_path / "http_cache"))
+    monkeypatch.setattr(quran_http, "_limiters", {})
+    servers = []
+
+    def start(faults=None):
+        server = mock_upstream.MockUpstream(fixtures=tmp_path / "fixtures", asset=ASSET_FILE, faults=faults)
+        server.start()
+        servers.append(server)
+        quran_http.set_upstream(server.url)
+        return server
+
+    yield start
+    quran_http.set_upstream(None)
+    for server in servers:
+        server.stop()
@@ -0,0 +1,104 @@
+import threading
+import time
+from email.utils import formatdate
+
+import pytest
+
+import adaptive_rate
+from adaptive_rate import AdaptiveRateLimiter, parse_retry_after
+
+
+def _respond(limiter, count, status=200, retry_after=None):
+    for _ in range(count):
+        limiter.acquire()
+        limiter.release(status, retry_after)
+
+
+def test_window_grows_by_about_one_per_window_of_responses():
+    limiter = AdaptiveRateLimiter(initial_window=4)
+    _respond(limiter, 4)
+    assert 4.8 < limiter.window < 5.0
+    _respond(limiter, 5)
+    assert 5.8 < limiter.window < 6.0
+
+
+def test_window_respects_max_window():
+    limiter = AdaptiveRateLimiter(initial_window=4, max_window=5)
+    _respond(limiter, 50)
+    assert limiter.window == 5
+
+
+@pytest.mark.parametrize("status", [429, 503])
+def test_throttle_halves_once_per_cut_interval(monkeypatch, status):
+    monkeypatch.setattr(adaptive_rate, "CUT_INTERVAL", 0.2)
+    limiter = AdaptiveRateLimiter(initial_window=16)
+    _respond(limiter, 3, status)
+    assert limiter.window == 8
+    assert limiter.throttled == 3
+
+    time.sleep(0.25)
+    _respond(limiter, 1, status)
+    assert limiter.window == 4
+
+
+def test_window_never_drops_below_min_window(monkeypatch):
+    monkeypatch.setattr(adaptive_rate, "CUT_INTERVAL", 0.0)
+    limiter = AdaptiveRateLimiter(initial_window=4, min_window=1)
+    _respond(limiter, 10, 429)
+    assert limiter.window == 1
+
+
+def test_errors_without_a_status_neither_grow_nor_cut():
+    limiter = AdaptiveRateLimiter(initial_window=4)
+    _respond(limiter, 3, status=None)
+    _respond(limiter, 3, status=500)
+    assert limiter.window == 4
+    assert limiter.in_flight == 0
+
+
+def test_retry_after_pauses_new_requests():
+    limiter = AdaptiveRateLimiter(initial_window=4)
+    _respond(limiter, 1, 429, retry_after="0.3")
+    started = time.monotonic()
+    limiter.acquire()
+    assert time.monotonic() - started >= 0.25
+    limiter.release(200)
+
+
+def test_full_window_blocks_until_a_slot_is_released():
+    limiter = AdaptiveRateLimiter(initial_window=2)
+    limiter.acquire()
+    limiter.acquire()
+    acquired = threading.Event()
+    waiter = threading.Thread(target=lambda: (limiter.acquire(), acquired.set()))
+    waiter.start()
+    assert not acquired.wait(0.1)
+    limiter.release(200)
+    assert acquired.wait(1)
+    waiter.join()
+    assert limiter.in_flight == 2
+
+
+def test_slot_is_released_when_the_request_raises(monkeypatch):
+    requests = pytest.importorskip("requests")
+    import quran_http
+
+    class FailingSession:
+        def get(self, url, **kwargs):
+            raise requests.ConnectionError("refused")
+
+    monkeypatch.setattr(quran_http, "get_session", FailingSession)
+    limiter = AdaptiveRateLimiter(initial_window=1)
+    for _ in range(3):
+        with pytest.raises(requests.ConnectionError):
+            quran_http._send("https://api.quran.com/x", limiter)
+    assert limiter.in_flight == 0
+    assert limiter.window == 1
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("2") == 2.0
+    assert parse_retry_after("-5") == 0.0
+    assert 8 <= parse_retry_after(formatdate(time.time() + 10, usegmt=True)) <= 10
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
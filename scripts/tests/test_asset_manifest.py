@@ -0,0 +1,56 @@
+import json
+
+import pytest
+
+from asset_manifest import MANIFEST_NAME, load_manifest
+from quran_assets import save_quran_assets
+
+
+def _snapshot(output_dir):
+    """{relative path: (mtime_ns, bytes)} of every file under output_dir"""
+    return {path.relative_to(output_dir).as_posix(): (path.stat().st_mtime_ns, path.read_bytes())
+            for path in sorted(output_dir.rglob("*")) if path.is_file()}
+
+
+@pytest.fixture(scope="module")
+def built(quran_text, tmp_path_factory):
+    """Assets saved once into a scratch directory, with juz shards"""
+    output_file = tmp_path_factory.mktemp("assets") / "quran_text.json"
+    first_diff = save_quran_assets(quran_text, output_file, shards="juz")
+    return output_file, first_diff
+
+
+def test_first_build_records_every_page(built):
+    output_file, (changed, added, removed) = built
+    assert (changed, removed) == ([], [])
+    assert added == list(range(1, 605))
+    manifest = load_manifest(output_file.parent)
+    assert len(manifest["pages"]) == 604
+    assert "quran_corpus.json" in manifest["files"]
+    assert "shards/manifest.json" in manifest["files"]
+
+
+def test_rebuild_of_same_text_rewrites_nothing(quran_text, built):
+    output_file, _ = built
+    output_dir = output_file.parent
+    before = _snapshot(output_dir)
+
+    assert save_quran_assets(quran_text, output_file, shards="juz") == ([], [], [])
+    assert _snapshot(output_dir) == before
+
+
+def test_changed_page_is_reported_and_only_its_outputs_change(quran_text, tmp_path):
+    output_file = tmp_path / "quran_text.json"
+    save_quran_assets(quran_text, output_file, shards="juz")
+    before = _snapshot(tmp_path)
+
+    edited = dict(quran_text, **{"300": quran_text["300"].replace("ل", "لّ", 1)})
+    assert save_quran_assets(edited, output_file, shards="juz") == ([300], [], [])
+    after = _snapshot(tmp_path)
+
+    rewritten = {name for name in after if after[name] != before[name]}
+    # Page 300 is in juz 15; the other juz shards keep their bytes and mtimes
+    assert {name for name in rewritten if name.startswith("shards/juz/")} == {"shards/juz/15.json"}
+    assert {"quran_text.json", MANIFEST_NAME} <= rewritten
+    manifest = json.loads(after[MANIFEST_NAME][1])
+    assert manifest["pages"]["300"] != json.loads(before[MANIFEST_NAME][1])["pages"]["300"]
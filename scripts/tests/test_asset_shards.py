@@ -0,0 +1,48 @@
+import json
+
+from asset_shards import current_shard_mode, shard_for_page, write_shards
+from quran_assets import save_quran_assets
+
+
+def test_juz_shards_cover_every_page(quran_text, tmp_path):
+    manifest = write_shards(quran_text, tmp_path, "juz")
+    assert len(manifest["shards"]) == 30
+    assert sum(shard["pages"] for shard in manifest["shards"]) == 604
+    shard = shard_for_page(manifest, 582)
+    assert shard["file"] == "juz/30.json"
+    assert "582" in json.loads((tmp_path / "shards" / shard["file"]).read_text(encoding="utf-8"))
+
+
+def test_switching_mode_removes_the_old_shards(quran_text, tmp_path):
+    write_shards(quran_text, tmp_path, "page")
+    write_shards(quran_text, tmp_path, "juz")
+    assert not (tmp_path / "shards" / "page").exists()
+    assert len(list((tmp_path / "shards" / "juz").glob("*.json"))) == 30
+    assert current_shard_mode(tmp_path) == "juz"
+
+
+def test_pages_no_longer_in_the_text_lose_their_shards(quran_text, tmp_path):
+    write_shards(quran_text, tmp_path, "page")
+    write_shards({"1": quran_text["1"]}, tmp_path, "page")
+    assert [path.name for path in (tmp_path / "shards" / "page").glob("*.json")] == ["001.json"]
+
+
+def test_no_shards_without_a_manifest(tmp_path):
+    assert current_shard_mode(tmp_path) is None
+    (tmp_path / "shards").mkdir()
+    (tmp_path / "shards" / "manifest.json").write_text("[]", encoding="utf-8")
+    assert current_shard_mode(tmp_path) is None
+
+
+def test_save_without_shards_regenerates_existing_ones(quran_text, tmp_path):
+    # A few pages keep the save fast (the verse corpus is skipped with a warning)
+    pages = {key: quran_text[key] for key in ("1", "2", "3")}
+    output_file = tmp_path / "quran_text.json"
+    save_quran_assets(pages, output_file, shards="page")
+
+    pages["2"] = "edited"
+    save_quran_assets(pages, output_file)
+    shard = json.loads((tmp_path / "shards" / "page" / "002.json").read_text(encoding="utf-8"))
+    assert shard == {"2": "edited"}
+    manifest = json.loads((tmp_path / "quran_manifest.json").read_text(encoding="utf-8"))
+    assert "shards/page/002.json" in manifest["files"]
@@ -0,0 +1,57 @@
+import socket
+
+import pytest
+
+pytest.importorskip("urllib3")
+
+import fetch_metrics
+from urllib3.exceptions import NewConnectionError
+
+
+class FakeConnection:
+    host = "upstream.test"
+    port = 443
+
+    def __init__(self, reachable):
+        self._dns_host = self.host
+        self.reachable = reachable
+        self.tried = []
+
+    def new_conn(self):
+        self.tried.append(self._dns_host)
+        if self._dns_host not in self.reachable:
+            raise NewConnectionError(self, f"{self._dns_host} unreachable")
+        return f"socket to {self._dns_host}"
+
+
+@pytest.fixture
+def resolved(monkeypatch):
+    """getaddrinfo answers with an IPv6 and an IPv4 address (the IPv6 one first, listed twice)"""
+    infos = [(socket.AF_INET6, socket.SOCK_STREAM, 6, "", ("2001:db8::1", 443, 0, 0)),
+             (socket.AF_INET6, socket.SOCK_STREAM, 6, "", ("2001:db8::1", 443, 0, 0)),
+             (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("192.0.2.1", 443))]
+    monkeypatch.setattr(fetch_metrics.socket, "getaddrinfo", lambda *args: infos)
+
+
+def test_unreachable_first_address_falls_through_to_the_next(resolved):
+    conn = FakeConnection(reachable={"192.0.2.1"})
+    assert fetch_metrics._timed_new_conn(conn, conn.new_conn) == "socket to 192.0.2.1"
+    assert conn.tried == ["2001:db8::1", "192.0.2.1"]
+    assert conn._dns_host == "upstream.test"
+
+
+def test_last_error_is_raised_when_no_address_connects(resolved):
+    conn = FakeConnection(reachable=set())
+    with pytest.raises(NewConnectionError, match="192.0.2.1"):
+        fetch_metrics._timed_new_conn(conn, conn.new_conn)
+    assert conn._dns_host == "upstream.test"
+
+
+def test_dns_and_connect_are_timed_separately(resolved):
+    conn = FakeConnection(reachable={"2001:db8::1"})
+    fetch_metrics._current.phases = phases = {}
+    try:
+        fetch_metrics._timed_new_conn(conn, conn.new_conn)
+    finally:
+        fetch_metrics._current.phases = None
+    assert set(phases) == {"dns", "connect"}
@@ -0,0 +1,58 @@
+import pytest
+
+from fetch_planner import ENDPOINTS_BY_NAME, PageGrouper, iter_plan_pages, plan_fetch, plan_for
+from quran_meta import EDITION_ALQURAN_CLOUD, EDITION_QURAN_COM
+
+# Page 2 is shared by surahs 1 and 2, page 3 by surahs 2 and 3
+UNITS = {1: [1], 2: [1, 2], 3: [2, 3], 4: [3]}
+
+
+def _grouper(pages=(1, 2, 3, 4)):
+    return PageGrouper(pages, UNITS.__getitem__)
+
+
+def test_page_waits_for_every_unit_that_puts_text_on_it():
+    grouper = _grouper()
+    assert list(grouper.add((1, [(1, 0, "1:1"), (2, 1, "1:2")]))) == [(1, "1:1")]
+    assert list(grouper.add((2, [(2, 0, "2:1"), (3, 1, "2:2")]))) == [(2, "1:2\n\n2:1")]
+    assert list(grouper.add((3, [(3, 0, "3:1"), (4, 1, "3:2")]))) == [(3, "2:2\n\n3:1"), (4, "3:2")]
+    assert grouper.waiting == {}
+
+
+def test_verses_keep_mushaf_order_when_units_arrive_out_of_order():
+    grouper = _grouper()
+    assert list(grouper.add((3, [(3, 1, "3:1"), (4, 0, "3:2")]))) == [(4, "3:2")]
+    assert list(grouper.add((2, [(2, 0, "2:1"), (3, 0, "2:2")]))) == [(3, "2:2\n\n3:1")]
+    assert list(grouper.add((1, [(2, 0, "1:2"), (1, 1, "1:1")]))) == [(1, "1:1"), (2, "1:2\n\n2:1")]
+
+
+def test_failed_unit_drops_only_the_pages_it_touches():
+    grouper = _grouper()
+    assert list(grouper.add((1, [(1, 0, "1:1"), (2, 1, "1:2")]))) == [(1, "1:1")]
+    assert list(grouper.add((2, None))) == []
+    assert list(grouper.add((3, [(3, 0, "3:1"), (4, 1, "3:2")]))) == [(4, "3:2")]
+    assert grouper.failed == {2, 3}
+
+
+def test_unrequested_pages_are_ignored():
+    grouper = _grouper(pages=(2,))
+    assert list(grouper.add((1, [(1, 0, "1:1"), (2, 1, "1:2")]))) == []
+    assert list(grouper.add((2, [(2, 0, "2:1"), (3, 1, "2:2")]))) == [(2, "1:2\n\n2:1")]
+
+
+def test_plans_are_limited_to_the_edition():
+    plans = plan_fetch(range(1, 605), workers=8, edition=EDITION_ALQURAN_CLOUD)
+    assert [plan.endpoint.name for plan in plans] == ["alquran.cloud-page"]
+    plans = plan_fetch([582], edition=EDITION_QURAN_COM)
+    assert {plan.endpoint.edition for plan in plans} == {EDITION_QURAN_COM}
+    assert plans[0].endpoint.name == "quran.com-page"
+
+
+@pytest.mark.parametrize("pages", [[49, 50], [104, 105, 106], [598, 599, 600, 601, 602, 603, 604]])
+def test_surah_batches_group_into_the_same_pages_as_page_requests(upstream, pages):
+    upstream()
+    by_page = dict(iter_plan_pages(plan_for(ENDPOINTS_BY_NAME["quran.com-page"], pages, workers=4), workers=4))
+    by_surah = dict(iter_plan_pages(plan_for(ENDPOINTS_BY_NAME["quran.com-chapter"], pages, workers=4),
+                                    workers=4))
+    assert sorted(by_surah) == pages
+    assert by_surah == by_page
@@ -0,0 +1,153 @@
+import os
+import time
+from email.utils import formatdate
+
+import pytest
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from http_cache import HttpCache, cache_key, cacheable, freshness_lifetime, to_response
+
+URL = "https://api.alquran.cloud/v1/page/1/quran-uthmani"
+
+
+def _response(body=b"{}", status=200, **headers):
+    response = requests.Response()
+    response.status_code = status
+    response.headers = CaseInsensitiveDict({key.replace("_", "-"): value for key, value in headers.items()})
+    response._content = body
+    return response
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return HttpCache(tmp_path / "cache", max_age=60)
+
+
+@pytest.mark.parametrize("headers, lifetime", [
+    ({"Cache-Control": "max-age=300"}, 300),
+    ({"Cache-Control": "public, max-age=\"300\""}, 300),
+    ({"Cache-Control": "max-age=300", "Age": "100"}, 200),
+    ({"Cache-Control": "max-age=10", "Age": "100"}, 0),
+    ({"Cache-Control": "no-cache, max-age=300"}, 0),
+    ({"Expires": formatdate(1000, usegmt=True), "Date": formatdate(400, usegmt=True)}, 600),
+    ({"Cache-Control": "max-age=5", "Expires": formatdate(1000, usegmt=True),
+      "Date": formatdate(400, usegmt=True)}, 5),
+    ({"Expires": "0"}, 0),
+    ({}, 42),
+])
+def test_freshness_lifetime(headers, lifetime):
+    assert freshness_lifetime(CaseInsensitiveDict(headers), 42) == lifetime
+
+
+def test_no_store_is_not_cacheable():
+    assert cacheable(CaseInsensitiveDict({"Cache-Control": "no-cache"}))
+    assert not cacheable(CaseInsensitiveDict({"Cache-Control": "private, no-store"}))
+
+
+def test_cache_key_ignores_parameter_order():
+    assert cache_key(URL, {"a": 1, "b": 2}) == cache_key(URL, {"b": "2", "a": "1"})
+    assert cache_key(URL, {"a": 1}) != cache_key(URL, {"a": 2})
+
+
+def test_stored_response_round_trips(cache):
+    cache.store(URL, None, _response(b'{"code": 200}', Content_Type="application/json; charset=utf-8",
+                                     Content_Encoding="gzip"))
+    meta, body = cache.lookup(URL)
+    assert body == b'{"code": 200}'
+    assert cache.is_fresh(meta)
+    response = to_response(meta, body)
+    assert response.json() == {"code": 200}
+    assert response.from_cache
+    assert "Content-Encoding" not in response.headers  # the body is stored decoded
+
+
+def test_max_age_sets_freshness(cache, monkeypatch):
+    cache.store(URL, None, _response(Cache_Control="max-age=10"))
+    meta, _ = cache.lookup(URL)
+    assert cache.is_fresh(meta)
+    later = time.time() + 11
+    monkeypatch.setattr(time, "time", lambda: later)
+    assert not cache.is_fresh(meta)
+
+
+def test_no_cache_entry_is_stored_but_always_revalidated(cache):
+    cache.store(URL, None, _response(Cache_Control="no-cache", ETag='"v1"'))
+    meta, _ = cache.lookup(URL)
+    assert meta is not None
+    assert not cache.is_fresh(meta)
+
+
+def test_no_store_response_replaces_nothing(cache):
+    cache.store(URL, None, _response(b"old"))
+    cache.store(URL, None, _response(b"new", Cache_Control="no-store"))
+    assert cache.lookup(URL) == (None, None)
+
+
+def test_expired_expires_header_needs_revalidation(cache):
+    now = time.time()
+    cache.store(URL, None, _response(Expires=formatdate(now - 10, usegmt=True), Date=formatdate(now, usegmt=True)))
+    meta, _ = cache.lookup(URL)
+    assert not cache.is_fresh(meta)
+
+
+def test_conditional_headers_carry_the_validators(cache):
+    modified = "Wed, 01 Jan 2025 00:00:00 GMT"
+    cache.store(URL, None, _response(ETag='"v1"', Last_Modified=modified))
+    meta, _ = cache.lookup(URL)
+    assert cache.conditional_headers(meta) == {"If-None-Match": '"v1"', "If-Modified-Since": modified}
+
+    cache.store(URL, None, _response())
+    meta, _ = cache.lookup(URL)
+    assert cache.conditional_headers(meta) == {}
+
+
+def test_touch_after_304_restarts_the_freshness_window(cache, monkeypatch):
+    cache.store(URL, None, _response(b"body", Cache_Control="max-age=10", ETag='"v1"'))
+    later = time.time() + 60
+    monkeypatch.setattr(time, "time", lambda: later)
+    meta, _ = cache.lookup(URL)
+    assert not cache.is_fresh(meta)
+
+    cache.touch(URL, None, _response(b"", status=304))
+    meta, body = cache.lookup(URL)
+    assert cache.is_fresh(meta)
+    assert body == b"body"
+    assert meta["fresh_for"] == 10
+
+    cache.touch(URL, None, _response(b"", status=304, Cache_Control="max-age=600"))
+    meta, _ = cache.lookup(URL)
+    assert meta["fresh_for"] == 600
+
+
+def test_discard_forgets_the_entry(cache):
+    cache.store(URL, None, _response(b"bad"))
+    cache.discard(URL)
+    assert cache.lookup(URL) == (None, None)
+
+
+def test_store_stream_commits_only_a_complete_body(cache):
+    chunks = cache.store_stream(URL, None, _response(), iter([b"ab", b"cd"]))
+    assert next(chunks) == b"ab"
+    chunks.close()  # interrupted download
+    assert cache.lookup(URL) == (None, None)
+
+    assert b"".join(cache.store_stream(URL, None, _response(), iter([b"ab", b"cd"]))) == b"abcd"
+    assert cache.lookup(URL)[1] == b"abcd"
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = HttpCache(tmp_path / "cache", max_bytes=350)
+    urls = [f"{URL}?n={n}" for n in range(3)]
+    for age, url in zip((30, 20, 10), urls):
+        cache.store(url, None, _response(b"x" * 100))
+        body_path = cache.directory / f"{cache_key(url)}.body"
+        os.utime(body_path, (time.time() - age,) * 2)
+    cache.lookup(urls[0])  # the oldest entry was just used
+
+    cache.store(f"{URL}?n=3", None, _response(b"x" * 100))
+    assert cache.lookup(urls[1]) == (None, None)  # evicted down to 90% of the budget
+    assert cache.lookup(urls[0])[1] == b"x" * 100
+    assert cache.lookup(urls[2])[1] == b"x" * 100
+    assert cache.lookup(f"{URL}?n=3")[1] == b"x" * 100
+    assert not list(cache.directory.glob(f"{cache_key(urls[1])}.*"))
@@ -0,0 +1,94 @@
+import pytest
+
+import quran_http
+import quran_pipeline
+from mock_upstream import FaultInjector
+from progress_journal import PageJournal
+from retry_policy import FetchError, call_with_retries, get_json
+
+PAGE_URL = "https://api.alquran.cloud/v1/page/{}/quran-uthmani"
+
+
+class ScriptedFaults(FaultInjector):
+    """Answers the first requests with the given statuses (None = serve normally)"""
+
+    def __init__(self, statuses):
+        super().__init__()
+        self.statuses = list(statuses)
+
+    def fault(self):
+        with self._lock:
+            return self.statuses.pop(0) if self.statuses else None
+
+
+def test_throttled_request_carries_retry_after(upstream):
+    server = upstream(FaultInjector(throttle_rate=1.0))
+    with pytest.raises(FetchError) as error:
+        get_json(PAGE_URL.format(1))
+    assert error.value.kind == "rate_limited"
+    assert error.value.status == 429
+    assert error.value.retry_after == 0.05
+    assert quran_http.limiter_for(PAGE_URL.format(1)).throttled == 1
+    assert server.snapshot()["status_429"] == 1
+
+
+def test_unavailable_request_is_a_retryable_server_error(upstream):
+    upstream(FaultInjector(error_rate=1.0))
+    with pytest.raises(FetchError) as error:
+        get_json(PAGE_URL.format(1))
+    assert error.value.kind == "server"
+    assert error.value.status == 503
+    assert error.value.retryable
+
+
+def test_retries_get_through_429_and_503(upstream):
+    server = upstream(ScriptedFaults([429, 503, 429]))
+    data = call_with_retries(get_json, PAGE_URL.format(1), base_delay=0.01, max_delay=0.05)
+    assert data["data"]["number"] == 1
+    stats = server.snapshot()
+    assert stats["requests"] == 4
+    assert (stats["status_429"], stats["status_503"], stats["status_200"]) == (2, 1, 1)
+
+
+def test_retries_give_up_after_the_last_attempt(upstream):
+    server = upstream(ScriptedFaults([503] * 10))
+    with pytest.raises(FetchError, match="HTTP 503"):
+        call_with_retries(get_json, PAGE_URL.format(1), attempts=3, base_delay=0.01, max_delay=0.05)
+    assert server.snapshot()["requests"] == 3
+
+
+def test_resume_fetches_only_pages_missing_from_an_interrupted_run(upstream, quran_text, tmp_path, monkeypatch):
+    upstream()
+    monkeypatch.chdir(tmp_path)  # the journal lives in .quran_build under the working directory
+    requested = []
+    build_sources = quran_pipeline.build_sources
+
+    def recording_sources(names):
+        sources = build_sources(names)
+        fetch_page = sources[0].fetch_page
+        calls = requested[-1]
+        sources[0].fetch_page = lambda page: calls.append(page) or fetch_page(page)
+        return sources
+
+    def interrupt_after(count):
+        def report(page_num, page_text):
+            if len(PageJournal(quran_pipeline.JOURNALS["alquran.cloud-page"]).load()) >= count:
+                raise KeyboardInterrupt
+        return report
+
+    monkeypatch.setattr(quran_pipeline, "build_sources", recording_sources)
+    monkeypatch.setattr(quran_pipeline, "print_page_result", lambda total: interrupt_after(3))
+    pages = list(range(1, 9))
+
+    requested.append([])
+    with pytest.raises(KeyboardInterrupt):
+        quran_pipeline.fetch("alquran.cloud-page", pages, workers=1)
+    journaled = PageJournal(quran_pipeline.JOURNALS["alquran.cloud-page"]).load()
+    assert len(journaled) == 3
+
+    monkeypatch.setattr(quran_pipeline, "print_page_result", lambda total: lambda page_num, page_text: None)
+    requested.append([])
+    fetched, missing = quran_pipeline.fetch("alquran.cloud-page", pages, workers=1, resume=True)
+    assert missing == []
+    assert sorted(requested[-1]) == [page for page in pages if str(page) not in journaled]
+    assert fetched == {str(page): quran_text[str(page)] for page in pages}
@@ -0,0 +1,50 @@
+import json
+
+import pytest
+
+from asset_manifest import build_manifest, encode_asset, page_hashes, write_manifest
+from quran_meta import EDITION_ALQURAN_CLOUD, EDITION_QURAN_COM
+from quran_pipeline import EditionMismatch, overlay_pages
+
+
+@pytest.fixture
+def asset(quran_text, tmp_path):
+    """A copy of the asset whose manifest records the AlQuran.cloud edition"""
+    output_file = tmp_path / "quran_text.json"
+    data = encode_asset(quran_text)
+    output_file.write_bytes(data)
+    write_manifest(build_manifest(data, page_hashes(quran_text), tmp_path, [], edition=EDITION_ALQURAN_CLOUD),
+                   tmp_path)
+    return output_file
+
+
+def test_same_edition_pages_are_merged(quran_text, asset):
+    merged = overlay_pages({"600": "new text"}, asset, edition=EDITION_ALQURAN_CLOUD)
+    assert merged["600"] == "new text"
+    assert merged["1"] == quran_text["1"]
+    assert list(merged) == [str(page) for page in range(1, 605)]
+
+
+def test_other_edition_pages_are_refused(asset):
+    before = asset.read_bytes()
+    with pytest.raises(EditionMismatch, match="603 pages in the old edition"):
+        overlay_pages({"600": "new text"}, asset, edition=EDITION_QURAN_COM)
+    assert asset.read_bytes() == before
+
+
+def test_other_edition_may_replace_every_page(quran_text, asset):
+    replacement = {key: "x" for key in quran_text}
+    assert overlay_pages(replacement, asset, edition=EDITION_QURAN_COM) == replacement
+
+
+def test_asset_without_manifest_takes_the_reference_edition(quran_text, tmp_path):
+    output_file = tmp_path / "quran_text.json"
+    output_file.write_text(json.dumps(quran_text, ensure_ascii=False), encoding="utf-8")
+    with pytest.raises(EditionMismatch):
+        overlay_pages({"1": "x"}, output_file, edition=EDITION_QURAN_COM)
+    assert overlay_pages({"1": "x"}, output_file, edition=EDITION_ALQURAN_CLOUD)["1"] == "x"
+
+
+def test_no_asset_accepts_any_edition(tmp_path):
+    assert overlay_pages({"2": "b", "1": "a"}, tmp_path / "quran_text.json", edition=EDITION_QURAN_COM) == \
+        {"1": "a", "2": "b"}
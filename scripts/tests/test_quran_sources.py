@@ -0,0 +1,78 @@
+import threading
+import time
+
+import pytest
+
+from quran_sources import HedgedFetcher
+
+
+class FakeSource:
+    """Answers each call after the next scripted (delay, text)"""
+
+    name = "fake"
+
+    def __init__(self, *answers):
+        self.answers = list(answers)
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def fetch_page(self, page_number):
+        with self._lock:
+            self.calls.append(time.monotonic())
+            delay, text = self.answers.pop(0)
+        time.sleep(delay)
+        return text
+
+
+@pytest.fixture
+def hedged():
+    fetchers = []
+
+    def make(source, hedge_delay=0.1):
+        fetcher = HedgedFetcher(source, hedge_delay=hedge_delay, max_workers=1)
+        fetchers.append(fetcher)
+        return fetcher
+
+    yield make
+    for fetcher in fetchers:
+        fetcher.close()
+
+
+def test_fast_answer_is_not_hedged(hedged):
+    source = FakeSource((0, "first"), (0, "second"))
+    fetcher = hedged(source)
+    assert fetcher.fetch_page(1) == "first"
+    assert len(source.calls) == 1
+    assert fetcher.hedges == 0
+
+
+def test_hedge_fires_after_the_delay_and_the_first_answer_wins(hedged):
+    source = FakeSource((1.0, "slow"), (0, "hedge"))
+    fetcher = hedged(source, hedge_delay=0.1)
+    start = time.monotonic()
+    assert fetcher.fetch_page(1) == "hedge"
+    assert time.monotonic() - start < 0.5
+    first, second = source.calls
+    assert second - first >= 0.1
+    assert (fetcher.hedges, fetcher.hedge_wins) == (1, 1)
+
+
+def test_original_answer_wins_over_a_slower_hedge(hedged):
+    source = FakeSource((0.2, "original"), (1.0, "hedge"))
+    fetcher = hedged(source, hedge_delay=0.05)
+    assert fetcher.fetch_page(1) == "original"
+    assert (fetcher.hedges, fetcher.hedge_wins) == (1, 0)
+
+
+def test_failure_is_retried_without_waiting_for_the_delay(hedged):
+    source = FakeSource((0, None), (0, "retry"))
+    fetcher = hedged(source, hedge_delay=5.0)
+    start = time.monotonic()
+    assert fetcher.fetch_page(1) == "retry"
+    assert time.monotonic() - start < 1.0
+
+
+def test_no_answer_after_every_copy_failed(hedged):
+    fetcher = hedged(FakeSource((0, None), (0, None)))
+    assert fetcher.fetch_page(1) is None
+    assert fetcher.health.failures == 2
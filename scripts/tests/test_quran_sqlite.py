@@ -0,0 +1,74 @@
+import sqlite3
+
+import pytest
+
+from arabic_normalize import search_form
+from quran_sqlite import SQLITE_SCHEMA_VERSION, fts5_available, search, write_database
+from verse_corpus import build_corpus
+
+
+@pytest.fixture(scope="module")
+def corpus(verses):
+    return build_corpus(verses)
+
+
+@pytest.fixture(scope="module")
+def database(corpus, normalized, quran_text, tmp_path_factory):
+    path = tmp_path_factory.mktemp("sqlite") / "quran.sqlite"
+    write_database(corpus, normalized, quran_text, path)
+    return path
+
+
+@pytest.fixture
+def conn(database):
+    conn = sqlite3.connect(f"file:{database}?mode=ro", uri=True)
+    yield conn
+    conn.close()
+
+
+def test_rebuild_is_byte_identical(corpus, normalized, quran_text, database, tmp_path):
+    first = database.read_bytes()
+    mtime = database.stat().st_mtime_ns
+
+    # Into the same path: nothing to write
+    write_database(corpus, normalized, quran_text, database)
+    assert database.stat().st_mtime_ns == mtime
+    # Into a fresh path: the same bytes
+    other = tmp_path / "quran.sqlite"
+    write_database(corpus, normalized, quran_text, other)
+    assert other.read_bytes() == first
+
+
+def test_tables_match_the_asset(conn, verses, normalized, quran_text):
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == SQLITE_SCHEMA_VERSION
+    rows = conn.execute("SELECT id, surah, ayah, page, text, search FROM verses ORDER BY id").fetchall()
+    assert [row[1:5] for row in rows] == [tuple(verse) for verse in verses]
+    assert [row[0] for row in rows] == list(range(1, len(verses) + 1))
+    assert [row[5] for row in rows] == normalized["search"]
+
+    pages = conn.execute("SELECT page, first_verse, verse_count, text FROM pages ORDER BY page").fetchall()
+    assert len(pages) == len(quran_text) == 604
+    for page, first_verse, verse_count, text in pages:
+        assert text == quran_text[str(page)]
+        assert len(text.split("\n\n")) == verse_count
+        assert verses[first_verse - 1][2] == page
+
+
+def test_lookups_use_the_indexes(conn):
+    for query, index in [("SELECT * FROM verses WHERE page = 50", "verses_page"),
+                         ("SELECT * FROM verses WHERE surah = 2 AND ayah = 255", "verses_surah_ayah"),
+                         ("SELECT * FROM verses WHERE juz = 30", "verses_juz")]:
+        plan = " ".join(row[-1] for row in conn.execute("EXPLAIN QUERY PLAN " + query))
+        assert index in plan, plan
+    assert conn.execute("SELECT surah, ayah, page FROM verses WHERE surah = 2 AND ayah = 255").fetchone() == (2, 255, 42)
+
+
+@pytest.mark.skipif(not fts5_available(), reason="SQLite built without FTS5")
+def test_full_text_search_matches_word_scan(conn, normalized):
+    for query in ["الحمد لله", "رب العالمين", "الله الصمد"]:
+        words = search_form(query).split()
+        expected = {verse + 1 for verse, text in enumerate(normalized["search"])
+                    if all(word in text.split() for word in words)}
+        rows = search(conn, query, limit=10000)
+        assert {conn.execute("SELECT id FROM verses WHERE surah = ? AND ayah = ?", row[:2]).fetchone()[0]
+                for row in rows} == expected
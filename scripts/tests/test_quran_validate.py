@@ -0,0 +1,104 @@
+import pytest
+
+from quran_meta import EDITION_ALQURAN_CLOUD, EDITION_QURAN_COM
+from quran_validate import load_reference, validate_quran_text
+
+
+def _checks(report):
+    return {item["check"] for item in report["errors"]}
+
+
+def _drop_verse(quran_text, page):
+    corrupted = dict(quran_text)
+    corrupted[str(page)] = "\n\n".join(corrupted[str(page)].split("\n\n")[:-1])
+    return corrupted
+
+
+def _duplicate_verse(quran_text, page):
+    corrupted = dict(quran_text)
+    corrupted[str(page)] += "\n\n" + corrupted[str(page)].split("\n\n")[-1]
+    return corrupted
+
+
+def test_checked_in_asset_is_valid(quran_text):
+    report = validate_quran_text(quran_text, load_reference())
+    assert report["ok"], report["errors"]
+    assert report["pages"]["present"] == 604
+    assert report["verses"]["found"] == report["verses"]["expected"] == 6236
+    assert report["checksums"]["reference"]
+    assert report["checksums"]["mismatched"] == []
+
+
+def test_missing_page_fails(quran_text):
+    corrupted = dict(quran_text)
+    del corrupted["300"]
+    report = validate_quran_text(corrupted)
+    assert not report["ok"]
+    assert report["pages"]["missing"] == [300]
+    assert "pages" in _checks(report)
+
+
+@pytest.mark.parametrize("text", ["", "   \n", None])
+def test_empty_page_fails(quran_text, text):
+    corrupted = dict(quran_text, **{"12": text})
+    report = validate_quran_text(corrupted)
+    assert not report["ok"]
+    assert report["pages"]["missing"] == [12]
+
+
+def test_unexpected_key_fails(quran_text):
+    report = validate_quran_text(dict(quran_text, **{"605": "extra"}))
+    assert not report["ok"]
+    assert report["pages"]["unexpected"] == ["605"]
+
+
+def test_dropped_verse_fails(quran_text):
+    report = validate_quran_text(_drop_verse(quran_text, 10))
+    assert not report["ok"]
+    assert report["verses"]["found"] == 6235
+
+
+def test_duplicated_verse_fails_at_surah_boundary(quran_text):
+    report = validate_quran_text(_duplicate_verse(quran_text, 10))
+    assert not report["ok"]
+    assert report["verses"]["found"] == 6237
+    # Surah 3 opens page 50; one extra verse before it moves it to page 49
+    assert any(item["check"] == "order" and item["page"] == 49 for item in report["errors"])
+
+
+def test_shifted_verses_fail_even_with_the_right_total(quran_text):
+    corrupted = _drop_verse(_duplicate_verse(quran_text, 10), 100)
+    report = validate_quran_text(corrupted)
+    assert not report["ok"]
+    assert report["verses"]["found"] == 6236
+    assert _checks(report) == {"order"}
+
+
+def test_stray_blank_lines_fail(quran_text):
+    corrupted = dict(quran_text, **{"20": quran_text["20"] + "\n\n"})
+    report = validate_quran_text(corrupted)
+    assert not report["ok"]
+    assert "verses" in _checks(report)
+
+
+def _drifted(quran_text):
+    return dict(quran_text, **{"2": quran_text["2"].replace("ل", "لّ", 1)})
+
+
+@pytest.mark.parametrize("edition", [None, EDITION_ALQURAN_CLOUD])
+def test_reference_drift_fails_within_the_same_edition(quran_text, edition):
+    report = validate_quran_text(_drifted(quran_text), load_reference(), edition)
+    assert not report["ok"]
+    assert _checks(report) == {"checksums"}
+    assert report["checksums"]["mismatched"] == [2]
+
+
+def test_reference_drift_is_a_warning_for_another_edition(quran_text):
+    report = validate_quran_text(_drifted(quran_text), load_reference(), EDITION_QURAN_COM)
+    assert report["ok"], report["errors"]
+    assert report["checksums"]["drift_expected"]
+    assert report["checksums"]["mismatched"] == [2]
+
+
+def test_reference_records_the_asset_edition():
+    assert load_reference()["edition"] == EDITION_ALQURAN_CLOUD
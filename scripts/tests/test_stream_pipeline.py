@@ -0,0 +1,89 @@
+import itertools
+import threading
+import time
+
+import pytest
+
+from stream_pipeline import Stage, run_stages
+
+
+def _counting(items, produced):
+    for item in items:
+        produced.append(item)
+        yield item
+
+
+def test_single_workers_keep_the_source_order():
+    stages = [Stage(lambda x: [x * 2]), Stage(lambda x: [x, x + 1] if x % 4 == 0 else [])]
+    assert list(run_stages(range(6), *stages)) == [0, 1, 4, 5, 8, 9]
+
+
+def test_finish_output_follows_the_last_item():
+    seen = []
+    stage = Stage(lambda x: seen.append(x) or (), finish=lambda: [sum(seen)])
+    assert list(run_stages(range(5), Stage(lambda x: [x]), stage)) == [10]
+
+
+def test_parallel_workers_process_every_item_once():
+    def slow(x):
+        time.sleep(0.001 * (x % 3))
+        return [x]
+
+    assert sorted(run_stages(range(200), Stage(slow, workers=8))) == list(range(200))
+
+
+def test_finish_runs_once_after_every_worker_is_done():
+    calls = []
+    stage = Stage(lambda x: [x], workers=4, finish=lambda: calls.append(1) or ["done"])
+    output = list(run_stages(range(50), stage))
+    assert output[-1] == "done"
+    assert calls == [1]
+
+
+def test_bounded_queues_hold_back_a_fast_source():
+    produced = []
+    pipeline = run_stages(_counting(itertools.count(), produced), Stage(lambda x: [x]), buffer=2)
+    assert next(pipeline) == 0
+    time.sleep(0.3)
+    # At most two queues of two items, plus one item in the hands of each thread
+    assert len(produced) <= 2 * 2 + 3
+    pipeline.close()
+
+
+def test_closing_early_stops_the_source():
+    produced = []
+    pipeline = run_stages(_counting(itertools.count(), produced), Stage(lambda x: [x]), buffer=2)
+    assert list(itertools.islice(pipeline, 3)) == [0, 1, 2]
+    pipeline.close()
+    time.sleep(0.3)
+    count = len(produced)
+    time.sleep(0.3)
+    assert len(produced) == count
+
+
+def test_stage_error_stops_the_pipeline_and_is_raised():
+    produced = []
+
+    def fail_on_five(x):
+        if x == 5:
+            raise ValueError("bad item")
+        return [x]
+
+    before = threading.active_count()
+    with pytest.raises(ValueError, match="bad item"):
+        list(run_stages(_counting(itertools.count(), produced), Stage(fail_on_five), Stage(lambda x: [x]),
+                        buffer=2))
+    time.sleep(0.3)
+    count = len(produced)
+    time.sleep(0.3)
+    assert len(produced) == count
+    assert threading.active_count() <= before
+
+
+def test_source_error_is_raised():
+    def source():
+        yield 1
+        raise OSError("connection lost")
+
+    with pytest.raises(OSError, match="connection lost"):
+        list(run_stages(source(), Stage(lambda x: [x])))
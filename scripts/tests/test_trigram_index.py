@@ -0,0 +1,29 @@
+import pytest
+
+from trigram_index import TrigramIndex, build_trigram_index, text_trigrams
+
+QUERIES = ["الرحمان", "مستقي", "الحمد لله", "xyz", "", "ا"]
+
+
+@pytest.fixture(scope="module")
+def index(normalized):
+    return TrigramIndex(build_trigram_index(normalized["search"]))
+
+
+@pytest.mark.parametrize("min_score, limit", [(0.5, 20), (0.3, 50), (1.0, 10), (0.0, 5)])
+def test_search_matches_brute_force(index, typo_phrases, trigram_matches, min_score, limit):
+    for query in QUERIES + typo_phrases:
+        expected = trigram_matches(query, min_score, limit)
+        assert index.search(query, min_score=min_score, limit=limit) == expected, query
+
+
+def test_exact_verse_ranks_first(index, normalized):
+    for verse in range(0, len(normalized["search"]), 500):
+        results = index.search(normalized["search"][verse], min_score=1.0, limit=50)
+        assert results[0][1] == 1.0
+        assert verse in [match for match, _ in results]
+
+
+def test_padding_marks_word_edges():
+    assert text_trigrams("ابت") == {" اب", "ابت", "بت "}
+    assert text_trigrams("") == set()
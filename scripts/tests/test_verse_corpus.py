@@ -0,0 +1,31 @@
+import pytest
+
+from tanzil_stream import iter_tanzil_verses
+from verse_corpus import build_corpus
+
+XML = """<?xml version="1.0" encoding="utf-8"?>
+<quran><sura index="1">
+<aya index="1" page="1" text="a"/><aya index="2"{page} text="b"/>
+</sura></quran>"""
+
+
+def test_indexes_locate_every_verse(verses):
+    corpus = build_corpus(verses)
+    assert corpus["verse_count"] == 6236
+    start, end = corpus["page_verse_start"][581], corpus["page_verse_start"][582]
+    assert {corpus["page"][verse] for verse in range(start, end)} == {582}
+    verse = corpus["surah_verse_start"][1] + 255 - 1  # 2:255
+    assert (corpus["surah"][verse], corpus["ayah"][verse], corpus["juz"][verse]) == (2, 255, 3)
+    text = corpus["text"][corpus["text_offset"][verse]:corpus["text_offset"][verse + 1]]
+    assert text == verses[verse][3]
+
+
+def test_tanzil_verses_with_pages_are_accepted():
+    corpus = build_corpus(iter_tanzil_verses([XML.format(page=' page="2"').encode("utf-8")]))
+    assert corpus["page"] == [1, 2]
+    assert corpus["text"] == "ab"
+
+
+def test_verse_without_a_page_is_refused():
+    with pytest.raises(ValueError, match="verse 1:2 has no page number"):
+        build_corpus(iter_tanzil_verses([XML.format(page="").encode("utf-8")]))
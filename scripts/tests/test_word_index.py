@@ -0,0 +1,37 @@
+import pytest
+
+from arabic_normalize import search_form
+from word_index import WordIndex, build_word_index
+
+QUERIES = ["الله", "الحمد لله", "رب العالمين", "بسم الله الرحمن الرحيم", "كلمة_غير_موجودة", "", "   "]
+
+
+@pytest.fixture(scope="module")
+def index(verses, normalized):
+    return WordIndex(build_word_index(normalized["search"], [page for _, _, page, _ in verses]))
+
+
+def test_search_matches_brute_force(index, phrases, word_matches):
+    for query in QUERIES + phrases:
+        assert index.search(query) == word_matches(query), query
+
+
+def test_search_normalizes_the_query(index, verses):
+    # The fully voweled first verse of surah 1 finds the same verses as its search form
+    text = verses[0][3]
+    assert index.search(text) == index.search(search_form(text))
+    assert (1, 0) in index.search(text)
+
+
+def test_every_word_lookup_matches_its_verses(index, verses, verse_words):
+    vocabulary = sorted(set().union(*verse_words))
+    assert index.words == vocabulary
+    for word in vocabulary[::25]:
+        assert index.lookup(word) == [(verses[verse][2], verse) for verse, present in enumerate(verse_words)
+                                      if word in present]
+
+
+def test_prefix_matches_sorted_vocabulary(index, verse_words):
+    vocabulary = sorted(set().union(*verse_words))
+    for prefix in ["ال", "الر", "مست", "ق", "zz"]:
+        assert index.prefix(prefix, limit=15) == [word for word in vocabulary if word.startswith(prefix)][:15]
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Character trigram index for fuzzy and partial-word search
+
+quran_trigram_index.json maps every character trigram of the `search` form
+(arabic_normalize.search_form) to the verses containing it. Each word is
+padded with a space on both sides first, so " ال" marks a word start and
+"ين " a word end:
+    trigrams        sorted trigram vocabulary (code point order)
+    posting_start   len(trigrams) + 1 offsets into `postings`; trigram i owns
+                    postings[posting_start[i]:posting_start[i + 1]]
+    postings        verse numbers (indexes into quran_corpus.json), sorted and
+                    delta-encoded per trigram (the first one is absolute)
+
+Scoring (TrigramIndex.search), which the app's search is expected to match:
+    1. the query is normalized and split into its distinct padded trigrams
+    2. score = shared distinct trigrams / distinct query trigrams
+    3. verses scoring at least `min_score` are ranked by score, then by their
+       own number of distinct trigrams (shorter first), then by verse order
+Scores are counted for all verses at once on bitsets (see TrigramIndex), so
+the result is exact without visiting verses one by one.
+
+Usage:
+    python scripts/trigram_index.py                          # build from assets/quran/quran_text.json
+    python scripts/trigram_index.py --query "الرحمان"        # ranked fuzzy matches
+    python scripts/trigram_index.py --query "مستقي" --min-score 0.4
+"""
+
+import argparse
+import json
+import math
+from bisect import bisect_left
+from pathlib import Path
+
+from arabic_normalize import search_form
+from asset_manifest import write_if_changed
+
+TRIGRAM_INDEX_VERSION = 1
+DEFAULT_MIN_SCORE = 0.5
+DEFAULT_LIMIT = 20
+
+
+def text_trigrams(text):
+    """Distinct trigrams of already normalized text, each word padded with spaces"""
+    trigrams = set()
+    for word in text.split():
+        padded = f" {word} "
+        trigrams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return trigrams
+
+
+def build_trigram_index(search_texts):
+    """Index dict from per-verse search-form texts"""
+    postings = {}
+    verse_count = 0
+    for verse, text in enumerate(search_texts):
+        verse_count += 1
+        for trigram in text_trigrams(text):
+            postings.setdefault(trigram, []).append(verse)
+
+    trigrams = sorted(postings)
+    posting_start = [0]
+    flat = []
+    for trigram in trigrams:
+        previous = 0
+        # Verses are enumerated in order, so each list is already sorted
+        for verse in postings[trigram]:
+            flat.append(verse - previous)
+            previous = verse
+        posting_start.append(len(flat))
+
+    return {
+        "version": TRIGRAM_INDEX_VERSION,
+        "verse_count": verse_count,
+        "trigram_count": len(trigrams),
+        "trigrams": trigrams,
+        "posting_start": posting_start,
+        "postings": flat,
+    }
+
+
+def write_trigram_index(index, path):
+    path = Path(path)
+    data = json.dumps(index, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    write_if_changed(path, data)
+    return len(data)
+
+
+class TrigramIndex:
+    """
+    Ranked fuzzy search over an index dict. On load every posting list becomes
+    a bitset (an int with one bit per verse), with bits ordered by rank among
+    equal scores - fewest distinct trigrams first, then verse order - so the
+    lowest set bits of a mask are always the best matches in it.
+    """
+
+    def __init__(self, index):
+        self.index = index
+        self.trigrams = index["trigrams"]
+        starts, flat = index["posting_start"], index["postings"]
+        postings = []
+        for trigram_id in range(len(self.trigrams)):
+            verses, verse = [], 0
+            for delta in flat[starts[trigram_id]:starts[trigram_id + 1]]:
+                verse += delta
+                verses.append(verse)
+            postings.append(verses)
+
+        # Distinct trigrams per verse: among equal scores the shorter, more focused verse ranks first
+        sizes = [0] * index["verse_count"]
+        for verses in postings:
+            for verse in verses:
+                sizes[verse] += 1
+        self.order = sorted(range(index["verse_count"]), key=lambda verse: (sizes[verse], verse))
+        bit_of = {verse: bit for bit, verse in enumerate(self.order)}
+        self.all_verses = (1 << index["verse_count"]) - 1
+        self.masks = []
+        for verses in postings:
+            bits = bytearray((index["verse_count"] + 7) // 8)
+            for verse in verses:
+                bit = bit_of[verse]
+                bits[bit >> 3] |= 1 << (bit & 7)
+            self.masks.append(int.from_bytes(bits, "little"))
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def _trigram_id(self, trigram):
+        position = bisect_left(self.trigrams, trigram)
+        if position < len(self.trigrams) and self.trigrams[position] == trigram:
+            return position
+        return None
+
+    def search(self, query, min_score=DEFAULT_MIN_SCORE, limit=DEFAULT_LIMIT):
+        """[(verse, score)] best first; see the module docstring for the scoring rules"""
+        query_trigrams = text_trigrams(search_form(query))
+        if not query_trigrams:
+            return []
+        # Trigrams the corpus doesn't contain still count against the score
+        masks = [self.masks[trigram_id] for trigram_id in map(self._trigram_id, query_trigrams)
+                 if trigram_id is not None]
+        needed = max(1, math.ceil(min_score * len(query_trigrams) - 1e-9))
+        if needed > len(masks):
+            return []
+
+        # Count the shared trigrams of every verse at once: planes[b] holds
+        # bit b of each verse's count, and each mask is added with carries
+        planes = []
+        for carry in masks:
+            for b, plane in enumerate(planes):
+                planes[b], carry = plane ^ carry, plane & carry
+                if not carry:
+                    break
+            if carry:
+                planes.append(carry)
+
+        results = []
+        # Counts above what the planes can hold don't occur (and would alias lower ones)
+        for count in range(min(len(masks), (1 << len(planes)) - 1), needed - 1, -1):
+            matching = self.all_verses
+            for b, plane in enumerate(planes):
+                matching &= plane if count >> b & 1 else self.all_verses ^ plane
+            while matching and len(results) < limit:
+                lowest = matching & -matching
+                results.append((self.order[lowest.bit_length() - 1], count / len(query_trigrams)))
+                matching ^= lowest
+            if len(results) >= limit:
+                break
+        return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the trigram index from quran_text.json")
+    parser.add_argument("--input", default="assets/quran/quran_text.json")
+    parser.add_argument("--output", default="assets/quran/quran_trigram_index.json")
+    parser.add_argument("--query", help="search the index at --output instead of building it")
+    parser.add_argument("--min-score", type=float, default=DEFAULT_MIN_SCORE,
+                        help=f"share of the query's trigrams a verse must contain (default {DEFAULT_MIN_SCORE:g})")
+    parser.add_argument("--limit", type=int, default=DEFAULT_LIMIT)
+    args = parser.parse_args()
+
+    if args.query:
+        from verse_corpus import VerseCorpus
+
+        index = TrigramIndex.load(args.output)
+        corpus = VerseCorpus.load(Path(args.output).with_name("quran_corpus.json"))
+        results = index.search(args.query, min_score=args.min_score, limit=args.limit)
+        print(f"{len(results)} verses")
+        for verse, score in results:
+            print(f"  {score:.2f}  {corpus.corpus['surah'][verse]}:{corpus.corpus['ayah'][verse]} "
+                  f"(page {corpus.corpus['page'][verse]})  {corpus.text(verse)}")
+        return
+
+    from verse_corpus import verses_from_page_text
+
+    with open(args.input, encoding="utf-8") as f:
+        quran_text = json.load(f)
+    index = build_trigram_index(search_form(text) for _, _, _, text in verses_from_page_text(quran_text))
+    size = write_trigram_index(index, args.output)
+    print(f"[OK] {args.output}: {index['trigram_count']} trigrams, {len(index['postings'])} postings, "
+          f"{size / 1024:.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
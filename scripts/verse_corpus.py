@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Verse-level columnar corpus with precomputed lookup indexes
+
+quran_corpus.json holds parallel arrays (one entry per verse, mushaf order):
+    surah, ayah, page, juz      verse coordinates
+    text_offset                 N + 1 offsets into `text` (UTF-16 code units,
+                                i.e. Dart String indexes); verse i is
+                                text[text_offset[i]:text_offset[i + 1]]
+and indexes:
+    page_verse_start            605 entries; page p = verses [p-1] .. [p] - 1
+    surah_verse_start           115 entries; verse (s, a) = surah_verse_start[s-1] + a - 1
+    surah_page_range            [first_page, last_page] per surah
+
+Usage:
+    python scripts/verse_corpus.py           # build from assets/quran/quran_text.json
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+from asset_manifest import write_if_changed
+from quran_meta import SURAH_AYAH_COUNTS, TOTAL_PAGES, TOTAL_SURAHS, TOTAL_VERSES, juz_for_page
+
+CORPUS_VERSION = 1
+VERSE_SEPARATOR = '\n\n'
+
+
+def verses_from_page_text(quran_text):
+    """
+    Recover (surah, ayah, page, text) from the page map, where each page is its
+    verses joined by a blank line. Verse identities follow from mushaf order
+    and the per-surah ayah counts, so every verse must be present.
+    """
+    texts = []
+    for page in range(1, TOTAL_PAGES + 1):
+        page_text = quran_text.get(str(page))
+        if not page_text:
+            raise ValueError(f"page {page} is missing")
+        texts.extend((page, verse) for verse in page_text.split(VERSE_SEPARATOR))
+
+    if len(texts) != TOTAL_VERSES:
+        raise ValueError(f"expected {TOTAL_VERSES} verses, found {len(texts)} "
+                         f"(pages must separate verses with a blank line)")
+
+    index = 0
+    for surah, ayah_count in enumerate(SURAH_AYAH_COUNTS, 1):
+        for ayah in range(1, ayah_count + 1):
+            page, text = texts[index]
+            yield surah, ayah, page, text
+            index += 1
+
+
+def _utf16_length(text):
+    return len(text.encode('utf-16-le')) // 2
+
+
+def build_corpus(verses):
+    """
+    Columnar corpus dict from (surah, ayah, page, text) tuples in mushaf order,
+    e.g. verses_from_page_text(). Every verse needs its page, so
+    tanzil_stream.iter_tanzil_verses() output only qualifies for an XML that
+    carries page attributes; a verse with page None raises ValueError.
+    """
+    surahs, ayahs, pages, juzs, offsets, texts = [], [], [], [], [0], []
+
+    for surah, ayah, page, text in verses:
+        if page is None:
+            raise ValueError(f"verse {surah}:{ayah} has no page number")
+        surahs.append(surah)
+        ayahs.append(ayah)
+        pages.append(page)
+        juzs.append(juz_for_page(page))
+        texts.append(text)
+        offsets.append(offsets[-1] + _utf16_length(text))
+
+    count = len(surahs)
+
+    # Entry p holds the end (exclusive) of page/surah p, i.e. the start of p + 1
+    page_verse_start = [0] * (TOTAL_PAGES + 1)
+    surah_verse_start = [0] * (TOTAL_SURAHS + 1)
+    surah_page_range = [[0, 0] for _ in range(TOTAL_SURAHS)]
+    for index, (surah, page) in enumerate(zip(surahs, pages)):
+        page_verse_start[page] = index + 1
+        surah_verse_start[surah] = index + 1
+        page_range = surah_page_range[surah - 1]
+        if not page_range[0]:
+            page_range[0] = page
+        page_range[1] = page
+
+    return {
+        "version": CORPUS_VERSION,
+        "verse_count": count,
+        "surah": surahs,
+        "ayah": ayahs,
+        "page": pages,
+        "juz": juzs,
+        "text_offset": offsets,
+        "text": ''.join(texts),
+        "page_verse_start": page_verse_start,
+        "surah_verse_start": surah_verse_start,
+        "surah_page_range": surah_page_range,
+    }
+
+
+def write_corpus(corpus, path):
+    path = Path(path)
+    data = json.dumps(corpus, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    write_if_changed(path, data)
+    return len(data)
+
+
+class VerseCorpus:
+    """O(1) lookups over a corpus dict (the same arithmetic a client would do)"""
+
+    def __init__(self, corpus):
+        self.corpus = corpus
+        # Offsets are UTF-16 units; slice an encoded copy so they stay exact
+        self._utf16 = corpus["text"].encode('utf-16-le')
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def text(self, index):
+        offsets = self.corpus["text_offset"]
+        return self._utf16[offsets[index] * 2:offsets[index + 1] * 2].decode('utf-16-le')
+
+    def verse_index(self, surah, ayah):
+        if not 1 <= ayah <= SURAH_AYAH_COUNTS[surah - 1]:
+            raise KeyError(f"{surah}:{ayah}")
+        return self.corpus["surah_verse_start"][surah - 1] + ayah - 1
+
+    def verse(self, surah, ayah):
+        return self.text(self.verse_index(surah, ayah))
+
+    def page_verses(self, page):
+        """[(surah, ayah, text)] on a page"""
+        starts = self.corpus["page_verse_start"]
+        return [(self.corpus["surah"][i], self.corpus["ayah"][i], self.text(i))
+                for i in range(starts[page - 1], starts[page])]
+
+    def surah_pages(self, surah):
+        first, last = self.corpus["surah_page_range"][surah - 1]
+        return list(range(first, last + 1))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the verse-level corpus from quran_text.json")
+    parser.add_argument("--input", default="assets/quran/quran_text.json")
+    parser.add_argument("--output", default="assets/quran/quran_corpus.json")
+    args = parser.parse_args()
+
+    with open(args.input, encoding="utf-8") as f:
+        quran_text = json.load(f)
+    corpus = build_corpus(verses_from_page_text(quran_text))
+    size = write_corpus(corpus, args.output)
+    print(f"[OK] {args.output}: {corpus['verse_count']} verses, {size / 1024:.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
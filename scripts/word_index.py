@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Inverted word index over the normalized verse text
+
+quran_word_index.json maps every distinct word of the `search` form
+(arabic_normalize.search_form) to the verses it occurs in:
+    words           sorted vocabulary (code point order, the same order as
+                    Dart's String.compareTo), found by binary search
+    posting_start   len(words) + 1 offsets into `postings`; word i owns
+                    postings[posting_start[i]:posting_start[i + 1]]
+    postings        flat (page, verse) pairs, verse = index into
+                    quran_corpus.json, sorted by verse and delta-encoded:
+                    each pair stores the difference to the previous pair of
+                    the same word (the first pair is absolute)
+
+A lookup is one binary search plus decoding a single posting list.
+
+Usage:
+    python scripts/word_index.py                        # build from assets/quran/quran_text.json
+    python scripts/word_index.py --query "الحمد لله"     # verses containing every query word
+"""
+
+import argparse
+import json
+from bisect import bisect_left
+from pathlib import Path
+
+from arabic_normalize import search_form
+from asset_manifest import write_if_changed
+
+WORD_INDEX_VERSION = 1
+
+
+def build_word_index(search_texts, verse_pages):
+    """Index dict from per-verse search-form texts and the page of each verse"""
+    postings = {}
+    for verse, text in enumerate(search_texts):
+        for word in set(text.split()):
+            postings.setdefault(word, []).append(verse)
+
+    words = sorted(postings)
+    posting_start = [0]
+    flat = []
+    for word in words:
+        previous_page = previous_verse = 0
+        for verse in sorted(postings[word]):
+            page = verse_pages[verse]
+            flat += [page - previous_page, verse - previous_verse]
+            previous_page, previous_verse = page, verse
+        posting_start.append(len(flat) // 2)
+
+    return {
+        "version": WORD_INDEX_VERSION,
+        "word_count": len(words),
+        "posting_count": posting_start[-1],
+        "words": words,
+        "posting_start": posting_start,
+        "postings": flat,
+    }
+
+
+def write_word_index(index, path):
+    path = Path(path)
+    data = json.dumps(index, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    write_if_changed(path, data)
+    return len(data)
+
+
+class WordIndex:
+    """Word lookups over an index dict (the same steps a client would take)"""
+
+    def __init__(self, index):
+        self.index = index
+        self.words = index["words"]
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def _word_id(self, word):
+        position = bisect_left(self.words, word)
+        if position < len(self.words) and self.words[position] == word:
+            return position
+        return None
+
+    def _decode(self, word_id):
+        start, end = self.index["posting_start"][word_id], self.index["posting_start"][word_id + 1]
+        postings = self.index["postings"]
+        page = verse = 0
+        result = []
+        for offset in range(start * 2, end * 2, 2):
+            page += postings[offset]
+            verse += postings[offset + 1]
+            result.append((page, verse))
+        return result
+
+    def lookup(self, word):
+        """[(page, verse)] for one word (normalized here, so any spelling works)"""
+        word_id = self._word_id(search_form(word))
+        return self._decode(word_id) if word_id is not None else []
+
+    def prefix(self, prefix, limit=20):
+        """Indexed words starting with `prefix` (for autocomplete)"""
+        prefix = search_form(prefix)
+        start = bisect_left(self.words, prefix)
+        matches = []
+        for word in self.words[start:start + limit]:
+            if not word.startswith(prefix):
+                break
+            matches.append(word)
+        return matches
+
+    def search(self, query):
+        """[(page, verse)] of the verses that contain every word of the query"""
+        words = search_form(query).split()
+        if not words:
+            return []
+        postings = sorted((self.lookup(word) for word in words), key=len)
+        verses = {verse for _, verse in postings[0]}
+        for other in postings[1:]:
+            verses &= {verse for _, verse in other}
+        return [posting for posting in postings[0] if posting[1] in verses]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the inverted word index from quran_text.json")
+    parser.add_argument("--input", default="assets/quran/quran_text.json")
+    parser.add_argument("--output", default="assets/quran/quran_word_index.json")
+    parser.add_argument("--query", help="search the index at --output instead of building it")
+    args = parser.parse_args()
+
+    if args.query:
+        from verse_corpus import VerseCorpus
+
+        index = WordIndex.load(args.output)
+        corpus = VerseCorpus.load(Path(args.output).with_name("quran_corpus.json"))
+        results = index.search(args.query)
+        print(f"{len(results)} verses")
+        for page, verse in results[:20]:
+            print(f"  {corpus.corpus['surah'][verse]}:{corpus.corpus['ayah'][verse]} (page {page})  "
+                  f"{corpus.text(verse)}")
+        return
+
+    from verse_corpus import verses_from_page_text
+
+    with open(args.input, encoding="utf-8") as f:
+        quran_text = json.load(f)
+    verses = list(verses_from_page_text(quran_text))
+    index = build_word_index([search_form(text) for _, _, _, text in verses],
+                             [page for _, _, page, _ in verses])
+    size = write_word_index(index, args.output)
+    print(f"[OK] {args.output}: {index['word_count']} words, {index['posting_count']} postings, "
+          f"{size / 1024:.1f} KB")
+
+
+if __name__ == "__main__":
+    main()